@@ -1,6 +1,45 @@
+from ._apply import Applier
+from ._bulk import BulkOperation, BulkResult
+from ._coalescer import RequestCoalescer
+from ._controller import Controller
+from ._leader_election import LeaderElector
+from ._informer import SharedInformer, SharedInformerFactory, Subscription
+from ._list_stream import ListStream
+from ._pagination import ListIterator
+from ._reflector import Reflector
+from ._resilient_watch import ResilientWatch
+from ._store import (
+    IndexFunc,
+    Store,
+    index_by_label,
+    index_by_namespace,
+    index_by_owner_uid,
+    object_key,
+)
+from ._workqueue import WorkQueue
 from .api import Api, create_api
 
 __all__ = [
     "Api",
+    "Applier",
+    "BulkOperation",
+    "BulkResult",
+    "Controller",
+    "IndexFunc",
+    "LeaderElector",
+    "ListIterator",
+    "ListStream",
+    "Reflector",
+    "RequestCoalescer",
+    "ResilientWatch",
+    "SharedInformer",
+    "SharedInformerFactory",
+    "Store",
+    "Subscription",
+    "WorkQueue",
     "create_api",
+    "index_by_label",
+    "index_by_namespace",
+    "index_by_owner_uid",
+    "object_key",
 ]
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, ClassVar, Generic
+
+import anyio
+
+from kubex.core.params import FieldValidation
+from kubex.core.patch import Patch
+from kubex_core.models.typing import ResourceType
+
+from ._protocol import (
+    ApiNamespaceTypes,
+    ApiRequestTimeoutTypes,
+    ensure_required_namespace,
+)
+from .api import Api
+
+DEFAULT_APPLY_CACHE_SIZE = 4096
+
+_STRIPPED_METADATA = ("managedFields", "resourceVersion")
+
+
+class _AppliedPayload(Patch):
+    """A server-side apply body that is already serialized."""
+
+    content_type_header: ClassVar[str] = "application/apply-patch+yaml"
+
+    def __init__(self, payload: bytes) -> None:
+        self.payload = payload
+
+    def serialize(
+        self,
+        *,
+        by_alias: bool = True,
+        exclude_unset: bool = True,
+        exclude_none: bool = True,
+    ) -> bytes:
+        return self.payload
+
+
+class Applier(Generic[ResourceType]):
+    """Server-side apply that skips the request when nothing changed.
+
+    :meth:`apply` sends the desired state of an object as a server-side apply
+    patch. Fields the API server owns are removed from the body first:
+    ``metadata.managedFields``, ``metadata.resourceVersion`` and ``status``,
+    so an object read from the cluster can be applied as is. ``apiVersion``
+    and ``kind`` are filled in from the resource of the ``Api``.
+
+    A digest of the last body applied to every object is kept, and applying
+    the same body again returns ``None`` without sending a request. Reconcile
+    loops that apply the same desired state over and over therefore only
+    write to the API server when it changes.
+
+    The cache does not see changes made by others. Objects deleted or edited
+    behind the applier's back are only restored once their desired state
+    changes, :meth:`forget` is called for them, or their entry is older than
+    ``max_age``::
+
+        applier = Applier(Api(ConfigMap, client=client), "my-controller")
+        await applier.apply(desired)  # PATCH
+        await applier.apply(desired)  # None, no request
+
+    Args:
+        api: The ``Api`` of the applied resource.
+        field_manager: The name of the manager owning the applied fields.
+        force: Take the ownership of fields conflicting with other managers.
+        field_validation: How the API server handles unknown or duplicate fields.
+        max_age: Send the request again after this many seconds even if the
+            body did not change, so drift is corrected. ``None`` keeps the
+            digests until they are evicted or forgotten.
+        cache_size: The maximum number of objects whose digest is kept; the
+            least recently applied ones are evicted first.
+    """
+
+    def __init__(
+        self,
+        api: Api[ResourceType],
+        field_manager: str,
+        *,
+        force: bool = False,
+        field_validation: FieldValidation | None = None,
+        max_age: float | None = None,
+        cache_size: int = DEFAULT_APPLY_CACHE_SIZE,
+    ) -> None:
+        if not field_manager:
+            raise ValueError("Applier field_manager must not be empty")
+        if max_age is not None and max_age <= 0:
+            raise ValueError("Applier max_age must be positive")
+        if cache_size < 1:
+            raise ValueError("Applier cache_size must be at least 1")
+        self._api = api
+        self._field_manager = field_manager
+        self._force = force
+        self._field_validation = field_validation
+        self._max_age = max_age
+        self._cache_size = cache_size
+        self._applied: OrderedDict[tuple[str | None, str], tuple[bytes, float]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        """The number of objects whose last applied digest is kept."""
+        return len(self._applied)
+
+    async def apply(
+        self,
+        obj: ResourceType,
+        *,
+        namespace: ApiNamespaceTypes = Ellipsis,
+        request_timeout: ApiRequestTimeoutTypes = Ellipsis,
+    ) -> ResourceType | None:
+        """Apply the desired state *obj*, unless it was already applied.
+
+        The object is applied in its own namespace unless *namespace* is given.
+
+        Returns:
+            The object returned by the API server, or ``None`` if the request
+            was skipped because the same state was applied last time.
+        """
+        name = obj.metadata.name
+        if not name:
+            raise ValueError("Applied objects must have a name")
+        namespace = self._api._object_namespace(obj, namespace)
+        key = (self._namespace(namespace), name)
+        payload = self.payload(obj)
+        digest = hashlib.sha256(payload).digest()
+        now = anyio.current_time()
+        cached = self._applied.get(key)
+        if (
+            cached is not None
+            and cached[0] == digest
+            and (self._max_age is None or now - cached[1] < self._max_age)
+        ):
+            self._applied.move_to_end(key)
+            return None
+        # A failed or interrupted apply leaves the object in an unknown state.
+        self._applied.pop(key, None)
+        result = await self._api.patch(
+            name,
+            _AppliedPayload(payload),
+            namespace=namespace,
+            field_manager=self._field_manager,
+            force=self._force,
+            field_validation=self._field_validation,
+            request_timeout=request_timeout,
+        )
+        self._applied[key] = (digest, now)
+        if len(self._applied) > self._cache_size:
+            self._applied.popitem(last=False)
+        return result
+
+    def forget(self, name: str, *, namespace: ApiNamespaceTypes = Ellipsis) -> None:
+        """Drop the digest of an object so its next :meth:`apply` is sent."""
+        self._applied.pop((self._namespace(namespace), name), None)
+
+    def clear(self) -> None:
+        """Drop every digest so the next :meth:`apply` of every object is sent."""
+        self._applied.clear()
+
+    def _namespace(self, namespace: ApiNamespaceTypes) -> str | None:
+        return ensure_required_namespace(
+            namespace,
+            self._api._namespace,
+            self._api._resource.__RESOURCE_CONFIG__.scope,
+        )
+
+    def payload(self, obj: ResourceType) -> bytes:
+        """Return the JSON body :meth:`apply` sends for *obj*."""
+        data: dict[str, Any] = obj.model_dump(
+            mode="json", by_alias=True, exclude_unset=True, exclude_none=True
+        )
+        config = self._api._resource.__RESOURCE_CONFIG__
+        data.setdefault("apiVersion", config.api_version)
+        data.setdefault("kind", config.kind)
+        data.pop("status", None)
+        metadata = data.get("metadata")
+        if metadata:
+            for field in _STRIPPED_METADATA:
+                metadata.pop(field, None)
+        return json.dumps(data, separators=(",", ":"), sort_keys=True).encode()
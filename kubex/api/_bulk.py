@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+from contextlib import AsyncExitStack
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    TypeVar,
+)
+
+import anyio
+from anyio.abc import TaskGroup
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+DEFAULT_BULK_CONCURRENCY = 10
+
+ItemType = TypeVar("ItemType")
+ResultType = TypeVar("ResultType")
+
+BulkItems = Iterable[ItemType] | AsyncIterable[ItemType]
+"""The items of a bulk operation, consumed lazily."""
+
+
+class BulkResult(Generic[ItemType, ResultType]):
+    """The outcome of one item of a bulk operation.
+
+    Attributes:
+        item: The input item: the object, the ``(name, patch)`` pair or the name.
+        result: The response of the API server, ``None`` if the call failed.
+        error: The exception raised by the call, ``None`` if it succeeded.
+    """
+
+    __slots__ = ("item", "result", "error")
+
+    def __init__(
+        self,
+        item: ItemType,
+        result: ResultType | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        self.item = item
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call succeeded."""
+        return self.error is None
+
+    def unwrap(self) -> ResultType:
+        """Return the result, or raise the error of a failed call."""
+        if self.error is not None:
+            raise self.error
+        return self.result  # type: ignore[return-value]
+
+    def __repr__(self) -> str:
+        outcome = f"error={self.error!r}" if self.error else f"result={self.result!r}"
+        return f"BulkResult(item={self.item!r}, {outcome})"
+
+
+class BulkOperation(Generic[ItemType, ResultType]):
+    """Call *operation* for every item, at most *concurrency* at a time.
+
+    The calls run in a task group owned by the caller, so the operation has to
+    be entered with ``async with``; iterating over it yields a
+    :class:`BulkResult` per item in completion order. Leaving the block early
+    cancels the calls still running::
+
+        async with api.create_many(config_maps) as results:
+            async for result in results:
+                ...
+
+    Items are read from *items* only when a slot is free and a result is held
+    back until the caller asks for it, so memory stays bounded by
+    *concurrency* however many items there are.
+
+    With *stop_on_error* no item is started after the first failed call; the
+    calls already running are completed and reported, then the iteration ends.
+    Errors raised while reading *items* are propagated to the caller.
+    """
+
+    def __init__(
+        self,
+        items: BulkItems[ItemType],
+        operation: Callable[[ItemType], Awaitable[ResultType]],
+        *,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        stop_on_error: bool = False,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("Bulk concurrency must be at least 1")
+        self._items = items
+        self._operation = operation
+        self._stop_on_error = stop_on_error
+        self._limiter = anyio.Semaphore(concurrency)
+        self._failed = False
+        self._exit_stack: AsyncExitStack | None = None
+        self._receive_stream: (
+            MemoryObjectReceiveStream[BulkResult[ItemType, ResultType]] | None
+        ) = None
+        # Errors of the input iterable are handed over to the caller's task
+        # instead of escaping the task group wrapped in an ``ExceptionGroup``.
+        self._errors: list[Exception] = []
+
+    async def __aenter__(self) -> Self:
+        if self._receive_stream is not None:
+            raise RuntimeError("A bulk operation can only be entered once")
+        send_stream: MemoryObjectSendStream[BulkResult[ItemType, ResultType]]
+        receive_stream: MemoryObjectReceiveStream[BulkResult[ItemType, ResultType]]
+        send_stream, receive_stream = anyio.create_memory_object_stream(0)
+        stack = AsyncExitStack()
+        await stack.__aenter__()
+        try:
+            task_group = await stack.enter_async_context(anyio.create_task_group())
+            stack.callback(task_group.cancel_scope.cancel)
+            stack.push_async_callback(receive_stream.aclose)
+            task_group.start_soon(self._produce, task_group, send_stream)
+        except BaseException:
+            await stack.aclose()
+            raise
+        self._exit_stack = stack
+        self._receive_stream = receive_stream
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        stack = self._exit_stack
+        self._exit_stack = None
+        if stack is not None:
+            # The tasks never fail, so the task group is closed without the
+            # error of the block, which would come back wrapped in an
+            # ``ExceptionGroup``; it propagates unchanged once this returns.
+            await stack.aclose()
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> BulkResult[ItemType, ResultType]:
+        if self._receive_stream is None:
+            raise RuntimeError(
+                "Enter a bulk operation with 'async with' before iterating over it"
+            )
+        try:
+            return await self._receive_stream.receive()
+        except (anyio.EndOfStream, anyio.ClosedResourceError):
+            if self._errors:
+                raise self._errors.pop()
+            raise StopAsyncIteration
+
+    async def _produce(
+        self,
+        task_group: TaskGroup,
+        send_stream: MemoryObjectSendStream[BulkResult[ItemType, ResultType]],
+    ) -> None:
+        async with send_stream:
+            try:
+                if isinstance(self._items, AsyncIterable):
+                    async for item in self._items:
+                        if not await self._start(task_group, send_stream, item):
+                            return
+                else:
+                    for item in self._items:
+                        if not await self._start(task_group, send_stream, item):
+                            return
+            except Exception as exc:
+                self._errors.append(exc)
+
+    async def _start(
+        self,
+        task_group: TaskGroup,
+        send_stream: MemoryObjectSendStream[BulkResult[ItemType, ResultType]],
+        item: ItemType,
+    ) -> bool:
+        await self._limiter.acquire()
+        if self._stop_on_error and self._failed:
+            self._limiter.release()
+            return False
+        task_group.start_soon(self._call, item, send_stream.clone())
+        return True
+
+    async def _call(
+        self,
+        item: ItemType,
+        send_stream: MemoryObjectSendStream[BulkResult[ItemType, ResultType]],
+    ) -> None:
+        async with send_stream:
+            try:
+                result: BulkResult[ItemType, ResultType] = BulkResult(
+                    item, await self._operation(item)
+                )
+            except Exception as exc:
+                self._failed = True
+                result = BulkResult(item, error=exc)
+            try:
+                await send_stream.send(result)
+            except anyio.BrokenResourceError:
+                # The caller left the block before receiving every result.
+                pass
+            finally:
+                self._limiter.release()
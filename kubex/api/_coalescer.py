@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+import anyio
+
+from kubex.core.request import Request
+from kubex.core.request_builder.constants import ACCEPT_HEADER
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "cancelled")
+
+    def __init__(self) -> None:
+        self.done = anyio.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.cancelled = False
+
+
+class RequestCoalescer:
+    """Shares one in-flight read between identical concurrent callers.
+
+    While a ``get`` is in flight, every identical ``get`` (same client, HTTP
+    method, URL, query parameters, ``Accept`` header and result model) waits
+    for it instead of sending a request of its own, and receives the same
+    validated object or the same exception. Nothing is cached: a call made
+    after the in-flight request completed sends a new one.
+
+    Waiters share the returned object; treat it as read-only.
+
+    Pass one coalescer to every :class:`~kubex.api.Api` whose reads should be
+    coalesced; ``api.metadata.get`` uses the coalescer of its ``Api``. A
+    coalescer must only be used from a single event loop.
+
+    Example::
+
+        coalescer = RequestCoalescer()
+        deployments = Api(Deployment, client, coalescer=coalescer)
+        # 50 concurrent reconciles of the same owner send a single GET.
+        owner = await deployments.get("web", namespace="default")
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Call] = {}
+
+    def __len__(self) -> int:
+        """The number of requests currently in flight."""
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Return the result of ``fn()``, shared with the callers of the same *key*.
+
+        The first caller of a *key* runs *fn*; callers arriving while it runs
+        wait for its outcome. If the first caller is cancelled, one of the
+        waiters runs *fn* again in its place.
+        """
+        while True:
+            call = self._calls.get(key)
+            if call is None:
+                return await self._run(key, fn)
+            await call.done.wait()
+            if call.cancelled:
+                continue
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[no-any-return]
+
+    async def _run(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        call = self._calls[key] = _Call()
+        try:
+            call.result = result = await fn()
+        except anyio.get_cancelled_exc_class():
+            call.cancelled = True
+            raise
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            del self._calls[key]
+            call.done.set()
+        return result
+
+
+def request_key(client: Any, request: Request, *variant: Hashable) -> Hashable:
+    """The coalescing key of *request* sent by *client*.
+
+    *variant* distinguishes calls that send the same request but build
+    different results from it, e.g. different result models.
+
+    Raises:
+        ValueError: If *request* is not a ``GET``. Writes are never coalesced:
+            the key does not include the request body.
+    """
+    if request.method.upper() != "GET":
+        raise ValueError(f"Only GET requests can be coalesced, not {request.method}")
+    headers = request.headers or {}
+    accept = next(
+        (value for name, value in headers.items() if name.lower() == ACCEPT_HEADER),
+        None,
+    )
+    return (
+        client,
+        request.method.upper(),
+        request.url,
+        tuple(sorted((request.query_params or {}).items())),
+        tuple(request.query_param_pairs or ()),
+        accept,
+        variant,
+    )
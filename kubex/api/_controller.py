@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import logging
+import random
+from typing import Any, Awaitable, Callable, Generic, TypeVar
+
+import anyio
+
+from kubex.core.backoff import Backoff
+from kubex_core.models.base_entity import BaseEntity
+from kubex_core.models.resource_config import (
+    Scope,
+    get_version_and_froup_from_api_version,
+)
+from kubex_core.models.typing import ResourceType
+from kubex_core.models.watch_event import WatchEvent
+
+from ._protocol import ApiRequestTimeoutTypes
+from ._reflector import Reflector
+from ._store import Store, index_by_owner_uid, object_key
+from ._workqueue import WorkQueue
+from .api import Api
+
+logger = logging.getLogger("kubex.api.controller")
+
+DEFAULT_REQUEUE_JITTER = 0.1
+
+OwnedType = TypeVar("OwnedType", bound=BaseEntity)
+
+Reconciler = Callable[[str], Awaitable[float | None]]
+"""Reconcile the object with the given ``namespace/name`` key.
+
+Return a delay in seconds to reconcile the object again later, or ``None``.
+"""
+
+
+class Controller(Generic[ResourceType]):
+    """Run a reconcile loop for a primary resource and the objects it owns.
+
+    The controller caches the primary resource and every owned (secondary)
+    resource with a :class:`Reflector` and queues the key of each changed
+    primary object in a :class:`WorkQueue`. Changes of a secondary object
+    queue the key of its owner, found in ``metadata.ownerReferences``, so
+    reconciling a Deployment-like resource reacts to its Pods or ReplicaSets.
+
+    Keys are reconciled by a fixed number of workers once every cache has
+    synced. The queue guarantees that a key is never reconciled twice at the
+    same time and collapses the events received meanwhile into one more
+    reconcile. ``reconcile`` may raise to be retried with backoff, or return a
+    delay to be reconciled again later, for example to poll an external
+    system; the delay is stretched by a random jitter so that objects created
+    together do not stay in lockstep.
+
+    Example::
+
+        async def reconcile(key: str) -> float | None:
+            deployment = controller.store.get(key)
+            if deployment is None:
+                return None  # deleted
+            owned = pods.by_index("owner", deployment.metadata.uid)
+            ...
+
+        controller = Controller(Api(Deployment, client=client), reconcile, workers=4)
+        pods = controller.owns(Api(Pod, client=client))
+        await controller.run()
+
+    Args:
+        api: The ``Api`` of the primary resource; its namespace is watched.
+        reconcile: The coroutine reconciling one key.
+        workers: The number of keys reconciled concurrently.
+        queue: The queue of keys. Pass a :class:`WorkQueue` to tune its
+            backoff and rate limit.
+        label_selector: Restrict the primary objects by their labels.
+        field_selector: Restrict the primary objects by their fields.
+        timeout_seconds: Server-side timeout for each watch request.
+        request_timeout: HTTP-level timeout override for the list and watch
+            requests.
+        watch_list: Get the initial state of every cache with a watch list
+            instead of a list request (see :class:`Reflector`).
+        backoff: The delays before rewatches and relists of every cache.
+            Defaults to ``Backoff()``.
+        requeue_jitter: The maximum fraction added at random to the delays
+            returned by ``reconcile``.
+    """
+
+    def __init__(
+        self,
+        api: Api[ResourceType],
+        reconcile: Reconciler,
+        *,
+        workers: int = 1,
+        queue: WorkQueue[str] | None = None,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+        timeout_seconds: int | None = None,
+        request_timeout: ApiRequestTimeoutTypes = Ellipsis,
+        watch_list: bool = False,
+        backoff: Backoff | None = None,
+        requeue_jitter: float = DEFAULT_REQUEUE_JITTER,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("Controller workers must be at least 1")
+        if requeue_jitter < 0:
+            raise ValueError("Controller requeue_jitter must not be negative")
+        self._reconcile = reconcile
+        self._workers = workers
+        self._queue: WorkQueue[str] = queue if queue is not None else WorkQueue()
+        self._requeue_jitter = requeue_jitter
+        self._timeout_seconds = timeout_seconds
+        self._request_timeout = request_timeout
+        self._watch_list = watch_list
+        self._backoff = backoff
+        config = api._resource.__RESOURCE_CONFIG__
+        self._kind = config.kind
+        self._group = config.group
+        self._namespaced = config.scope == Scope.NAMESPACE
+        self._primary = Reflector(
+            api,
+            label_selector=label_selector,
+            field_selector=field_selector,
+            timeout_seconds=timeout_seconds,
+            request_timeout=request_timeout,
+            on_event=self._enqueue_primary,
+            watch_list=watch_list,
+            backoff=backoff,
+        )
+        self._reflectors: list[Reflector[Any]] = [self._primary]
+
+    @property
+    def store(self) -> Store[ResourceType]:
+        """The cache of the primary resource."""
+        return self._primary.store
+
+    @property
+    def queue(self) -> WorkQueue[str]:
+        """The queue of keys waiting to be reconciled."""
+        return self._queue
+
+    @property
+    def has_synced(self) -> bool:
+        """Whether every cache has been filled."""
+        return all(reflector.has_synced for reflector in self._reflectors)
+
+    def owns(
+        self,
+        api: Api[OwnedType],
+        *,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+        controller_only: bool = True,
+    ) -> Store[OwnedType]:
+        """Also reconcile the owner of every changed object of *api*.
+
+        Must be called before :meth:`run`.
+
+        Args:
+            api: The ``Api`` of the owned resource; its namespace is watched.
+            label_selector: Restrict the owned objects by their labels.
+            field_selector: Restrict the owned objects by their fields.
+            controller_only: Only follow the owner reference marked as the
+                managing ``controller``, like the built-in controllers do.
+
+        Returns:
+            The cache of the owned objects, indexed by owner UID under the
+            ``"owner"`` index.
+        """
+
+        async def enqueue_owner(event: WatchEvent[OwnedType]) -> None:
+            metadata = event.object.metadata
+            for ref in metadata.owner_references or ():
+                if controller_only and not ref.controller:
+                    continue
+                _, group = get_version_and_froup_from_api_version(ref.api_version)
+                if ref.kind != self._kind or group != self._group:
+                    continue
+                # Namespaced owners always live in the namespace of their dependents.
+                if self._namespaced and metadata.namespace:
+                    self._queue.add(f"{metadata.namespace}/{ref.name}")
+                else:
+                    self._queue.add(ref.name)
+
+        store: Store[OwnedType] = Store(indexers={"owner": index_by_owner_uid})
+        self._reflectors.append(
+            Reflector(
+                api,
+                store=store,
+                label_selector=label_selector,
+                field_selector=field_selector,
+                timeout_seconds=self._timeout_seconds,
+                request_timeout=self._request_timeout,
+                on_event=enqueue_owner,
+                watch_list=self._watch_list,
+                backoff=self._backoff,
+            )
+        )
+        return store
+
+    async def run(self) -> None:
+        """Watch the resources and reconcile keys until cancelled.
+
+        Returns when the queue is shut down. The watches retry transient
+        errors (see :class:`Reflector`); any other error is propagated to the
+        caller.
+        """
+        async with anyio.create_task_group() as task_group:
+            for reflector in self._reflectors:
+                task_group.start_soon(reflector.run)
+            for reflector in self._reflectors:
+                await reflector.wait_for_sync()
+            logger.debug("Caches of %s synced, starting workers", self._kind)
+            await self._queue.run(self._reconcile_key, workers=self._workers)
+            task_group.cancel_scope.cancel()
+
+    async def _enqueue_primary(self, event: WatchEvent[ResourceType]) -> None:
+        self._queue.add(object_key(event.object))
+
+    async def _reconcile_key(self, key: str) -> float | None:
+        requeue_after = await self._reconcile(key)
+        if requeue_after is None or requeue_after <= 0:
+            return requeue_after
+        return requeue_after * (1 + random.uniform(0, self._requeue_jitter))
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Generic, Iterable, Type
+
+import anyio
+from anyio.abc import TaskGroup
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+
+from kubex.client.client import BaseClient
+from kubex.core.backoff import Backoff
+from kubex.core.params import NamespaceTypes
+from kubex_core.models.typing import ResourceType
+from kubex_core.models.watch_event import EventType, WatchEvent
+
+from ._protocol import ApiRequestTimeoutTypes
+from ._reflector import Reflector
+from ._store import Store
+from .api import Api
+
+DEFAULT_SUBSCRIBER_BUFFER_SIZE = 100
+
+InformerKey = tuple[type, NamespaceTypes, str | None, str | None]
+
+
+class Subscription(Generic[ResourceType]):
+    """Async iterator over the events delivered to one informer subscriber.
+
+    The objects currently in the informer cache are replayed first as
+    ``ADDED`` events, followed by live changes.
+    """
+
+    def __init__(
+        self,
+        replay: Iterable[ResourceType],
+        receive_stream: MemoryObjectReceiveStream[WatchEvent[ResourceType]],
+    ) -> None:
+        self._replay = deque(replay)
+        self._receive_stream = receive_stream
+
+    def __aiter__(self) -> Subscription[ResourceType]:
+        return self
+
+    async def __anext__(self) -> WatchEvent[ResourceType]:
+        if self._replay:
+            return WatchEvent.from_object(EventType.ADDED, self._replay.popleft())
+        try:
+            return await self._receive_stream.receive()
+        except (anyio.EndOfStream, anyio.ClosedResourceError):
+            raise StopAsyncIteration from None
+
+
+class SharedInformer(Generic[ResourceType]):
+    """A single list-then-watch loop whose events are fanned out to many subscribers.
+
+    Every subscriber gets its own bounded buffer. Delivery applies
+    backpressure: when a subscriber's buffer is full the informer waits for it
+    to catch up before delivering the next event to anyone, so no event is
+    ever dropped. Size ``max_buffer_size`` for the burstiest consumer.
+
+    Subscribers share the validated objects; treat them as read-only.
+
+    Instances are normally obtained from :class:`SharedInformerFactory`.
+    """
+
+    def __init__(
+        self,
+        api: Api[ResourceType],
+        *,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+        timeout_seconds: int | None = None,
+        request_timeout: ApiRequestTimeoutTypes = Ellipsis,
+        watch_list: bool = False,
+        backoff: Backoff | None = None,
+    ) -> None:
+        self._subscribers: list[MemoryObjectSendStream[WatchEvent[ResourceType]]] = []
+        self._stopped = False
+        self._reflector = Reflector(
+            api,
+            label_selector=label_selector,
+            field_selector=field_selector,
+            timeout_seconds=timeout_seconds,
+            request_timeout=request_timeout,
+            on_event=self._dispatch,
+            watch_list=watch_list,
+            backoff=backoff,
+        )
+
+    @property
+    def store(self) -> Store[ResourceType]:
+        """The cache shared by all subscribers."""
+        return self._reflector.store
+
+    @property
+    def reflector(self) -> Reflector[ResourceType]:
+        """The reflector feeding this informer."""
+        return self._reflector
+
+    @property
+    def has_synced(self) -> bool:
+        """Whether the initial list has been applied to the cache."""
+        return self._reflector.has_synced
+
+    async def wait_for_sync(self) -> None:
+        """Wait until the initial list has been applied to the cache."""
+        await self._reflector.wait_for_sync()
+
+    async def run(self) -> None:
+        """Run the underlying reflector until cancelled.
+
+        Subscriptions end when it returns; subscribing afterwards replays the
+        cache and ends right away.
+        """
+        self._stopped = False
+        try:
+            await self._reflector.run()
+        finally:
+            self._stopped = True
+            for send_stream in self._subscribers:
+                send_stream.close()
+            self._subscribers.clear()
+
+    @asynccontextmanager
+    async def subscribe(
+        self, *, max_buffer_size: int = DEFAULT_SUBSCRIBER_BUFFER_SIZE
+    ) -> AsyncIterator[Subscription[ResourceType]]:
+        """Subscribe to the events of this informer.
+
+        Example::
+
+            async with informer.subscribe() as events:
+                async for event in events:
+                    print(event.type, event.object.metadata.name)
+
+        Args:
+            max_buffer_size: The number of events buffered for this subscriber
+                before delivery to all subscribers is paused.
+        """
+        send_stream: MemoryObjectSendStream[WatchEvent[ResourceType]]
+        receive_stream: MemoryObjectReceiveStream[WatchEvent[ResourceType]]
+        send_stream, receive_stream = anyio.create_memory_object_stream(max_buffer_size)
+        # The reflector holds this lock while it applies a change and
+        # dispatches it, so every change is either part of the replay or
+        # delivered to the stream, never both.
+        async with self._reflector._lock:
+            replay = self.store.list()
+            if self._stopped:
+                send_stream.close()
+            else:
+                self._subscribers.append(send_stream)
+        try:
+            with receive_stream:
+                yield Subscription(replay, receive_stream)
+        finally:
+            if send_stream in self._subscribers:
+                self._subscribers.remove(send_stream)
+            send_stream.close()
+
+    async def _dispatch(self, event: WatchEvent[ResourceType]) -> None:
+        for send_stream in list(self._subscribers):
+            try:
+                await send_stream.send(event)
+            except (anyio.BrokenResourceError, anyio.ClosedResourceError):
+                if send_stream in self._subscribers:
+                    self._subscribers.remove(send_stream)
+
+
+class SharedInformerFactory:
+    """Deduplicate watches across the whole process.
+
+    The factory hands out one :class:`SharedInformer` per resource type,
+    namespace, label selector and field selector, so any number of
+    components interested in the same objects share a single upstream watch
+    connection, a single cache and a single JSON decode per event.
+
+    Example::
+
+        factory = SharedInformerFactory(client)
+        pods = factory.informer(Pod, namespace="default")
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(factory.run)
+            await pods.wait_for_sync()
+            async with pods.subscribe() as events:
+                async for event in events:
+                    ...
+
+    Informers requested after :meth:`run` was started are started immediately.
+
+    Args:
+        client: The client used by every informer.
+        timeout_seconds: Server-side timeout for each watch request.
+        request_timeout: HTTP-level timeout override for the list and watch
+            requests.
+        watch_list: Get the initial state of every informer with a watch list
+            instead of a list request (see :class:`Reflector`).
+        backoff: The delays before rewatches and relists of every informer.
+            Defaults to ``Backoff()``.
+    """
+
+    def __init__(
+        self,
+        client: BaseClient,
+        *,
+        timeout_seconds: int | None = None,
+        request_timeout: ApiRequestTimeoutTypes = Ellipsis,
+        watch_list: bool = False,
+        backoff: Backoff | None = None,
+    ) -> None:
+        self._client = client
+        self._timeout_seconds = timeout_seconds
+        self._request_timeout = request_timeout
+        self._watch_list = watch_list
+        self._backoff = backoff
+        self._informers: dict[InformerKey, SharedInformer[Any]] = {}
+        self._task_group: TaskGroup | None = None
+
+    def informer(
+        self,
+        resource_type: Type[ResourceType],
+        *,
+        namespace: NamespaceTypes = None,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+    ) -> SharedInformer[ResourceType]:
+        """Return the shared informer for the given resource and selectors.
+
+        Args:
+            resource_type: The resource type to watch.
+            namespace: The namespace to watch; ``None`` watches all namespaces.
+            label_selector: Restrict the watched objects by their labels.
+            field_selector: Restrict the watched objects by their fields.
+        """
+        key: InformerKey = (resource_type, namespace, label_selector, field_selector)
+        informer = self._informers.get(key)
+        if informer is None:
+            informer = SharedInformer(
+                Api(resource_type, client=self._client, namespace=namespace),
+                label_selector=label_selector,
+                field_selector=field_selector,
+                timeout_seconds=self._timeout_seconds,
+                request_timeout=self._request_timeout,
+                watch_list=self._watch_list,
+                backoff=self._backoff,
+            )
+            self._informers[key] = informer
+            if self._task_group is not None:
+                self._task_group.start_soon(informer.run)
+        return informer
+
+    async def wait_for_sync(self) -> None:
+        """Wait until every informer created so far has synced."""
+        for informer in list(self._informers.values()):
+            await informer.wait_for_sync()
+
+    async def run(self) -> None:
+        """Run all informers until cancelled."""
+        if self._task_group is not None:
+            raise RuntimeError("SharedInformerFactory is already running")
+        try:
+            async with anyio.create_task_group() as task_group:
+                self._task_group = task_group
+                for informer in self._informers.values():
+                    task_group.start_soon(informer.run)
+                await anyio.sleep_forever()
+        finally:
+            self._task_group = None
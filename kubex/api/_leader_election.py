@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import datetime
+import logging
+import math
+import random
+from typing import Any, Awaitable, Callable, Coroutine, Generic
+
+import anyio
+
+from kubex.core.exceptions import Conflict, NotFound
+from kubex_core.models.typing import ResourceType
+
+from .api import Api
+
+logger = logging.getLogger("kubex.api.leaderelection")
+
+DEFAULT_LEASE_DURATION = 15.0
+DEFAULT_RENEW_DEADLINE = 10.0
+DEFAULT_RETRY_PERIOD = 2.0
+JITTER_FACTOR = 1.2
+
+
+class LeaderElector(Generic[ResourceType]):
+    """Elect a single leader among the replicas of a process with a ``Lease``.
+
+    Every candidate tries to become the holder of a
+    ``coordination.k8s.io/v1`` ``Lease``. The holder renews the lease every
+    ``retry_period``; the others take it over once it has not been renewed for
+    ``lease_duration``. Every write replaces the lease with the
+    ``resourceVersion`` it was read at, so of two candidates writing at the
+    same time one fails with ``409 Conflict`` and only one becomes the leader.
+
+    Expiry is measured with the local clock from the moment a candidate saw
+    the lease change, not from the ``renewTime`` written by the holder, so
+    clock skew between nodes does not shorten the lease.
+
+    The ``Lease`` model is taken from the ``Api``, so any generated version
+    works::
+
+        from kubex.k8s.v1_35.coordination.v1.lease import Lease
+
+        async def lead() -> None:
+            await controller.run()
+
+        elector = LeaderElector(
+            Api(Lease, client=client, namespace="operators"),
+            "my-operator",
+            identity=os.environ["POD_NAME"],
+            on_started_leading=lead,
+        )
+        await elector.run()
+
+    :meth:`run` returns when the leadership is lost, after
+    ``on_started_leading`` has been cancelled. Exit the process or call
+    :meth:`run` again to stand by for the next term.
+
+    Args:
+        api: The ``Api`` of the ``Lease`` resource, bound to its namespace.
+        name: The name of the lease.
+        identity: The unique identity of this candidate, such as its pod name.
+        on_started_leading: Called when the leadership is acquired; cancelled
+            when it is lost.
+        on_stopped_leading: Called after ``on_started_leading`` was cancelled.
+        lease_duration: How long, in seconds, other candidates wait after the
+            last renewal before taking over the lease.
+        renew_deadline: How long, in seconds, the leader retries to renew
+            the lease before giving up the leadership. Must be shorter than
+            ``lease_duration`` so the leader stops before another one starts.
+        retry_period: The interval, in seconds, between attempts to acquire
+            or renew the lease.
+        release_on_cancel: Give up the lease when :meth:`run` is cancelled,
+            so another candidate takes over without waiting for it to expire.
+            Disable it when leader-only work goes on after :meth:`run`.
+    """
+
+    def __init__(
+        self,
+        api: Api[ResourceType],
+        name: str,
+        identity: str,
+        *,
+        on_started_leading: Callable[[], Coroutine[Any, Any, None]],
+        on_stopped_leading: Callable[[], Awaitable[None]] | None = None,
+        lease_duration: float = DEFAULT_LEASE_DURATION,
+        renew_deadline: float = DEFAULT_RENEW_DEADLINE,
+        retry_period: float = DEFAULT_RETRY_PERIOD,
+        release_on_cancel: bool = True,
+    ) -> None:
+        if not identity:
+            raise ValueError("LeaderElector identity must not be empty")
+        if not 0 < retry_period * JITTER_FACTOR < renew_deadline < lease_duration:
+            raise ValueError(
+                "LeaderElector needs lease_duration > renew_deadline > "
+                f"{JITTER_FACTOR} * retry_period > 0"
+            )
+        self._api = api
+        self._name = name
+        self._identity = identity
+        self._on_started_leading = on_started_leading
+        self._on_stopped_leading = on_stopped_leading
+        self._lease_duration = lease_duration
+        self._renew_deadline = renew_deadline
+        self._retry_period = retry_period
+        self._release_on_cancel = release_on_cancel
+        self._lease: ResourceType | None = None
+        self._observed: tuple[Any, ...] | None = None
+        self._observed_at = -math.inf
+        self._is_leader = False
+
+    @property
+    def identity(self) -> str:
+        """The identity of this candidate."""
+        return self._identity
+
+    @property
+    def is_leader(self) -> bool:
+        """Whether this candidate currently holds the lease."""
+        return self._is_leader
+
+    @property
+    def leader(self) -> str | None:
+        """The identity of the last observed holder of the lease."""
+        return None if self._lease is None else _spec(self._lease).get("holderIdentity")
+
+    async def run(self) -> None:
+        """Wait for the leadership, then lead until it is lost."""
+        await self._acquire()
+        try:
+            async with anyio.create_task_group() as task_group:
+                task_group.start_soon(self._on_started_leading)
+                await self._renew()
+                task_group.cancel_scope.cancel()
+        finally:
+            with anyio.CancelScope(shield=True):
+                if self._is_leader and self._release_on_cancel:
+                    await self._release()
+                self._is_leader = False
+                logger.info("%s stopped leading %s", self._identity, self._name)
+                if self._on_stopped_leading is not None:
+                    await self._on_stopped_leading()
+
+    async def _acquire(self) -> None:
+        while not await self._try_acquire_or_renew():
+            await anyio.sleep(
+                self._retry_period * (1 + random.uniform(0, JITTER_FACTOR))
+            )
+        self._is_leader = True
+        logger.info("%s became the leader of %s", self._identity, self._name)
+
+    async def _renew(self) -> None:
+        """Renew the lease until a renewal fails for ``renew_deadline``."""
+        while True:
+            await anyio.sleep(self._retry_period)
+            with anyio.move_on_after(self._renew_deadline) as scope:
+                while not await self._try_acquire_or_renew():
+                    await anyio.sleep(self._retry_period)
+            if scope.cancelled_caught:
+                self._is_leader = False
+                logger.warning(
+                    "%s failed to renew the lease %s", self._identity, self._name
+                )
+                return
+
+    async def _try_acquire_or_renew(self) -> bool:
+        now = datetime.datetime.now(datetime.timezone.utc)
+        try:
+            lease = await self._api.get(self._name)
+        except NotFound:
+            return await self._create(now)
+        except Exception:
+            logger.warning("Failed to get the lease %s", self._name, exc_info=True)
+            return False
+        self._observe(lease)
+        spec = _spec(lease)
+        holder = spec.get("holderIdentity")
+        if (
+            holder
+            and holder != self._identity
+            and anyio.current_time()
+            < self._observed_at + spec.get("leaseDurationSeconds", 0)
+        ):
+            return False
+        if holder != self._identity:
+            spec["acquireTime"] = now
+            spec["leaseTransitions"] = spec.get("leaseTransitions", 0) + 1
+        spec["holderIdentity"] = self._identity
+        spec["leaseDurationSeconds"] = math.ceil(self._lease_duration)
+        spec["renewTime"] = now
+        return await self._replace(lease, spec)
+
+    async def _create(self, now: datetime.datetime) -> bool:
+        lease = self._api._resource.model_validate(
+            {
+                "metadata": {"name": self._name},
+                "spec": {
+                    "holderIdentity": self._identity,
+                    "leaseDurationSeconds": math.ceil(self._lease_duration),
+                    "acquireTime": now,
+                    "renewTime": now,
+                    "leaseTransitions": 0,
+                },
+            }
+        )
+        try:
+            self._observe(await self._api.create(lease))
+        except Conflict:
+            return False
+        except Exception:
+            logger.warning("Failed to create the lease %s", self._name, exc_info=True)
+            return False
+        return True
+
+    async def _replace(self, lease: ResourceType, spec: dict[str, Any]) -> bool:
+        data = lease.model_dump(by_alias=True, exclude_none=True)
+        data["spec"] = spec
+        try:
+            updated = await self._api.replace(
+                self._name, self._api._resource.model_validate(data)
+            )
+        except Conflict:
+            # Another candidate wrote the lease since it was read.
+            return False
+        except Exception:
+            logger.warning("Failed to update the lease %s", self._name, exc_info=True)
+            return False
+        self._observe(updated)
+        return True
+
+    async def _release(self) -> None:
+        if self._lease is None:
+            return
+        spec = _spec(self._lease)
+        if spec.get("holderIdentity") != self._identity:
+            return
+        now = datetime.datetime.now(datetime.timezone.utc)
+        spec.pop("holderIdentity", None)
+        spec.update(leaseDurationSeconds=1, acquireTime=now, renewTime=now)
+        with anyio.move_on_after(self._renew_deadline):
+            if await self._replace(self._lease, spec):
+                logger.info("%s released the lease %s", self._identity, self._name)
+
+    def _observe(self, lease: ResourceType) -> None:
+        """Remember *lease* and restart its expiry when its holder renewed it."""
+        spec = _spec(lease)
+        record = (spec.get("holderIdentity"), spec.get("renewTime"))
+        if record != self._observed:
+            self._observed = record
+            self._observed_at = anyio.current_time()
+        self._lease = lease
+
+
+def _spec(lease: Any) -> dict[str, Any]:
+    """Return the spec of *lease* as a dictionary keyed by the JSON field names."""
+    if lease.spec is None:
+        return {}
+    spec: dict[str, Any] = lease.spec.model_dump(by_alias=True, exclude_none=True)
+    return spec
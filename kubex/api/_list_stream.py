@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, AsyncGenerator, AsyncIterable, Generic, Type
+
+from kubex_core.models.metadata import ListMetadata
+from kubex_core.models.typing import ResourceType
+
+# Outside of strings only quotes and brackets change the parser state; inside
+# a string only the closing quote and escapes do. Jumping between them with a
+# regex keeps the per-byte work in C.
+_STRUCTURAL = re.compile(rb'["\[\]{}]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+
+
+class ListItemsSplitter:
+    """Incrementally split the ``items`` array out of a JSON list response.
+
+    Chunks of the response body are passed to :meth:`feed`, which returns the
+    raw JSON of every item completed so far. Everything outside of ``items``
+    (``apiVersion``, ``kind``, ``metadata``) is kept and returned by
+    :meth:`close`, with ``items`` left empty. Only the item being received is
+    buffered, so memory use is bounded by the largest item rather than the
+    whole list.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._envelope = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._string_start = 0
+        self._last_key = b""
+        self._in_items = False
+        self._item_start = -1
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Consume *chunk* and return the items completed by it."""
+        buffer = self._buffer
+        buffer += chunk
+        items: list[bytes] = []
+        pos = self._pos
+        while True:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buffer, pos)
+                if match is None:
+                    # ``pos`` may point past the end after a trailing backslash.
+                    pos = max(pos, len(buffer))
+                    break
+                index = match.start()
+                if buffer[index] == 0x5C:  # backslash, skip the escaped byte
+                    pos = index + 2
+                    continue
+                self._in_string = False
+                if self._depth == 1:
+                    self._last_key = bytes(buffer[self._string_start + 1 : index])
+                pos = index + 1
+                continue
+            match = _STRUCTURAL.search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+            index = match.start()
+            pos = index + 1
+            char = buffer[index]
+            if char == 0x22:  # quote
+                self._in_string = True
+                self._string_start = index
+            elif char in (0x7B, 0x5B):  # { [
+                self._depth += 1
+                if self._depth == 2 and char == 0x5B and self._last_key == b"items":
+                    self._in_items = True
+                    self._envelope += buffer[:pos]
+                    del buffer[:pos]
+                    pos = 0
+                elif self._depth == 3 and self._in_items:
+                    self._item_start = index
+            else:  # } ]
+                self._depth -= 1
+                if self._in_items:
+                    if self._depth == 2 and char == 0x7D:
+                        items.append(bytes(buffer[self._item_start : pos]))
+                        del buffer[:pos]
+                        pos = 0
+                        self._item_start = -1
+                    elif self._depth == 1:
+                        # Drop the separators between items, keep the ``]``.
+                        self._in_items = False
+                        del buffer[:index]
+                        pos = 1
+        if self._in_items and self._item_start < 0:
+            # Only separators between items are buffered; drop them.
+            del buffer[:pos]
+            pos = 0
+        self._pos = pos
+        return items
+
+    def close(self) -> dict[str, Any]:
+        """Return the response without its items once the body is complete.
+
+        Raises:
+            ValueError: If the body ended in the middle of the document.
+        """
+        if self._depth != 0 or self._in_string or self._in_items:
+            raise ValueError("Truncated list response")
+        envelope: dict[str, Any] = json.loads(bytes(self._envelope + self._buffer))
+        return envelope
+
+
+class ListStream(Generic[ResourceType]):
+    """The items of a list response, validated one by one as they arrive.
+
+    Iterate over the stream to receive the items. The list ``metadata`` (for
+    example the ``resourceVersion`` to start a watch from) is available once
+    all items have been received.
+    """
+
+    def __init__(
+        self, chunks: AsyncIterable[bytes], resource_type: Type[ResourceType]
+    ) -> None:
+        self._chunks = chunks
+        self._resource_type = resource_type
+        self._metadata: ListMetadata | None = None
+
+    @property
+    def metadata(self) -> ListMetadata:
+        """The metadata of the list.
+
+        Raises:
+            RuntimeError: If the items have not been fully consumed yet.
+        """
+        if self._metadata is None:
+            raise RuntimeError(
+                "List metadata is available once all items have been consumed"
+            )
+        return self._metadata
+
+    def __aiter__(self) -> AsyncGenerator[ResourceType, None]:
+        return self._iter_items()
+
+    async def _iter_items(self) -> AsyncGenerator[ResourceType, None]:
+        splitter = ListItemsSplitter()
+        async for chunk in self._chunks:
+            for raw_item in splitter.feed(chunk):
+                yield self._resource_type.model_validate_json(raw_item)
+        envelope = splitter.close()
+        self._metadata = ListMetadata.model_validate(envelope.get("metadata") or {})
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import AsyncGenerator, Generic, Type
 
 from kubex.client.client import BaseClient
@@ -23,9 +22,12 @@ from kubex_core.models.resource_config import Scope
 from kubex_core.models.typing import ResourceType
 from kubex_core.models.watch_event import WatchEvent
 
+from ._coalescer import RequestCoalescer, request_key
+from ._pagination import DEFAULT_PAGE_SIZE, ListIterator
 from ._protocol import (
     ApiNamespaceTypes,
     ApiRequestTimeoutTypes,
+    decode_watch_event,
     ensure_optional_namespace,
     ensure_required_namespace,
 )
@@ -41,8 +43,10 @@ class MetadataAccessor(Generic[ResourceType]):
         namespace: NamespaceTypes,
         scope: Scope,
         resource_type: Type[ResourceType],
+        coalescer: RequestCoalescer | None = None,
     ) -> None:
         self._client = client
+        self._coalescer = coalescer
         self._request_builder = request_builder
         self._namespace = namespace
         self._scope = scope
@@ -62,8 +66,15 @@ class MetadataAccessor(Generic[ResourceType]):
         request = self._request_builder.get_metadata(
             name, _namespace, options=options, request_timeout=request_timeout
         )
-        response = await self._client.request(request)
-        return PartialObjectMetadata.model_validate_json(response.content)
+
+        async def read() -> PartialObjectMetadata:
+            response = await self._client.request(request)
+            return PartialObjectMetadata.model_validate_json(response.content)
+
+        if self._coalescer is None:
+            return await read()
+        key = request_key(self._client, request, PartialObjectMetadata)
+        return await self._coalescer.do(key, read)
 
     async def list(
         self,
@@ -96,6 +107,44 @@ class MetadataAccessor(Generic[ResourceType]):
         model = PartialObjectMetadata.__RESOURCE_CONFIG__.list_model
         return model.model_validate_json(response.content)
 
+    def list_iter(
+        self,
+        *,
+        namespace: ApiNamespaceTypes = Ellipsis,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+        timeout_seconds: int | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        version_match: VersionMatch | None = None,
+        resource_version: ResourceVersionTypes = None,
+        prefetch: bool = False,
+        request_timeout: ApiRequestTimeoutTypes = Ellipsis,
+    ) -> ListIterator[PartialObjectMetadata]:
+        """Iterate over metadata of resources, requesting them page by page.
+
+        See :meth:`kubex.api.Api.list_iter` for the meaning of the arguments.
+        """
+
+        async def fetch_page(
+            continue_token: str | None,
+        ) -> ListEntity[PartialObjectMetadata]:
+            # The continue token pins the snapshot of the first page; the API
+            # server rejects resourceVersion on subsequent pages.
+            first_page = continue_token is None
+            return await self.list(
+                namespace=namespace,
+                label_selector=label_selector,
+                field_selector=field_selector,
+                timeout_seconds=timeout_seconds,
+                limit=limit,
+                continue_token=continue_token,
+                version_match=version_match if first_page else None,
+                resource_version=resource_version if first_page else None,
+                request_timeout=request_timeout,
+            )
+
+        return ListIterator(fetch_page, prefetch=prefetch)
+
     async def patch(
         self,
         name: str,
@@ -132,6 +181,7 @@ class MetadataAccessor(Generic[ResourceType]):
         send_initial_events: bool | None = None,
         timeout_seconds: int | None = None,
         resource_version: ResourceVersionTypes = None,
+        version_match: VersionMatch | None = None,
         request_timeout: ApiRequestTimeoutTypes = Ellipsis,
     ) -> AsyncGenerator[
         WatchEvent[PartialObjectMetadata],
@@ -145,6 +195,7 @@ class MetadataAccessor(Generic[ResourceType]):
             allow_bookmarks=allow_bookmarks,
             send_initial_events=send_initial_events,
             timeout_seconds=timeout_seconds,
+            version_match=version_match,
         )
         request = self._request_builder.watch_metadata(
             _namespace,
@@ -152,5 +203,5 @@ class MetadataAccessor(Generic[ResourceType]):
             resource_version=resource_version,
             request_timeout=request_timeout,
         )
-        async for line in self._client.stream_lines(request):
-            yield WatchEvent(PartialObjectMetadata, json.loads(line))
+        async for line in self._client.stream_raw_lines(request):
+            yield decode_watch_event(PartialObjectMetadata, line)
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from contextlib import AsyncExitStack
+from types import TracebackType
+from typing import TYPE_CHECKING, Awaitable, Callable, Generic, Iterator
+
+import anyio
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+
+from kubex_core.models.list_entity import ListEntity
+from kubex_core.models.typing import ResourceType
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+DEFAULT_PAGE_SIZE = 500
+
+FetchPage = Callable[[str | None], Awaitable[ListEntity[ResourceType]]]
+
+
+class ListIterator(Generic[ResourceType]):
+    """Async iterator over the items of a list, requested page by page.
+
+    *fetch_page* is called with the continue token of the previous page
+    (``None`` for the first page) until a page without one is returned.
+
+    With *prefetch* the next page is requested by a background task while the
+    current one is consumed, so at most two pages are held in memory at any
+    time. The task runs in a task group owned by the caller, so the iterator
+    has to be entered first; leaving the block cancels a pending request::
+
+        async with api.list_iter(prefetch=True) as pods:
+            async for pod in pods:
+                ...
+
+    Without *prefetch* the iterator can be used directly with ``async for``.
+    """
+
+    def __init__(
+        self, fetch_page: FetchPage[ResourceType], *, prefetch: bool = False
+    ) -> None:
+        self._fetch_page = fetch_page
+        self._prefetch = prefetch
+        self._continue_token: str | None = None
+        self._done = False
+        self._items: Iterator[ResourceType] = iter(())
+        self._exit_stack: AsyncExitStack | None = None
+        self._receive_stream: (
+            MemoryObjectReceiveStream[ListEntity[ResourceType]] | None
+        ) = None
+        # Request errors are handed over to the caller's task instead of
+        # escaping the task group, which would wrap them in an
+        # ``ExceptionGroup``.
+        self._errors: list[Exception] = []
+
+    async def __aenter__(self) -> Self:
+        if not self._prefetch:
+            return self
+        if self._receive_stream is not None:
+            raise RuntimeError("A prefetching list iterator can only be entered once")
+        send_stream: MemoryObjectSendStream[ListEntity[ResourceType]]
+        receive_stream: MemoryObjectReceiveStream[ListEntity[ResourceType]]
+        # A zero-sized buffer: the producer fetches page N+1, then waits until
+        # the caller asks for it, which bounds the look-ahead to a single page.
+        send_stream, receive_stream = anyio.create_memory_object_stream(0)
+        stack = AsyncExitStack()
+        await stack.__aenter__()
+        try:
+            tg = await stack.enter_async_context(anyio.create_task_group())
+            stack.callback(tg.cancel_scope.cancel)
+            stack.push_async_callback(receive_stream.aclose)
+            tg.start_soon(self._produce, send_stream)
+        except BaseException:
+            await stack.aclose()
+            raise
+        self._exit_stack = stack
+        self._receive_stream = receive_stream
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._done = True
+        stack = self._exit_stack
+        self._exit_stack = None
+        if stack is not None:
+            # The producer never fails, so the task group is closed without
+            # the error of the block, which would come back wrapped in an
+            # ``ExceptionGroup``; it propagates unchanged once this returns.
+            await stack.aclose()
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> ResourceType:
+        while True:
+            item = next(self._items, None)
+            if item is not None:
+                return item
+            page = await self._next_page()
+            if page is None:
+                raise StopAsyncIteration
+            self._items = iter(page.items)
+
+    async def _next_page(self) -> ListEntity[ResourceType] | None:
+        if not self._prefetch:
+            if self._done:
+                return None
+            page = await self._fetch_page(self._continue_token)
+            self._continue_token = page.metadata.continue_
+            self._done = not self._continue_token
+            return page
+        if self._receive_stream is None:
+            raise RuntimeError(
+                "Enter a prefetching list iterator with 'async with' before "
+                "iterating over it"
+            )
+        try:
+            return await self._receive_stream.receive()
+        except (anyio.EndOfStream, anyio.ClosedResourceError):
+            if self._errors:
+                raise self._errors.pop()
+            return None
+
+    async def _produce(
+        self, send_stream: MemoryObjectSendStream[ListEntity[ResourceType]]
+    ) -> None:
+        async with send_stream:
+            continue_token: str | None = None
+            try:
+                while True:
+                    page = await self._fetch_page(continue_token)
+                    continue_token = page.metadata.continue_
+                    await send_stream.send(page)
+                    if not continue_token:
+                        return
+            except anyio.BrokenResourceError:
+                # The caller left the block before consuming every page.
+                return
+            except Exception as exc:
+                self._errors.append(exc)
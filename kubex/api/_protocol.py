@@ -1,16 +1,44 @@
 from __future__ import annotations
 
+import json
 from types import EllipsisType
-from typing import Any, ClassVar, Protocol, Type
-
-from kubex.client.client import BaseClient
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    ClassVar,
+    NoReturn,
+    Protocol,
+    Type,
+    TypeVar,
+)
+
+import pydantic_core
+from pydantic import BaseModel, ValidationError
+
+from kubex.client.client import BaseClient, raise_for_status
+from kubex.core import cbor
 from kubex.core.params import NamespaceTypes, TimeoutTypes
 from kubex.core.request_builder.builder import RequestBuilder
+from kubex.core.request_builder.constants import (
+    APPLICATION_CBOR_MIME_TYPE,
+    CONTENT_TYPE_HEADER,
+)
+from kubex.core.response import Response
+from kubex_core.models.lazy import lazy_validate_json, lazy_validate_python
 from kubex_core.models.resource_config import Scope
+from kubex_core.models.status import Status
 from kubex_core.models.typing import ResourceType
+from kubex_core.models.watch_event import (
+    ErrorEventEnvelope,
+    EventType,
+    WatchEvent,
+    watch_event_adapter,
+)
 
 ApiNamespaceTypes = NamespaceTypes | EllipsisType
 ApiRequestTimeoutTypes = TimeoutTypes | EllipsisType
+ModelT = TypeVar("ModelT", bound=BaseModel)
 
 
 class SubresourceNotAvailable:
@@ -49,6 +77,114 @@ def ensure_optional_namespace(
     return _namespace
 
 
+def raise_watch_error(raw_status: Any) -> NoReturn:
+    """Raise the exception matching the ``Status`` of an ``ERROR`` watch event.
+
+    Failures that happen after the watch response headers were sent (most
+    notably an expired ``resourceVersion``, reported as HTTP 410) arrive as an
+    ``ERROR`` event carrying a ``Status`` object rather than as an HTTP error.
+    They are mapped to the same exceptions a failed request would raise.
+    """
+    try:
+        status = Status.model_validate(raw_status)
+    except ValidationError:
+        raise_for_status(500, json.dumps(raw_status))
+    raise_for_status(status.code, status)
+
+
+_OBJECT_EVENT_TYPES = frozenset(
+    (EventType.ADDED.value, EventType.MODIFIED.value, EventType.DELETED.value)
+)
+
+
+def decode_watch_event(
+    resource_type: Type[ResourceType], line: str | bytes, *, lazy: bool = False
+) -> WatchEvent[ResourceType]:
+    """Validate a raw watch event line into a ``WatchEvent`` in a single pass.
+
+    With *lazy* the object of ``ADDED``/``MODIFIED``/``DELETED`` events is
+    validated field by field on access, see
+    :func:`kubex_core.models.lazy.lazy_validate_python`.
+
+    ``ERROR`` events are raised as the matching exception, see
+    :func:`raise_watch_error`.
+    """
+    if lazy:
+        return validate_watch_event(
+            resource_type, pydantic_core.from_json(line), lazy=True
+        )
+    envelope = watch_event_adapter(resource_type).validate_json(line)
+    if isinstance(envelope, ErrorEventEnvelope):
+        raise_watch_error(envelope.object)
+    return WatchEvent.from_object(EventType(envelope.type), envelope.object)
+
+
+def validate_watch_event(
+    resource_type: Type[ResourceType], raw: Any, *, lazy: bool = False
+) -> WatchEvent[ResourceType]:
+    """Validate an already decoded watch event, see :func:`decode_watch_event`."""
+    if lazy and isinstance(raw, dict) and raw.get("type") in _OBJECT_EVENT_TYPES:
+        return WatchEvent.from_object(
+            EventType(raw["type"]),
+            lazy_validate_python(resource_type, raw.get("object")),
+        )
+    envelope = watch_event_adapter(resource_type).validate_python(raw)
+    if isinstance(envelope, ErrorEventEnvelope):
+        raise_watch_error(envelope.object)
+    return WatchEvent.from_object(EventType(envelope.type), envelope.object)
+
+
+def validate_response(
+    model_type: Type[ModelT], response: Response, *, lazy: bool = False
+) -> ModelT:
+    """Validate the body of *response* into *model_type*.
+
+    The body is decoded according to the ``Content-Type`` of the response,
+    CBOR or JSON. With *lazy* the fields are validated on first access, see
+    :func:`kubex_core.models.lazy.lazy_validate_python`.
+    """
+    content_type = response.headers.get(CONTENT_TYPE_HEADER, "")
+    if content_type.startswith(APPLICATION_CBOR_MIME_TYPE):
+        raw = cbor.loads(response.content)
+        if lazy:
+            return lazy_validate_python(model_type, raw)
+        return model_type.model_validate(raw)
+    if lazy:
+        return lazy_validate_json(model_type, response.content)
+    return model_type.model_validate_json(response.content)
+
+
+async def iter_cbor_watch_events(
+    chunks: AsyncIterator[bytes],
+) -> AsyncGenerator[Any, None]:
+    """Decode the events of a watch requested in the CBOR wire format.
+
+    The events arrive as a CBOR sequence; when the API server does not serve
+    CBOR it answers with JSON lines instead, which are detected from the
+    first byte and decoded as such.
+    """
+    decoder: cbor.CborSequenceDecoder | None = None
+    json_lines: bool | None = None
+    buffer = b""
+    async for chunk in chunks:
+        if json_lines is None:
+            if not chunk.strip():
+                continue
+            json_lines = chunk.lstrip()[:1] == b"{"
+            if not json_lines:
+                decoder = cbor.CborSequenceDecoder()
+        if decoder is not None:
+            for item in decoder.feed(chunk):
+                yield item
+            continue
+        *lines, buffer = (buffer + chunk).split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield pydantic_core.from_json(line)
+    if buffer.strip():
+        yield pydantic_core.from_json(buffer)
+
+
 class ApiProtocol(Protocol[ResourceType]):
     _resource: Type[ResourceType]
     _client: BaseClient
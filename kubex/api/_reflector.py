@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Awaitable, Callable, Generic
+
+import anyio
+
+from kubex.core.backoff import Backoff
+from kubex.core.exceptions import Gone
+from kubex_core.models.typing import ResourceType
+from kubex_core.models.watch_event import Bookmark, EventType, WatchEvent
+
+from ._protocol import ApiNamespaceTypes, ApiRequestTimeoutTypes
+from ._resilient_watch import is_retryable
+from ._store import Store, object_key
+
+if TYPE_CHECKING:
+    from .api import Api
+
+logger = logging.getLogger("kubex.api.reflector")
+
+DEFAULT_WATCH_LIST_TIMEOUT = 120.0
+
+
+class Reflector(Generic[ResourceType]):
+    """Keep a :class:`Store` in sync with the API server using list-then-watch.
+
+    The reflector lists the resource once, then streams watch events starting
+    from the ``resourceVersion`` returned by the list and applies them to the
+    store. When the watch stream ends cleanly (server-side ``timeoutSeconds``,
+    load-balancer idle cut) it resumes from the last seen ``resourceVersion``
+    instead of listing again; a full relist only happens when the server
+    answers with ``410 Gone`` because that version has been compacted.
+
+    Transport errors, ``429 Too Many Requests`` and ``5xx`` responses are
+    retried, so an API server rollout does not stop the reflector. Every
+    rewatch and relist waits for a jittered :class:`~kubex.core.backoff.Backoff`
+    delay, which grows while attempts keep failing without receiving anything.
+
+    Example::
+
+        reflector = Reflector(Api(Pod, client=client, namespace="default"))
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(reflector.run)
+            await reflector.wait_for_sync()
+            pod = reflector.store.get("default/my-pod")
+
+    Args:
+        api: The ``Api`` used to list and watch the resource.
+        store: The store to populate. A new empty ``Store`` is created if omitted.
+        namespace: Namespace to list and watch. Defaults to the ``Api`` namespace;
+            pass ``None`` to cover all namespaces.
+        label_selector: Restrict the cached objects by their labels.
+        field_selector: Restrict the cached objects by their fields.
+        timeout_seconds: Server-side timeout for each watch request. The watch
+            is resumed transparently when the server closes the stream.
+        request_timeout: HTTP-level timeout override for the list and watch
+            requests. Long-lived watches need a read timeout longer than
+            ``timeout_seconds`` (or no timeout at all).
+        on_event: Optional coroutine called with every change applied to the
+            store, after it was applied. Relists are reported as the
+            ``ADDED``/``MODIFIED``/``DELETED`` events needed to go from the
+            previous store content to the new one. Bookmarks are not reported.
+        watch_list: Get the initial state with a watch list
+            (``sendInitialEvents=true``, see :meth:`Api.watch_list`) instead of
+            a list request. The store is replaced once the initial events have
+            been received, and the same stream then carries the changes. This
+            avoids the memory spike of large list requests on the API server.
+        watch_list_timeout: How long, in seconds, to wait for the end of the
+            initial events of a watch list. When it is exceeded the reflector
+            falls back to list-then-watch for good. Only the wait for the
+            server is timed, not ``on_event``. ``None`` waits forever.
+        backoff: The delays before rewatches and relists. Defaults to
+            ``Backoff()``.
+    """
+
+    def __init__(
+        self,
+        api: Api[ResourceType],
+        *,
+        store: Store[ResourceType] | None = None,
+        namespace: ApiNamespaceTypes = Ellipsis,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+        timeout_seconds: int | None = None,
+        request_timeout: ApiRequestTimeoutTypes = Ellipsis,
+        on_event: Callable[[WatchEvent[ResourceType]], Awaitable[None]] | None = None,
+        watch_list: bool = False,
+        watch_list_timeout: float | None = DEFAULT_WATCH_LIST_TIMEOUT,
+        backoff: Backoff | None = None,
+    ) -> None:
+        self._api = api
+        self._store: Store[ResourceType] = store if store is not None else Store()
+        self._namespace = namespace
+        self._label_selector = label_selector
+        self._field_selector = field_selector
+        self._timeout_seconds = timeout_seconds
+        self._request_timeout = request_timeout
+        self._on_event = on_event
+        self._watch_list = watch_list
+        self._watch_list_timeout = watch_list_timeout
+        self._backoff = backoff if backoff is not None else Backoff()
+        self._received = False
+        self._resource_version: str | None = None
+        self._synced_event: anyio.Event | None = None
+        self._has_synced = False
+        # Held while a change is applied to the store and passed to
+        # ``on_event``, so readers of the store can line up with the events.
+        self._lock = anyio.Lock()
+
+    @property
+    def store(self) -> Store[ResourceType]:
+        """The store kept in sync by this reflector."""
+        return self._store
+
+    @property
+    def resource_version(self) -> str | None:
+        """The last ``resourceVersion`` observed from a list, event or bookmark."""
+        return self._resource_version
+
+    @property
+    def has_synced(self) -> bool:
+        """Whether the initial list has been applied to the store."""
+        return self._has_synced
+
+    def _get_synced_event(self) -> anyio.Event:
+        # ``anyio.Event`` binds to the running async backend, so it cannot be
+        # created in ``__init__`` (reflectors are often built outside a loop).
+        if self._synced_event is None:
+            self._synced_event = anyio.Event()
+            if self._has_synced:
+                self._synced_event.set()
+        return self._synced_event
+
+    async def wait_for_sync(self) -> None:
+        """Wait until the initial list has been applied to the store."""
+        await self._get_synced_event().wait()
+
+    async def run(self) -> None:
+        """List and watch until cancelled.
+
+        Errors other than ``410 Gone``, transport errors, ``429`` and ``5xx``
+        responses are propagated to the caller.
+        """
+        kind = self._api._resource.__RESOURCE_CONFIG__.kind
+        failures = 0
+        while True:
+            self._received = False
+            try:
+                if self._resource_version is None and self._watch_list:
+                    await self._watch_list_and_replace()
+                else:
+                    if self._resource_version is None:
+                        await self._list_and_replace()
+                    await self._watch()
+            except Gone:
+                logger.debug(
+                    "resourceVersion %s expired, relisting %s",
+                    self._resource_version,
+                    kind,
+                )
+                self._resource_version = None
+            except Exception as exc:
+                if not is_retryable(exc, self._api._client):
+                    raise
+                failures = 0 if self._received else failures + 1
+                logger.warning("List and watch of %s failed, retrying: %r", kind, exc)
+            else:
+                if self._received:
+                    failures = 0
+            await anyio.sleep(self._backoff.delay(failures))
+
+    async def _list_and_replace(self) -> None:
+        result = await self._api.list(
+            namespace=self._namespace,
+            label_selector=self._label_selector,
+            field_selector=self._field_selector,
+            request_timeout=self._request_timeout,
+        )
+        await self._replace(result.items, result.metadata.resource_version)
+
+    async def _watch_list_and_replace(self) -> None:
+        # Initial events are collected aside and swapped in at once, so the
+        # store never exposes a partially received state after a relist.
+        initial: list[ResourceType] = []
+        events = self._api.watch_list(
+            namespace=self._namespace,
+            label_selector=self._label_selector,
+            field_selector=self._field_selector,
+            timeout_seconds=self._timeout_seconds,
+            request_timeout=self._request_timeout,
+        )
+        end: Bookmark | None = None
+        try:
+            # Only the wait for the initial state is timed: dispatching it to
+            # slow subscribers must not look like a server without watch list.
+            with anyio.move_on_after(self._watch_list_timeout):
+                async for event in events:
+                    obj = event.object
+                    if not isinstance(obj, Bookmark):
+                        initial.append(obj)
+                    elif obj.is_initial_events_end:
+                        end = obj
+                        break
+                else:
+                    return
+            if end is None:
+                # The server accepted sendInitialEvents but never ended the
+                # initial state; stop buffering and list instead.
+                logger.warning(
+                    "No end of the initial events of %s after %ss, "
+                    "falling back to list and watch",
+                    self._api._resource.__RESOURCE_CONFIG__.kind,
+                    self._watch_list_timeout,
+                )
+                self._watch_list = False
+                return
+            await self._replace(initial, end.metadata.resource_version)
+            async for event in events:
+                await self._apply(event)
+        finally:
+            await events.aclose()
+
+    async def _replace(
+        self, items: list[ResourceType], resource_version: str | None
+    ) -> None:
+        async with self._lock:
+            previous = {object_key(obj): obj for obj in self._store.list()}
+            self._store.replace(items)
+            self._resource_version = resource_version
+            self._received = True
+            if not self._has_synced:
+                self._has_synced = True
+                self._get_synced_event().set()
+            if self._on_event is None:
+                return
+            for obj in items:
+                old = previous.pop(object_key(obj), None)
+                if old is None:
+                    await self._on_event(WatchEvent.from_object(EventType.ADDED, obj))
+                elif old.metadata.resource_version != obj.metadata.resource_version:
+                    await self._on_event(
+                        WatchEvent.from_object(EventType.MODIFIED, obj)
+                    )
+            for obj in previous.values():
+                await self._on_event(WatchEvent.from_object(EventType.DELETED, obj))
+
+    async def _watch(self) -> None:
+        async for event in self._api.watch(
+            namespace=self._namespace,
+            label_selector=self._label_selector,
+            field_selector=self._field_selector,
+            allow_bookmarks=True,
+            timeout_seconds=self._timeout_seconds,
+            resource_version=self._resource_version,
+            request_timeout=self._request_timeout,
+        ):
+            await self._apply(event)
+
+    async def _apply(self, event: WatchEvent[ResourceType]) -> None:
+        self._received = True
+        obj = event.object
+        if not isinstance(obj, Bookmark):
+            async with self._lock:
+                if event.type == EventType.DELETED:
+                    self._store.delete(obj)
+                else:
+                    self._store.update(obj)
+                if self._on_event is not None:
+                    await self._on_event(event)
+        if obj.metadata.resource_version:
+            self._resource_version = obj.metadata.resource_version
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import logging
+from http import HTTPStatus
+from typing import TYPE_CHECKING, AsyncGenerator, Generic
+
+import anyio
+
+from kubex.core.backoff import Backoff
+from kubex.core.exceptions import Gone, KubexApiError
+from kubex_core.models.typing import ResourceType
+from kubex_core.models.watch_event import Bookmark, WatchEvent
+
+from ._protocol import ApiNamespaceTypes, ApiRequestTimeoutTypes
+
+if TYPE_CHECKING:
+    from kubex.client.client import BaseClient
+
+    from .api import Api
+
+logger = logging.getLogger("kubex.api.watch")
+
+
+def is_retryable(exc: Exception, client: BaseClient) -> bool:
+    """Whether a failed list or watch should be retried.
+
+    Transport errors of *client*, ``429 Too Many Requests`` and ``5xx``
+    responses are transient, for example while the API server restarts.
+    """
+    if isinstance(exc, KubexApiError):
+        return (
+            exc.status >= HTTPStatus.INTERNAL_SERVER_ERROR
+            or exc.status == HTTPStatus.TOO_MANY_REQUESTS
+        )
+    return isinstance(exc, client.transport_errors)
+
+
+class ResilientWatch(Generic[ResourceType]):
+    """A watch that survives disconnects.
+
+    ``Api.watch()`` ends as soon as the stream does (server-side
+    ``timeoutSeconds``, load-balancer idle cut, API server restart, network
+    error). ``ResilientWatch`` reconnects instead, resuming from the last
+    ``resourceVersion`` seen in an event or bookmark, so no change is missed
+    or delivered twice.
+
+    Every reconnect waits for a :class:`~kubex.core.backoff.Backoff` delay.
+    The delay grows while reconnects keep failing and is reset once a
+    connection delivers events again; its jitter keeps a fleet of clients
+    that lost their watches at the same moment from reconnecting in lockstep.
+
+    When the last ``resourceVersion`` has been compacted (``410 Gone``) the
+    watch restarts without a ``resourceVersion``: the API server then sends
+    the current state again as ``ADDED`` events (a relist). Objects deleted
+    while disconnected are not reported in that case; use a
+    :class:`~kubex.api.Reflector` when deletions must never be missed.
+
+    Transport errors, ``429 Too Many Requests`` and ``5xx`` responses are
+    retried; any other error is propagated. Bookmarks are consumed
+    internally and not yielded.
+
+    Example::
+
+        watch = ResilientWatch(Api(Pod, client=client, namespace="default"))
+        async for event in watch:
+            print(event.type, event.object.metadata.name)
+
+    Args:
+        api: The ``Api`` used to watch the resource.
+        namespace: Namespace to watch. Defaults to the ``Api`` namespace;
+            pass ``None`` to watch all namespaces.
+        label_selector: Restrict the watched objects by their labels.
+        field_selector: Restrict the watched objects by their fields.
+        resource_version: Start watching after this version. If omitted, the
+            API server first sends the current state as ``ADDED`` events.
+        timeout_seconds: Server-side timeout for each watch request.
+        request_timeout: HTTP-level timeout override for each watch request.
+        backoff: The delays between reconnects. Defaults to ``Backoff()``.
+        max_retries: Give up and raise the last error after this many
+            consecutive failed reconnects. ``None`` retries forever.
+    """
+
+    def __init__(
+        self,
+        api: Api[ResourceType],
+        *,
+        namespace: ApiNamespaceTypes = Ellipsis,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+        resource_version: str | None = None,
+        timeout_seconds: int | None = None,
+        request_timeout: ApiRequestTimeoutTypes = Ellipsis,
+        backoff: Backoff | None = None,
+        max_retries: int | None = None,
+    ) -> None:
+        self._api = api
+        self._namespace = namespace
+        self._label_selector = label_selector
+        self._field_selector = field_selector
+        self._resource_version = resource_version
+        self._timeout_seconds = timeout_seconds
+        self._request_timeout = request_timeout
+        self._backoff = backoff if backoff is not None else Backoff()
+        self._max_retries = max_retries
+        self._reconnects = 0
+        self._relists = 0
+
+    @property
+    def resource_version(self) -> str | None:
+        """The last ``resourceVersion`` observed from an event or bookmark."""
+        return self._resource_version
+
+    @property
+    def reconnects(self) -> int:
+        """How many times the watch has been re-established."""
+        return self._reconnects
+
+    @property
+    def relists(self) -> int:
+        """How many times the watch restarted from scratch after ``410 Gone``."""
+        return self._relists
+
+    def __aiter__(self) -> AsyncGenerator[WatchEvent[ResourceType], None]:
+        return self._run()
+
+    def _is_retryable(self, exc: Exception) -> bool:
+        return is_retryable(exc, self._api._client)
+
+    async def _run(self) -> AsyncGenerator[WatchEvent[ResourceType], None]:
+        failures = 0
+        while True:
+            received = False
+            try:
+                async for event in self._api.watch(
+                    namespace=self._namespace,
+                    label_selector=self._label_selector,
+                    field_selector=self._field_selector,
+                    allow_bookmarks=True,
+                    timeout_seconds=self._timeout_seconds,
+                    resource_version=self._resource_version,
+                    request_timeout=self._request_timeout,
+                ):
+                    received = True
+                    obj = event.object
+                    if obj.metadata.resource_version:
+                        self._resource_version = obj.metadata.resource_version
+                    if not isinstance(obj, Bookmark):
+                        yield event
+            except Gone:
+                logger.debug(
+                    "resourceVersion %s expired, restarting watch of %s",
+                    self._resource_version,
+                    self._api._resource.__RESOURCE_CONFIG__.kind,
+                )
+                self._resource_version = None
+                self._relists += 1
+            except Exception as exc:
+                if not self._is_retryable(exc):
+                    raise
+                failures = 0 if received else failures + 1
+                if self._max_retries is not None and failures > self._max_retries:
+                    raise
+                logger.debug(
+                    "Watch of %s failed, reconnecting: %r",
+                    self._api._resource.__RESOURCE_CONFIG__.kind,
+                    exc,
+                )
+            else:
+                if received:
+                    failures = 0
+            delay = self._backoff.delay(failures)
+            self._reconnects += 1
+            await anyio.sleep(delay)
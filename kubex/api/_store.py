@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import threading
+from typing import Callable, Generic, Iterable, Mapping
+
+from kubex_core.models.base_entity import BaseEntity
+from kubex_core.models.typing import ResourceType
+
+IndexFunc = Callable[[ResourceType], Iterable[str]]
+"""Compute the index values of an object; an object may have any number of values."""
+
+
+def object_key(obj: BaseEntity) -> str:
+    """Return the cache key of *obj*.
+
+    Namespaced objects are keyed as ``namespace/name``, cluster-scoped objects
+    by ``name`` alone (the same convention as client-go's
+    ``MetaNamespaceKeyFunc``).
+    """
+    name = obj.metadata.name
+    if name is None:
+        raise ValueError("Object has no metadata.name and cannot be cached")
+    namespace = obj.metadata.namespace
+    if namespace:
+        return f"{namespace}/{name}"
+    return name
+
+
+def index_by_namespace(obj: BaseEntity) -> list[str]:
+    """Index objects by ``metadata.namespace``."""
+    namespace = obj.metadata.namespace
+    return [namespace] if namespace else []
+
+
+def index_by_owner_uid(obj: BaseEntity) -> list[str]:
+    """Index objects by the UIDs of their ``metadata.ownerReferences``."""
+    return [ref.uid for ref in obj.metadata.owner_references or ()]
+
+
+def index_by_label(label: str) -> Callable[[BaseEntity], list[str]]:
+    """Return an index function indexing objects by the value of *label*.
+
+    Objects without the label are not indexed.
+    """
+
+    def index(obj: BaseEntity) -> list[str]:
+        labels = obj.metadata.labels
+        if labels is None or label not in labels:
+            return []
+        return [labels[label]]
+
+    return index
+
+
+def _build_index(
+    index_func: IndexFunc[ResourceType], items: Mapping[str, ResourceType]
+) -> dict[str, set[str]]:
+    index: dict[str, set[str]] = {}
+    for key, obj in items.items():
+        for value in index_func(obj):
+            index.setdefault(value, set()).add(key)
+    return index
+
+
+class Store(Generic[ResourceType]):
+    """Thread-safe in-memory cache of Kubernetes objects keyed by ``namespace/name``.
+
+    A ``Store`` is usually populated by a :class:`~kubex.api.Reflector`, but it
+    can be filled manually as well. All methods are synchronous and hold an
+    internal lock only for the duration of a dictionary operation, so reading
+    from the store never blocks the event loop.
+
+    Secondary indexes turn common lookups such as "all pods owned by this
+    ReplicaSet" or "all pods on this node" into dictionary lookups instead of
+    scans over the whole cache. They are maintained incrementally on every
+    change::
+
+        def index_by_node(pod: Pod) -> list[str]:
+            return [pod.spec.node_name] if pod.spec and pod.spec.node_name else []
+
+        store = Store(
+            indexers={
+                "owner": index_by_owner_uid,
+                "app": index_by_label("app"),
+                "node": index_by_node,
+            }
+        )
+        pods = store.by_index("node", "node-1")
+
+    Args:
+        indexers: Index functions by index name. More can be added later with
+            :meth:`add_indexers`.
+    """
+
+    def __init__(
+        self, indexers: Mapping[str, IndexFunc[ResourceType]] | None = None
+    ) -> None:
+        self._lock = threading.RLock()
+        self._items: dict[str, ResourceType] = {}
+        self._indexers: dict[str, IndexFunc[ResourceType]] = {}
+        # index name -> index value -> keys of the objects with that value
+        self._indices: dict[str, dict[str, set[str]]] = {}
+        if indexers:
+            self.add_indexers(indexers)
+
+    def add_indexers(self, indexers: Mapping[str, IndexFunc[ResourceType]]) -> None:
+        """Register additional index functions and index the cached objects.
+
+        Raises:
+            ValueError: If an index with one of the names already exists.
+        """
+        with self._lock:
+            for name in indexers:
+                if name in self._indexers:
+                    raise ValueError(f"Index {name!r} already exists")
+            for name, index_func in indexers.items():
+                self._indexers[name] = index_func
+                self._indices[name] = _build_index(index_func, self._items)
+
+    def _update_indices(
+        self, key: str, old: ResourceType | None, new: ResourceType | None
+    ) -> None:
+        for name, index_func in self._indexers.items():
+            old_values = set(index_func(old)) if old is not None else set()
+            new_values = set(index_func(new)) if new is not None else set()
+            if old_values == new_values:
+                continue
+            index = self._indices[name]
+            for value in old_values - new_values:
+                keys = index.get(value)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del index[value]
+            for value in new_values - old_values:
+                index.setdefault(value, set()).add(key)
+
+    def add(self, obj: ResourceType) -> None:
+        """Insert *obj*, replacing any cached object with the same key."""
+        key = object_key(obj)
+        with self._lock:
+            old = self._items.get(key)
+            self._items[key] = obj
+            if self._indexers:
+                self._update_indices(key, old, obj)
+
+    def update(self, obj: ResourceType) -> None:
+        """Replace the cached object with the same key as *obj*."""
+        self.add(obj)
+
+    def delete(self, obj: ResourceType) -> None:
+        """Remove the object with the same key as *obj*, if cached."""
+        key = object_key(obj)
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None and self._indexers:
+                self._update_indices(key, old, None)
+
+    def replace(self, objs: Iterable[ResourceType]) -> None:
+        """Atomically replace the whole content of the store with *objs*."""
+        items = {object_key(obj): obj for obj in objs}
+        with self._lock:
+            self._items = items
+            for name, index_func in self._indexers.items():
+                self._indices[name] = _build_index(index_func, items)
+
+    def get(self, key: str) -> ResourceType | None:
+        """Return the object cached under *key* (``namespace/name`` or ``name``)."""
+        with self._lock:
+            return self._items.get(key)
+
+    def get_by_name(
+        self, name: str, namespace: str | None = None
+    ) -> ResourceType | None:
+        """Return the object named *name* in *namespace* (``None`` for cluster-scoped)."""
+        return self.get(f"{namespace}/{name}" if namespace else name)
+
+    def index_keys(self, index_name: str, value: str) -> list[str]:
+        """Return the keys of the objects whose *index_name* index contains *value*.
+
+        Raises:
+            KeyError: If no index named *index_name* exists.
+        """
+        with self._lock:
+            if index_name not in self._indices:
+                raise KeyError(f"Index {index_name!r} does not exist")
+            return list(self._indices[index_name].get(value, ()))
+
+    def by_index(self, index_name: str, value: str) -> list[ResourceType]:
+        """Return the objects whose *index_name* index contains *value*.
+
+        Raises:
+            KeyError: If no index named *index_name* exists.
+        """
+        with self._lock:
+            return [self._items[key] for key in self.index_keys(index_name, value)]
+
+    def index_values(self, index_name: str) -> list[str]:
+        """Return all values currently present in the *index_name* index.
+
+        Raises:
+            KeyError: If no index named *index_name* exists.
+        """
+        with self._lock:
+            if index_name not in self._indices:
+                raise KeyError(f"Index {index_name!r} does not exist")
+            return list(self._indices[index_name])
+
+    def keys(self) -> list[str]:
+        """Return a snapshot of all cached keys."""
+        with self._lock:
+            return list(self._items)
+
+    def list(self) -> list[ResourceType]:
+        """Return a snapshot of all cached objects."""
+        with self._lock:
+            return list(self._items.values())
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._items
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import math
+from collections import deque
+from typing import Any, AsyncIterable, Awaitable, Callable, Generic, Hashable, TypeVar
+
+import anyio
+import anyio.lowlevel
+
+from kubex.client.rate_limit import TokenBucket
+from kubex.core.backoff import Backoff
+from kubex_core.models.watch_event import Bookmark, WatchEvent
+
+from ._store import object_key
+
+logger = logging.getLogger("kubex.api.workqueue")
+
+KeyType = TypeVar("KeyType", bound=Hashable)
+
+DEFAULT_ITEM_BACKOFF_INITIAL = 0.005
+DEFAULT_ITEM_BACKOFF_MAXIMUM = 1000.0
+DEFAULT_QUEUE_QPS = 10.0
+DEFAULT_QUEUE_BURST = 100
+
+Handler = Callable[[KeyType], Awaitable[float | None]]
+"""Process one key; return a delay in seconds to process the key again later."""
+
+
+class WorkQueue(Generic[KeyType]):
+    """A deduplicating, rate-limited queue of keys for reconcile loops.
+
+    Controllers react to changes of an object by reconciling it as a whole, so
+    ten events for one object only need one reconcile. The queue holds keys
+    (usually ``namespace/name``, see :func:`~kubex.api.object_key`) rather
+    than events:
+
+    - A key is queued at most once. Adding a key that is already queued is a
+      no-op.
+    - A key is handed to at most one worker at a time. A key added while it is
+      being processed is marked dirty and queued again once the worker calls
+      :meth:`done`, so the latest change is never lost.
+    - :meth:`add_after` queues a key after a delay; of several delays for the
+      same key the earliest wins.
+    - :meth:`add_rate_limited` queues a key after a per-key exponential
+      backoff, limited overall by a token bucket. :meth:`forget` resets the
+      backoff of a key once it was processed successfully.
+
+    Example::
+
+        queue: WorkQueue[str] = WorkQueue()
+
+        async def reconcile(key: str) -> None:
+            ...
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(queue.add_events, api.watch())
+            tg.start_soon(functools.partial(queue.run, reconcile, workers=4))
+
+    The queue uses :mod:`anyio` and works under asyncio and trio alike; it
+    must only be used from a single event loop. Delayed keys are moved to the
+    queue by the tasks waiting in :meth:`get`, so no background task is needed.
+
+    Args:
+        backoff: The per-key backoff of :meth:`add_rate_limited`. Defaults to
+            5 ms doubling up to 1000 s without jitter, like client-go.
+        qps: The overall rate of :meth:`add_rate_limited`, in keys per second;
+            ``None`` disables the overall limit.
+        burst: The number of keys :meth:`add_rate_limited` may queue at once.
+    """
+
+    def __init__(
+        self,
+        *,
+        backoff: Backoff | None = None,
+        qps: float | None = DEFAULT_QUEUE_QPS,
+        burst: int = DEFAULT_QUEUE_BURST,
+    ) -> None:
+        self.backoff = (
+            backoff
+            if backoff is not None
+            else Backoff(
+                DEFAULT_ITEM_BACKOFF_INITIAL, DEFAULT_ITEM_BACKOFF_MAXIMUM, jitter=False
+            )
+        )
+        self._bucket = TokenBucket(qps, burst) if qps is not None else None
+        self._queue: deque[KeyType] = deque()
+        self._dirty: set[KeyType] = set()
+        self._processing: set[KeyType] = set()
+        # Delayed keys: a heap of (ready_at, sequence, key) plus the earliest
+        # ready time of every key. Superseded heap entries are skipped.
+        self._waiting: list[tuple[float, int, KeyType]] = []
+        self._ready_at: dict[KeyType, float] = {}
+        self._sequence = itertools.count()
+        self._failures: dict[KeyType, int] = {}
+        self._shutting_down = False
+        self._wakeup: anyio.Event | None = None
+
+    def __len__(self) -> int:
+        """The number of keys ready to be processed."""
+        return len(self._queue)
+
+    @property
+    def is_shutting_down(self) -> bool:
+        """Whether :meth:`shut_down` was called."""
+        return self._shutting_down
+
+    def add(self, key: KeyType) -> None:
+        """Queue *key* unless it is already queued."""
+        if self._shutting_down or key in self._dirty:
+            return
+        self._dirty.add(key)
+        if key not in self._processing:
+            self._queue.append(key)
+            self._notify()
+
+    def add_after(self, key: KeyType, delay: float) -> None:
+        """Queue *key* after *delay* seconds.
+
+        A key already waiting is queued at the earlier of both times.
+        """
+        if self._shutting_down:
+            return
+        if delay <= 0:
+            self.add(key)
+            return
+        ready_at = anyio.current_time() + delay
+        current = self._ready_at.get(key)
+        if current is not None and current <= ready_at:
+            return
+        self._ready_at[key] = ready_at
+        heapq.heappush(self._waiting, (ready_at, next(self._sequence), key))
+        self._notify()
+
+    def add_rate_limited(self, key: KeyType) -> None:
+        """Queue *key* after its backoff and the overall rate limit allow it.
+
+        Every call until :meth:`forget` increases the backoff of *key*.
+        """
+        if self._shutting_down:
+            return
+        failures = self._failures.get(key, 0)
+        self._failures[key] = failures + 1
+        delay = self.backoff.delay(failures)
+        if self._bucket is not None:
+            delay = max(delay, self._bucket.reserve())
+        self.add_after(key, delay)
+
+    def forget(self, key: KeyType) -> None:
+        """Reset the backoff of *key*."""
+        self._failures.pop(key, None)
+
+    def num_requeues(self, key: KeyType) -> int:
+        """The number of :meth:`add_rate_limited` calls for *key* since :meth:`forget`."""
+        return self._failures.get(key, 0)
+
+    async def get(self) -> KeyType:
+        """Wait for a key and mark it as being processed.
+
+        Every key returned must be passed to :meth:`done` once processed.
+
+        Raises:
+            anyio.EndOfStream: If the queue was shut down and no keys are left.
+        """
+        await anyio.lowlevel.checkpoint()
+        while True:
+            now = anyio.current_time()
+            self._promote(now)
+            if self._queue:
+                key = self._queue.popleft()
+                self._processing.add(key)
+                self._dirty.discard(key)
+                return key
+            if self._shutting_down:
+                raise anyio.EndOfStream
+            if self._wakeup is None:
+                self._wakeup = anyio.Event()
+            wakeup = self._wakeup
+            timeout = self._waiting[0][0] - now if self._waiting else math.inf
+            with anyio.move_on_after(timeout):
+                await wakeup.wait()
+
+    def done(self, key: KeyType) -> None:
+        """Mark *key* as processed, queueing it again if it was added meanwhile."""
+        self._processing.discard(key)
+        if key in self._dirty:
+            self._queue.append(key)
+            self._notify()
+
+    def shut_down(self) -> None:
+        """Stop accepting keys.
+
+        Keys already queued are still handed out, delayed keys are dropped.
+        :meth:`get` raises :class:`anyio.EndOfStream` once the queue is empty.
+        """
+        self._shutting_down = True
+        self._waiting.clear()
+        self._ready_at.clear()
+        self._notify()
+
+    def __aiter__(self) -> WorkQueue[KeyType]:
+        return self
+
+    async def __anext__(self) -> KeyType:
+        try:
+            return await self.get()
+        except anyio.EndOfStream:
+            raise StopAsyncIteration from None
+
+    async def add_events(
+        self,
+        events: AsyncIterable[WatchEvent[Any]],
+        key: Callable[[Any], Any] = object_key,
+    ) -> None:
+        """Queue the key of the object of every event in *events*.
+
+        Bookmarks are skipped. Works with :meth:`Api.watch`,
+        :class:`~kubex.api.ResilientWatch` and informer subscriptions.
+
+        Args:
+            events: The watch events to consume.
+            key: Compute the key of an object; :func:`~kubex.api.object_key`
+                by default.
+        """
+        async for event in events:
+            if not isinstance(event.object, Bookmark):
+                self.add(key(event.object))
+
+    async def run(self, handler: Handler[KeyType], *, workers: int = 1) -> None:
+        """Process keys with *workers* concurrent calls of *handler*.
+
+        A key whose handler raises is queued again with
+        :meth:`add_rate_limited`; on success its backoff is reset and, if the
+        handler returned a delay, it is queued again after that delay.
+        Returns once the queue is shut down and drained.
+        """
+        if workers < 1:
+            raise ValueError("WorkQueue workers must be at least 1")
+        async with anyio.create_task_group() as task_group:
+            for _ in range(workers):
+                task_group.start_soon(self._worker, handler)
+
+    async def _worker(self, handler: Handler[KeyType]) -> None:
+        async for key in self:
+            try:
+                requeue_after = await handler(key)
+            except Exception:
+                logger.warning(
+                    "Processing %r failed (attempt %d)",
+                    key,
+                    self.num_requeues(key) + 1,
+                    exc_info=True,
+                )
+                self.add_rate_limited(key)
+            else:
+                self.forget(key)
+                if requeue_after is not None:
+                    self.add_after(key, requeue_after)
+            finally:
+                self.done(key)
+
+    def _promote(self, now: float) -> None:
+        """Queue the delayed keys that are due."""
+        while self._waiting and self._waiting[0][0] <= now:
+            ready_at, _, key = heapq.heappop(self._waiting)
+            if self._ready_at.get(key) == ready_at:
+                del self._ready_at[key]
+                self.add(key)
+
+    def _notify(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+            self._wakeup = None
+
+    def __repr__(self) -> str:
+        return (
+            f"WorkQueue(queued={len(self._queue)}, processing={len(self._processing)}, "
+            f"waiting={len(self._ready_at)})"
+        )
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
-import json
 from typing import (
     AsyncGenerator,
     Generic,
+    Iterable,
     Type,
 )
 
 from pydantic import ValidationError
 
 from kubex.client.client import BaseClient, create_client
+from kubex.core import cbor
 from kubex.core.params import (
     DeleteOptions,
     DryRunTypes,
@@ -24,10 +25,12 @@ from kubex.core.params import (
     ResourceVersionTypes,
     VersionMatch,
     WatchOptions,
+    WireFormat,
 )
 from kubex.core.patch import Patch
 from kubex.core.request_builder.builder import RequestBuilder
 from kubex_core.models.list_entity import ListEntity
+from kubex_core.models.projection import project
 from kubex_core.models.status import Status
 from kubex_core.models.typing import (
     ResourceType,
@@ -35,11 +38,15 @@ from kubex_core.models.typing import (
 from kubex_core.models.watch_event import WatchEvent
 
 from ._attach import _AttachDescriptor
+from ._bulk import DEFAULT_BULK_CONCURRENCY, BulkItems, BulkOperation
+from ._coalescer import RequestCoalescer, request_key
 from ._ephemeral_containers import _EphemeralContainersDescriptor
 from ._exec import _ExecDescriptor
 from ._eviction import _EvictionDescriptor
+from ._list_stream import ListStream
 from ._logs import _LogsDescriptor
 from ._metadata import MetadataAccessor
+from ._pagination import DEFAULT_PAGE_SIZE, ListIterator
 from ._portforward import _PortforwardDescriptor
 from ._resize import _ResizeDescriptor
 from ._scale import _ScaleDescriptor
@@ -47,8 +54,12 @@ from ._status import _StatusDescriptor
 from ._protocol import (
     ApiNamespaceTypes,
     ApiRequestTimeoutTypes,
+    decode_watch_event,
     ensure_optional_namespace,
     ensure_required_namespace,
+    iter_cbor_watch_events,
+    validate_response,
+    validate_watch_event,
 )
 
 
@@ -72,11 +83,15 @@ class Api(Generic[ResourceType]):
         client: BaseClient,
         *,
         namespace: NamespaceTypes = None,
+        coalescer: RequestCoalescer | None = None,
+        wire_format: WireFormat = WireFormat.JSON,
     ) -> None:
         self._resource = resource_type
         self._client = client
+        self._coalescer = coalescer
         self._request_builder = RequestBuilder(
             resource_config=resource_type.__RESOURCE_CONFIG__,
+            wire_format=wire_format,
         )
         self._namespace = namespace
         ensure_optional_namespace(
@@ -88,6 +103,23 @@ class Api(Generic[ResourceType]):
             namespace=self._namespace,
             scope=self._resource.__RESOURCE_CONFIG__.scope,
             resource_type=self._resource,
+            coalescer=coalescer,
+        )
+
+    def _projection(self, fields: Iterable[str] | None) -> Type[ResourceType]:
+        if fields is None:
+            return self._resource
+        return project(self._resource, fields)
+
+    def _serialize(self, data: ResourceType) -> str | bytes:
+        if self._request_builder.wire_format is WireFormat.CBOR:
+            return cbor.dumps(
+                data.model_dump(
+                    mode="json", by_alias=True, exclude_unset=True, exclude_none=True
+                )
+            )
+        return data.model_dump_json(
+            by_alias=True, exclude_unset=True, exclude_none=True
         )
 
     async def get(
@@ -97,6 +129,8 @@ class Api(Generic[ResourceType]):
         namespace: ApiNamespaceTypes = Ellipsis,
         resource_version: ResourceVersionTypes = None,
         request_timeout: ApiRequestTimeoutTypes = Ellipsis,
+        fields: Iterable[str] | None = None,
+        lazy: bool = False,
     ) -> ResourceType:
         """Read the specified resource.
 
@@ -112,6 +146,12 @@ class Api(Generic[ResourceType]):
             request_timeout: HTTP-level timeout override for this call. A number is
                 interpreted as the total timeout in seconds. Pass ``None`` to disable
                 timeouts entirely for this call. Omit to use the client default.
+            fields: Only validate these fields of the resource (dotted attribute
+                paths such as ``"status.phase"``); the other fields are skipped
+                and not available on the returned object. See
+                :func:`kubex_core.models.projection.project`.
+            lazy: Validate the fields of the resource on first access instead of
+                upfront, see :func:`kubex_core.models.lazy.lazy_validate_python`.
         Returns:
             ResourceType: the resource instance.
         """
@@ -122,8 +162,16 @@ class Api(Generic[ResourceType]):
         request = self._request_builder.get(
             name, _namespace, options, request_timeout=request_timeout
         )
-        response = await self._client.request(request)
-        return self._resource.model_validate_json(response.content)
+        resource_type = self._projection(fields)
+
+        async def read() -> ResourceType:
+            response = await self._client.request(request)
+            return validate_response(resource_type, response, lazy=lazy)
+
+        if self._coalescer is None:
+            return await read()
+        key = request_key(self._client, request, resource_type, lazy)
+        return await self._coalescer.do(key, read)
 
     async def list(
         self,
@@ -137,6 +185,8 @@ class Api(Generic[ResourceType]):
         version_match: VersionMatch | None = None,
         resource_version: ResourceVersionTypes = None,
         request_timeout: ApiRequestTimeoutTypes = Ellipsis,
+        fields: Iterable[str] | None = None,
+        lazy: bool = False,
     ) -> ListEntity[ResourceType]:
         """List objects of kind.
 
@@ -160,6 +210,14 @@ class Api(Generic[ResourceType]):
             request_timeout: HTTP-level timeout override for this call. A number is
                 interpreted as the total timeout in seconds. Pass ``None`` to disable
                 timeouts entirely for this call. Omit to use the client default.
+            fields: Only validate these fields of each item (dotted attribute paths
+                such as ``"status.phase"``), skipping every other subtree of the
+                response. See :func:`kubex_core.models.projection.project`.
+            lazy: Validate the fields of each item on first access instead of
+                upfront. Reading a few fields of every item of a large list (for
+                example ``metadata.name`` and ``status.phase``) is then several
+                times faster and allocates far less than validating whole objects.
+                See :func:`kubex_core.models.lazy.lazy_validate_python`.
         Returns:
             ListEntity[ResourceType]: the list of resource.
         """
@@ -180,7 +238,132 @@ class Api(Generic[ResourceType]):
         )
         response = await self._client.request(request)
         list_model = self._resource.__RESOURCE_CONFIG__.list_model
-        return list_model.model_validate_json(response.content)
+        if fields is not None:
+            list_model = ListEntity[self._projection(fields)]  # type: ignore[misc,assignment]
+        return validate_response(list_model, response, lazy=lazy)
+
+    def list_stream(
+        self,
+        *,
+        namespace: ApiNamespaceTypes = Ellipsis,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+        timeout_seconds: int | None = None,
+        limit: int | None = None,
+        continue_token: str | None = None,
+        version_match: VersionMatch | None = None,
+        resource_version: ResourceVersionTypes = None,
+        request_timeout: ApiRequestTimeoutTypes = Ellipsis,
+    ) -> ListStream[ResourceType]:
+        """List objects of kind, parsing the items as the response arrives.
+
+        Unlike :meth:`list`, the response body is never held in memory as a
+        whole: each item is validated as soon as its JSON has been received
+        and its raw bytes are discarded, so memory use is proportional to a
+        single item rather than to the whole list. The request is sent when
+        the returned stream is iterated.
+
+        Example::
+
+            pods = api.list_stream()
+            async for pod in pods:
+                print(pod.metadata.name)
+            print(pods.metadata.resource_version)
+
+        Accepts the same arguments as :meth:`list`.
+
+        Returns:
+            ListStream[ResourceType]: an async iterable over the listed resources.
+        """
+        _namespace = ensure_optional_namespace(
+            namespace, self._namespace, self._resource.__RESOURCE_CONFIG__.scope
+        )
+        options = ListOptions(
+            label_selector=label_selector,
+            field_selector=field_selector,
+            timeout_seconds=timeout_seconds,
+            limit=limit,
+            continue_token=continue_token,
+            version_match=version_match,
+            resource_version=resource_version,
+        )
+        request = self._request_builder.list_stream(
+            _namespace, options, request_timeout=request_timeout
+        )
+        return ListStream(self._client.stream_bytes(request), self._resource)
+
+    def list_iter(
+        self,
+        *,
+        namespace: ApiNamespaceTypes = Ellipsis,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+        timeout_seconds: int | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        version_match: VersionMatch | None = None,
+        resource_version: ResourceVersionTypes = None,
+        prefetch: bool = False,
+        request_timeout: ApiRequestTimeoutTypes = Ellipsis,
+        fields: Iterable[str] | None = None,
+        lazy: bool = False,
+    ) -> ListIterator[ResourceType]:
+        """Iterate over all objects of kind, requesting them page by page.
+
+        Pages of ``limit`` items are requested one after another following the
+        ``continue`` token of the previous page, so only one page (two with
+        ``prefetch``) is held in memory at any time instead of the whole list.
+
+        Example::
+
+            async for pod in api.list_iter(label_selector="app=web"):
+                print(pod.metadata.name)
+
+            async with api.list_iter(prefetch=True) as pods:
+                async for pod in pods:
+                    print(pod.metadata.name)
+
+        Args:
+            namespace: The namespace of the namespaced resource to list. If not provided,
+                the namespace provided when creating the API will be used.
+                If namespace is provided for cluster-scoped resources, an error will be raised.
+            label_selector: A selector to restrict the list of returned objects by their labels.
+            field_selector: A selector to restrict the list of returned objects by their fields.
+            timeout_seconds: Server-side timeout (in seconds) for each page request.
+            limit: The maximum number of items per page.
+            version_match: How ``resource_version`` is applied to the first page.
+            resource_version: The resource version of the first page; the following
+                pages are served from the same snapshot by the API server.
+            prefetch: Request the next page in the background while the current one
+                is being consumed. The iterator then has to be entered with
+                ``async with``, which owns the background request and cancels
+                it when the block is left.
+            request_timeout: HTTP-level timeout override for each page request.
+            fields: Only validate these fields of each item, see :meth:`list`.
+            lazy: Validate the fields of each item on first access, see :meth:`list`.
+        Returns:
+            ListIterator[ResourceType]: An async iterator over the listed resources,
+                in the order returned by the server.
+        """
+
+        async def fetch_page(continue_token: str | None) -> ListEntity[ResourceType]:
+            # The continue token pins the snapshot of the first page; the API
+            # server rejects resourceVersion on subsequent pages.
+            first_page = continue_token is None
+            return await self.list(
+                namespace=namespace,
+                label_selector=label_selector,
+                field_selector=field_selector,
+                timeout_seconds=timeout_seconds,
+                limit=limit,
+                continue_token=continue_token,
+                version_match=version_match if first_page else None,
+                resource_version=resource_version if first_page else None,
+                request_timeout=request_timeout,
+                fields=fields,
+                lazy=lazy,
+            )
+
+        return ListIterator(fetch_page, prefetch=prefetch)
 
     async def create(
         self,
@@ -214,11 +397,11 @@ class Api(Generic[ResourceType]):
         request = self._request_builder.create(
             _namespace,
             options,
-            data.model_dump_json(by_alias=True, exclude_unset=True, exclude_none=True),
+            self._serialize(data),
             request_timeout=request_timeout,
         )
         response = await self._client.request(request)
-        return self._resource.model_validate_json(response.content)
+        return validate_response(self._resource, response)
 
     async def delete(
         self,
@@ -267,9 +450,9 @@ class Api(Generic[ResourceType]):
         )
         response = await self._client.request(request)
         try:
-            return Status.model_validate_json(response.content)
+            return validate_response(Status, response)
         except ValidationError:
-            return self._resource.model_validate_json(response.content)
+            return validate_response(self._resource, response)
 
     async def delete_collection(
         self,
@@ -325,9 +508,9 @@ class Api(Generic[ResourceType]):
         response = await self._client.request(request)
         list_model = self._resource.__RESOURCE_CONFIG__.list_model
         try:
-            return Status.model_validate_json(response.content)
+            return validate_response(Status, response)
         except ValidationError:
-            return list_model.model_validate_json(response.content)
+            return validate_response(list_model, response)
 
     async def patch(
         self,
@@ -361,7 +544,7 @@ class Api(Generic[ResourceType]):
             name, _namespace, options, patch, request_timeout=request_timeout
         )
         response = await self._client.request(request)
-        return self._resource.model_validate_json(response.content)
+        return validate_response(self._resource, response)
 
     async def replace(
         self,
@@ -388,11 +571,167 @@ class Api(Generic[ResourceType]):
             name,
             _namespace,
             options,
-            data.model_dump_json(by_alias=True, exclude_unset=True, exclude_none=True),
+            self._serialize(data),
             request_timeout=request_timeout,
         )
         response = await self._client.request(request)
-        return self._resource.model_validate_json(response.content)
+        return validate_response(self._resource, response)
+
+    def create_many(
+        self,
+        objects: BulkItems[ResourceType],
+        *,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        stop_on_error: bool = False,
+        namespace: ApiNamespaceTypes = Ellipsis,
+        dry_run: DryRunTypes = None,
+        field_manager: str | None = None,
+        request_timeout: ApiRequestTimeoutTypes = Ellipsis,
+    ) -> BulkOperation[ResourceType, ResourceType]:
+        """Create many resources with at most *concurrency* requests in flight.
+
+        Example::
+
+            async with api.create_many(config_maps, concurrency=20) as results:
+                async for result in results:
+                    if not result.ok:
+                        print(result.item.metadata.name, result.error)
+
+        Args:
+            objects: The resources to create, an iterable or an async iterable.
+                It is consumed as requests complete, so it can be a generator.
+            concurrency: The maximum number of concurrent requests.
+            stop_on_error: Stop starting requests after the first failure.
+            namespace: The namespace to create the resources in. Defaults to
+                the namespace of each object, then to the namespace of the API.
+            dry_run: Whether to perform a dry run of the operation.
+            field_manager: The field manager of the created resources.
+            request_timeout: HTTP-level timeout override for each request.
+        Returns:
+            BulkOperation: An async context manager that runs the requests;
+                iterating over it yields a ``BulkResult`` with the created
+                resource or the error of each object, in completion order.
+        """
+
+        async def create(obj: ResourceType) -> ResourceType:
+            return await self.create(
+                obj,
+                namespace=self._object_namespace(obj, namespace),
+                dry_run=dry_run,
+                field_manager=field_manager,
+                request_timeout=request_timeout,
+            )
+
+        return BulkOperation(
+            objects, create, concurrency=concurrency, stop_on_error=stop_on_error
+        )
+
+    def replace_many(
+        self,
+        objects: BulkItems[ResourceType],
+        *,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        stop_on_error: bool = False,
+        namespace: ApiNamespaceTypes = Ellipsis,
+        dry_run: DryRunTypes = None,
+        field_manager: str | None = None,
+        request_timeout: ApiRequestTimeoutTypes = Ellipsis,
+    ) -> BulkOperation[ResourceType, ResourceType]:
+        """Replace many resources, named by their ``metadata.name``.
+
+        See :meth:`create_many` for the arguments and the results.
+        """
+
+        async def replace(obj: ResourceType) -> ResourceType:
+            if obj.metadata.name is None:
+                raise ValueError("Object has no metadata.name and cannot be replaced")
+            return await self.replace(
+                obj.metadata.name,
+                obj,
+                namespace=self._object_namespace(obj, namespace),
+                dry_run=dry_run,
+                field_manager=field_manager,
+                request_timeout=request_timeout,
+            )
+
+        return BulkOperation(
+            objects, replace, concurrency=concurrency, stop_on_error=stop_on_error
+        )
+
+    def patch_many(
+        self,
+        patches: BulkItems[tuple[str, Patch]],
+        *,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        stop_on_error: bool = False,
+        namespace: ApiNamespaceTypes = Ellipsis,
+        dry_run: DryRunTypes = None,
+        field_manager: str | None = None,
+        force: bool | None = None,
+        field_validation: FieldValidation | None = None,
+        request_timeout: ApiRequestTimeoutTypes = Ellipsis,
+    ) -> BulkOperation[tuple[str, Patch], ResourceType]:
+        """Apply many ``(name, patch)`` pairs.
+
+        See :meth:`create_many` and :meth:`patch` for the arguments and the
+        results; all resources are patched in *namespace*.
+        """
+
+        async def patch(item: tuple[str, Patch]) -> ResourceType:
+            name, patch_ = item
+            return await self.patch(
+                name,
+                patch_,
+                namespace=namespace,
+                dry_run=dry_run,
+                field_manager=field_manager,
+                force=force,
+                field_validation=field_validation,
+                request_timeout=request_timeout,
+            )
+
+        return BulkOperation(
+            patches, patch, concurrency=concurrency, stop_on_error=stop_on_error
+        )
+
+    def delete_many(
+        self,
+        names: BulkItems[str],
+        *,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        stop_on_error: bool = False,
+        namespace: ApiNamespaceTypes = Ellipsis,
+        dry_run: DryRunTypes = None,
+        grace_period_seconds: int | None = None,
+        propagation_policy: PropagationPolicyTypes = None,
+        request_timeout: ApiRequestTimeoutTypes = Ellipsis,
+    ) -> BulkOperation[str, Status | ResourceType]:
+        """Delete many resources by name.
+
+        See :meth:`create_many` and :meth:`delete` for the arguments and the
+        results; all resources are deleted from *namespace*.
+        """
+
+        async def delete(name: str) -> Status | ResourceType:
+            return await self.delete(
+                name,
+                namespace=namespace,
+                dry_run=dry_run,
+                grace_period_seconds=grace_period_seconds,
+                propagation_policy=propagation_policy,
+                request_timeout=request_timeout,
+            )
+
+        return BulkOperation(
+            names, delete, concurrency=concurrency, stop_on_error=stop_on_error
+        )
+
+    def _object_namespace(
+        self, obj: ResourceType, namespace: ApiNamespaceTypes
+    ) -> ApiNamespaceTypes:
+        if namespace is Ellipsis and obj.metadata.namespace:
+            return obj.metadata.namespace
+        return namespace
 
     async def watch(
         self,
@@ -404,16 +743,24 @@ class Api(Generic[ResourceType]):
         send_initial_events: bool | None = None,
         timeout_seconds: int | None = None,
         resource_version: ResourceVersionTypes = None,
+        version_match: VersionMatch | None = None,
         request_timeout: ApiRequestTimeoutTypes = Ellipsis,
+        fields: Iterable[str] | None = None,
+        lazy: bool = False,
     ) -> AsyncGenerator[WatchEvent[ResourceType], None]:
         """Watch for changes to the specified resource.
 
         Args:
+            version_match: How ``resource_version`` is interpreted; required by the
+                API server together with ``send_initial_events``.
             request_timeout: HTTP-level timeout override for this call. A number is
                 interpreted as the total timeout in seconds. Pass ``None`` to disable
                 timeouts entirely for this call. Omit to use the client default. For
                 long-lived watches a short read/total timeout will terminate the
                 stream; disable the read timeout or leave this unset.
+            fields: Only validate these fields of each event object, see :meth:`list`.
+            lazy: Validate the fields of each event object on first access instead
+                of upfront, see :meth:`list`.
         """
         _namespace = ensure_optional_namespace(
             namespace, self._namespace, self._resource.__RESOURCE_CONFIG__.scope
@@ -424,6 +771,7 @@ class Api(Generic[ResourceType]):
             allow_bookmarks=allow_bookmarks,
             send_initial_events=send_initial_events,
             timeout_seconds=timeout_seconds,
+            version_match=version_match,
         )
         request = self._request_builder.watch(
             _namespace,
@@ -431,8 +779,73 @@ class Api(Generic[ResourceType]):
             resource_version=resource_version,
             request_timeout=request_timeout,
         )
-        async for line in self._client.stream_lines(request):
-            yield WatchEvent(self._resource, json.loads(line))
+        resource_type = self._projection(fields)
+        if self._request_builder.wire_format is WireFormat.CBOR:
+            chunks = self._client.stream_bytes(request)
+            async for raw in iter_cbor_watch_events(chunks):
+                yield validate_watch_event(resource_type, raw, lazy=lazy)
+            return
+        async for line in self._client.stream_raw_lines(request):
+            yield decode_watch_event(resource_type, line, lazy=lazy)
+
+    def watch_list(
+        self,
+        *,
+        namespace: ApiNamespaceTypes = Ellipsis,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+        timeout_seconds: int | None = None,
+        resource_version: ResourceVersionTypes = None,
+        request_timeout: ApiRequestTimeoutTypes = Ellipsis,
+        fields: Iterable[str] | None = None,
+        lazy: bool = False,
+    ) -> AsyncGenerator[WatchEvent[ResourceType], None]:
+        """Stream the current state of the resource, then keep watching it.
+
+        A "watch list" is requested with ``sendInitialEvents=true`` and
+        ``resourceVersionMatch=NotOlderThan``: the API server first sends one
+        ``ADDED`` event per existing object, then a ``BOOKMARK`` event whose
+        ``is_initial_events_end`` is true, then regular watch events. Unlike
+        ``list()`` followed by ``watch()``, neither the API server nor the
+        client ever has to hold the whole collection in memory at once.
+
+        Example::
+
+            async for event in api.watch_list():
+                if event.is_initial_events_end:
+                    print("initial sync complete")
+                elif not isinstance(event.object, Bookmark):
+                    print(event.type, event.object.metadata.name)
+
+        Requires the ``WatchList`` feature of the API server (beta and enabled
+        by default since Kubernetes 1.32).
+
+        Args:
+            namespace: The namespace to watch. If not provided, the namespace
+                provided when creating the API will be used.
+            label_selector: A selector to restrict the watched objects by their labels.
+            field_selector: A selector to restrict the watched objects by their fields.
+            timeout_seconds: Server-side timeout (in seconds) for the watch.
+            resource_version: The initial state is at least as recent as this
+                version. If omitted, the state is consistent with a quorum read.
+            request_timeout: HTTP-level timeout override for this call.
+            fields: Only validate these fields of each event object, see :meth:`list`.
+            lazy: Validate the fields of each event object on first access, see
+                :meth:`list`.
+        """
+        return self.watch(
+            namespace=namespace,
+            label_selector=label_selector,
+            field_selector=field_selector,
+            allow_bookmarks=True,
+            send_initial_events=True,
+            timeout_seconds=timeout_seconds,
+            resource_version=resource_version,
+            version_match=VersionMatch.NOT_EXACT,
+            request_timeout=request_timeout,
+            fields=fields,
+            lazy=lazy,
+        )
 
 
 async def create_api(
@@ -440,6 +853,8 @@ async def create_api(
     *,
     client: BaseClient | None = None,
     namespace: NamespaceTypes = None,
+    coalescer: RequestCoalescer | None = None,
+    wire_format: WireFormat = WireFormat.JSON,
 ) -> Api[ResourceType]:
     """Create an API for the specified resource type.
 
@@ -451,8 +866,21 @@ async def create_api(
             operations will be performed in this namespace.
             The Api namespace can be overridden by passing a
             namespace to the individual methods.
+        coalescer: Share in-flight ``get`` requests between identical
+            concurrent callers, see :class:`~kubex.api.RequestCoalescer`.
+        wire_format: Serialization of request and response bodies.
+            ``WireFormat.CBOR`` (Kubernetes 1.32+, requires ``kubex[cbor]``)
+            sends and accepts CBOR, falling back to JSON responses when the
+            API server does not serve CBOR. Patches and ``list_stream`` always
+            use JSON.
     Returns:
         An Api instance for the specified resource type.
     """
     client = client or await create_client()
-    return Api(resource_type, client=client, namespace=namespace)
+    return Api(
+        resource_type,
+        client=client,
+        namespace=namespace,
+        coalescer=coalescer,
+        wire_format=wire_format,
+    )
@@ -1,4 +1,14 @@
 from .client import BaseClient, ClientChoise, create_client
 from .options import ClientOptions
+from .rate_limit import RateLimiter, TokenBucket
+from .retry import RetryPolicy
 
-__all__ = ["create_client", "BaseClient", "ClientChoise", "ClientOptions"]
+__all__ = [
+    "create_client",
+    "BaseClient",
+    "ClientChoise",
+    "ClientOptions",
+    "RateLimiter",
+    "RetryPolicy",
+    "TokenBucket",
+]
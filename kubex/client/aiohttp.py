@@ -2,12 +2,13 @@ import contextlib
 import ssl
 import warnings
 from types import EllipsisType
-from typing import Any, AsyncGenerator, Sequence, cast
+from typing import Any, AsyncGenerator, AsyncIterator, Sequence, cast
 from urllib.parse import urlparse
 
 import anyio
 from aiohttp import (
     ClientError,
+    ClientResponse,
     ClientSession,
     ClientTimeout,
     ClientWebSocketResponse,
@@ -87,6 +88,8 @@ def _apply_aiohttp_proxy(
 
 
 class AioHttpClient(BaseClient):
+    transport_errors = (OSError, ClientError)
+
     def __init__(
         self,
         configuration: ClientConfiguration,
@@ -97,33 +100,16 @@ class AioHttpClient(BaseClient):
             constants.ACCEPT_HEADER: constants.APPLICATION_JSON_MIME_TYPE,
         }
         self._resolved_proxy: str | None = None
+        # ``True`` uses the TLS context of the connector.
+        self._ssl: ssl.SSLContext | bool = True
         super().__init__(configuration, options)
 
     @property
     def configuration(self) -> ClientConfiguration:
         return self._configuration
 
-    def _get_headers(self) -> dict[str, str]:
-        if self.configuration.token is None:
-            return {}
-        return {"Authorization": f"Bearer {self.configuration.token}"}
-
     def _create_inner_client(self) -> ClientSession:
-        ssl_context = ssl.create_default_context(
-            cafile=self.configuration.server_ca_file
-        )
-        if (client_cert := self.configuration.client_cert) is not None:
-            if isinstance(client_cert, tuple):
-                ssl_context.load_cert_chain(
-                    certfile=client_cert[0], keyfile=client_cert[1]
-                )
-            else:
-                ssl_context.load_cert_chain(certfile=client_cert)
-
-        if self.configuration.insecure_skip_tls_verify:
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-
+        ssl_context = self.configuration.create_ssl_context()
         connector_kwargs: dict[str, Any] = {"ssl": ssl_context}
 
         pool_size = self.options.pool_size
@@ -153,8 +139,19 @@ class AioHttpClient(BaseClient):
             elif not isinstance(keep_alive_timeout, EllipsisType):
                 connector_kwargs["keepalive_timeout"] = keep_alive_timeout
 
+        if self.options.http2:
+            warnings.warn(
+                "ClientOptions.http2 is set but aiohttp does not support HTTP/2; "
+                "the value is ignored on the aiohttp backend.",
+                UserWarning,
+                stacklevel=3,
+            )
+
         connector = TCPConnector(**connector_kwargs)
 
+        self._default_headers[constants.ACCEPT_ENCODING_HEADER] = (
+            self._accept_encoding()
+        )
         kwargs: dict[str, Any] = {
             "base_url": str(self.configuration.base_url),
             "connector": connector,
@@ -212,10 +209,13 @@ class AioHttpClient(BaseClient):
         kwargs["trust_env"] = self.options.trust_env and self._resolved_proxy is None
         return kwargs
 
-    async def request(self, request: Request) -> Response:
-        headers = self._get_headers()
-        if request.headers:
-            headers.update(request.headers)
+    async def _use_ssl_context(self, ssl_context: ssl.SSLContext) -> None:
+        # Pooled connections are keyed by their TLS context, so requests made
+        # with the new one open new connections while the old ones drain.
+        self._ssl = ssl_context
+
+    async def _send(self, request: Request) -> Response:
+        headers = await self._request_headers(request)
         extra: dict[str, Any] = {}
         if request.timeout is not Ellipsis:
             extra["timeout"] = _to_aiohttp_timeout(request.timeout)
@@ -225,6 +225,7 @@ class AioHttpClient(BaseClient):
             params=request.query_params,
             data=request.body,
             headers=headers,
+            ssl=self._ssl,
             **extra,
         )
         status = _response.status
@@ -237,16 +238,14 @@ class AioHttpClient(BaseClient):
             for api_warning in _response.headers.getall("warning", []):
                 for warning in api_warning.split(","):
                     warnings.warn(
-                        f"API Warning: {warning.strip()}", UserWarning, stacklevel=2
+                        f"API Warning: {warning.strip()}", UserWarning, stacklevel=3
                     )
-        if 400 <= status < 600:
-            handle_request_error(response)
         return response
 
-    async def stream_lines(self, request: Request) -> AsyncGenerator[str, None]:
-        headers = self._get_headers()
-        if request.headers:
-            headers.update(request.headers)
+    @contextlib.asynccontextmanager
+    async def _stream(self, request: Request) -> AsyncIterator[ClientResponse]:
+        await self._before_send(request)
+        headers = await self._request_headers(request)
         extra: dict[str, Any] = {}
         if request.timeout is not Ellipsis:
             extra["timeout"] = _to_aiohttp_timeout(request.timeout)
@@ -256,6 +255,7 @@ class AioHttpClient(BaseClient):
             params=request.query_params,
             data=request.body,
             headers=headers,
+            ssl=self._ssl,
             **extra,
         )
         try:
@@ -275,11 +275,25 @@ class AioHttpClient(BaseClient):
                             UserWarning,
                             stacklevel=2,
                         )
-            while line := await _response.content.readline():
-                yield line.decode("utf-8")
+            yield _response
         finally:
             _response.close()
 
+    async def stream_lines(self, request: Request) -> AsyncGenerator[str, None]:
+        async with self._stream(request) as _response:
+            while line := await _response.content.readline():
+                yield line.decode("utf-8")
+
+    async def stream_raw_lines(self, request: Request) -> AsyncGenerator[bytes, None]:
+        async with self._stream(request) as _response:
+            while line := await _response.content.readline():
+                yield line
+
+    async def stream_bytes(self, request: Request) -> AsyncGenerator[bytes, None]:
+        async with self._stream(request) as _response:
+            async for chunk in _response.content.iter_any():
+                yield chunk
+
     async def close(self) -> None:
         await self._inner_client.close()
 
@@ -288,9 +302,8 @@ class AioHttpClient(BaseClient):
         request: Request,
         subprotocols: Sequence[str],
     ) -> WebSocketConnection:
-        headers = self._get_headers()
-        if request.headers:
-            headers.update(request.headers)
+        await self._before_send(request)
+        headers = dict(await self._request_headers(request))
         # The session's default ``Accept: application/json`` is appropriate for
         # JSON API calls but the kubelet's portforward endpoint rejects it with
         # ``406 Not Acceptable``. Override per-upgrade so the WebSocket
@@ -355,6 +368,7 @@ class AioHttpClient(BaseClient):
                     protocols=tuple(subprotocols),
                     headers=headers,
                     params=params,
+                    ssl=self._ssl,
                     max_msg_size=resolve_ws_max_message_size(
                         self.options.ws_max_message_size
                     ),
@@ -1,26 +1,42 @@
 from __future__ import annotations
 
 import logging
+import ssl
+import time
 from abc import ABC, abstractmethod
 from enum import Enum
 from http import HTTPStatus
-from typing import TYPE_CHECKING, Any, AsyncGenerator, NoReturn, Sequence
+from pathlib import Path
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    ClassVar,
+    Mapping,
+    NoReturn,
+    Sequence,
+)
 
 if TYPE_CHECKING:
     from typing_extensions import Self
 
     from kubex.client.websocket import WebSocketConnection
 
+import anyio
 from pydantic import ValidationError
 
 from kubex.client.options import ClientOptions
+from kubex.client.retry import PF_FLOW_SCHEMA_HEADER, PF_PRIORITY_LEVEL_HEADER
 from kubex.configuration import ClientConfiguration
 from kubex.configuration.file_config import configure_from_kubeconfig
 from kubex.configuration.incluster_config import configure_from_pod_env
-from kubex.core import exceptions
+from kubex.core import cbor, exceptions
 from kubex.core.request import Request
 from kubex.core.request_builder.constants import (
+    APPLICATION_CBOR_MIME_TYPE,
     APPLICATION_JSON_MIME_TYPE,
+    AUTHORIZATION_HEADER,
     CONTENT_TYPE_HEADER,
 )
 from kubex.core.response import Response
@@ -47,6 +63,22 @@ class ClientChoise(str, Enum):
 
 
 class BaseClient(ABC):
+    """Base class of the HTTP client backends.
+
+    Backends implement :meth:`_send` to send a single request.
+    :meth:`request` wraps it with the rate limiter, the certificate reload
+    check and the retries of the configured retry policy; a subclass that
+    overrides :meth:`request` itself skips all three.
+    """
+
+    transport_errors: ClassVar[tuple[type[Exception], ...]] = (OSError,)
+    """Exception types signalling a transient connection failure.
+
+    Raised when the connection to the API server fails or drops, as opposed
+    to an error response from the API server. Callers use them to decide
+    whether an operation can be retried.
+    """
+
     def __init__(
         self,
         configuration: ClientConfiguration,
@@ -55,6 +87,15 @@ class BaseClient(ABC):
         super().__init__()
         self._configuration = configuration
         self._options = options if options is not None else ClientOptions()
+        self._authorization: str | None = None
+        self._auth_headers: Mapping[str, str] = MappingProxyType({})
+        self._certificate_stamps = (
+            _file_stamps(configuration.certificate_files)
+            if self._options.certificate_reload_interval is not None
+            else []
+        )
+        self._certificates_checked_at = time.monotonic()
+        self._checking_certificates = False
         self._inner_client: Any = self._create_inner_client()
 
     @property
@@ -64,6 +105,79 @@ class BaseClient(ABC):
     @abstractmethod
     def _create_inner_client(self) -> Any: ...
 
+    def _accept_encoding(self) -> str:
+        """The ``Accept-Encoding`` header selected by the compression settings."""
+        compression = self._options.compression
+        if compression is None:
+            compression = not self._configuration.disable_compression
+        return "gzip" if compression else "identity"
+
+    async def _request_headers(self, request: Request) -> Mapping[str, str]:
+        """The headers to send with *request*: authorization plus its own headers.
+
+        The authorization headers are only rebuilt when the token changes and
+        are shared, read-only, by all requests without headers of their own.
+        """
+        if (token_provider := self._configuration.token_provider) is not None:
+            authorization: str | None = await token_provider.to_header()
+        else:
+            token = await self._configuration.get_token()
+            authorization = None if token is None else f"Bearer {token}"
+        if authorization != self._authorization:
+            self._authorization = authorization
+            self._auth_headers = MappingProxyType(
+                {} if authorization is None else {AUTHORIZATION_HEADER: authorization}
+            )
+        if not request.headers:
+            return self._auth_headers
+        return {**self._auth_headers, **request.headers}
+
+    async def _before_send(self, request: Request) -> None:
+        """Wait for the rate limiter and pick up rotated certificates before *request*."""
+        if (rate_limiter := self._options.rate_limiter) is not None:
+            await rate_limiter.acquire(request)
+        if self._options.certificate_reload_interval is not None:
+            await self._check_certificates(self._options.certificate_reload_interval)
+
+    async def _check_certificates(self, interval: float) -> None:
+        if (
+            self._checking_certificates
+            or time.monotonic() - self._certificates_checked_at < interval
+        ):
+            return
+        self._checking_certificates = True
+        try:
+            files = self._configuration.certificate_files
+            stamps = await anyio.to_thread.run_sync(_file_stamps, files)
+            if stamps != self._certificate_stamps:
+                await self.reload_certificates()
+                self._certificate_stamps = stamps
+        except Exception:
+            # Files are often replaced one by one; retry after the next interval.
+            logger.warning("Failed to reload the TLS certificates", exc_info=True)
+        finally:
+            self._certificates_checked_at = time.monotonic()
+            self._checking_certificates = False
+
+    async def reload_certificates(self) -> None:
+        """Reload the CA and client certificate files of the configuration.
+
+        The new TLS context is built in a worker thread and used for new
+        connections. Open connections, including running watches and log
+        streams, keep their certificates until they close.
+        """
+        if not self._configuration.certificate_files:
+            return
+        ssl_context = await anyio.to_thread.run_sync(
+            self._configuration.create_ssl_context
+        )
+        await self._use_ssl_context(ssl_context)
+        logger.info("Reloaded the TLS certificates")
+
+    async def _use_ssl_context(self, ssl_context: ssl.SSLContext) -> None:
+        """Use *ssl_context* for the connections opened from now on."""
+        raise NotImplementedError("Certificate reload not supported by this client")
+
     async def __aenter__(self) -> Self:
         await self._inner_client.__aenter__()
         return self
@@ -76,14 +190,64 @@ class BaseClient(ABC):
     ) -> None:
         await self._inner_client.__aexit__(exc_type, exc_value, traceback)
 
-    @abstractmethod
     async def request(self, request: Request) -> Response:
-        pass
+        """Send *request* and return its response.
+
+        Error responses raise the matching
+        :class:`~kubex.core.exceptions.KubexApiError`, after the retries the
+        configured :class:`~kubex.client.retry.RetryPolicy` allows.
+        """
+        retry_policy = self._options.retry_policy
+        attempt = 1
+        while True:
+            await self._before_send(request)
+            response = await self._send(request)
+            if not 400 <= response.status_code < 600:
+                return response
+            delay = (
+                retry_policy.retry_delay(request, response, attempt)
+                if retry_policy is not None
+                else None
+            )
+            if delay is None:
+                handle_request_error(response)
+            logger.debug(
+                "Retrying %s %s in %.2fs after status %s (attempt %d, "
+                "flow schema %s, priority level %s)",
+                request.method,
+                request.url,
+                delay,
+                response.status_code,
+                attempt,
+                response.headers.get(PF_FLOW_SCHEMA_HEADER),
+                response.headers.get(PF_PRIORITY_LEVEL_HEADER),
+            )
+            await anyio.sleep(delay)
+            attempt += 1
+
+    @abstractmethod
+    async def _send(self, request: Request) -> Response:
+        """Send *request* once and return its response, errors included."""
 
     @abstractmethod
     def stream_lines(self, request: Request) -> AsyncGenerator[str, None]:
         pass
 
+    async def stream_raw_lines(self, request: Request) -> AsyncGenerator[bytes, None]:
+        """Stream the response lines of *request* as undecoded bytes.
+
+        Lets parsers that accept bytes (such as pydantic's JSON validation)
+        skip decoding every line to ``str``. The default implementation
+        encodes the lines of :meth:`stream_lines`; backends override it to
+        avoid the round-trip.
+        """
+        async for line in self.stream_lines(request):
+            yield line.encode("utf-8")
+
+    def stream_bytes(self, request: Request) -> AsyncGenerator[bytes, None]:
+        """Stream the raw response body of *request* in chunks as they arrive."""
+        raise NotImplementedError("Byte streaming not supported by this client")
+
     @abstractmethod
     async def close(self) -> None:
         pass
@@ -105,6 +269,18 @@ class BaseClient(ABC):
         raise NotImplementedError("WebSocket not supported by this client")
 
 
+def _file_stamps(files: Sequence[Path]) -> list[tuple[int, int]]:
+    """Identify the current contents of *files* by inode and modification time.
+
+    Mounted secrets are updated by swapping a symlink, which changes the inode.
+    """
+    stamps = []
+    for file in files:
+        stat = file.stat()
+        stamps.append((stat.st_ino, stat.st_mtime_ns))
+    return stamps
+
+
 async def create_client(
     configuration: ClientConfiguration | None = None,
     client_class: ClientChoise = ClientChoise.AUTO,
@@ -141,13 +317,24 @@ async def create_client(
 
 def handle_request_error(response: Response) -> NoReturn:
     status_code = response.status_code
-    content: Status | str = response.text
-    if content_types := response.headers.get_all(CONTENT_TYPE_HEADER):
-        if any(ct.startswith(APPLICATION_JSON_MIME_TYPE) for ct in content_types):
-            try:
-                content = Status.model_validate_json(response.content)
-            except ValidationError:
-                content = response.text
+    content_types = response.headers.get_all(CONTENT_TYPE_HEADER)
+    if any(ct.startswith(APPLICATION_CBOR_MIME_TYPE) for ct in content_types):
+        try:
+            content: Status | str = Status.model_validate(cbor.loads(response.content))
+        except ValueError:
+            content = response.content.decode("utf-8", errors="replace")
+        raise_for_status(status_code, content)
+    content = response.text
+    if any(ct.startswith(APPLICATION_JSON_MIME_TYPE) for ct in content_types):
+        try:
+            content = Status.model_validate_json(response.content)
+        except ValidationError:
+            content = response.text
+    raise_for_status(status_code, content)
+
+
+def raise_for_status(status_code: int, content: Status | str) -> NoReturn:
+    """Raise the :class:`~kubex.core.exceptions.KubexApiError` matching *status_code*."""
     match status_code:
         case HTTPStatus.BAD_REQUEST:
             raise exceptions.BadRequest(content=content)
@@ -5,11 +5,21 @@ import netrc
 import os
 import ssl
 import warnings
-from contextlib import AbstractAsyncContextManager
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from types import EllipsisType
-from typing import TYPE_CHECKING, Any, AsyncGenerator, Sequence, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Sequence,
+    cast,
+)
 from urllib.parse import urlparse
 
+import anyio
 import httpx
 
 from kubex.client.options import ClientOptions, resolve_ws_max_message_size
@@ -18,6 +28,7 @@ from kubex.configuration import ClientConfiguration
 from kubex.core.exceptions import ConfgiurationError, KubexClientException
 from kubex.core.params import Timeout
 from kubex.core.request import Request
+from kubex.core.request_builder.constants import ACCEPT_ENCODING_HEADER
 from kubex.core.response import HeadersWrapper, Response
 
 from .client import (
@@ -73,6 +84,7 @@ def _build_httpx_proxy_kwargs(
     proxy: str | dict[str, str] | None,
     verify: ssl.SSLContext | bool,
     limits: httpx.Limits | None = None,
+    http2: bool = False,
 ) -> dict[str, Any]:
     """Build proxy-related kwargs for ``httpx.AsyncClient``.
 
@@ -84,6 +96,7 @@ def _build_httpx_proxy_kwargs(
     When ``limits`` is provided it is applied to each per-scheme transport so
     that pool-size and keep-alive settings take effect for proxied traffic too.
     Without this, mounted transports ignore the client-level ``Limits`` object.
+    ``http2`` is forwarded the same way.
     """
     if proxy is None:
         return {}
@@ -92,6 +105,8 @@ def _build_httpx_proxy_kwargs(
     transport_kw: dict[str, Any] = {"verify": verify}
     if limits is not None:
         transport_kw["limits"] = limits
+    if http2:
+        transport_kw["http2"] = True
     return {
         "mounts": {
             f"{scheme}://": httpx.AsyncHTTPTransport(proxy=url, **transport_kw)
@@ -249,46 +264,35 @@ def _resolve_env_proxy_with_netrc(base_url: str) -> dict[str, Any]:
 
 
 class HttpxClient(BaseClient):
+    transport_errors = (OSError, httpx.TransportError)
+
     def __init__(
         self,
         configuration: ClientConfiguration,
         options: ClientOptions | None = None,
     ) -> None:
+        self._websocket_client_kwargs: dict[str, Any] | None = None
+        self._websocket_client: httpx.AsyncClient | None = None
+        self._client_kwargs: dict[str, Any] = {}
+        # Requests, streams and WebSocket connections running on each client,
+        # so clients replaced by a certificate reload are closed once idle.
+        self._in_flight: dict[httpx.AsyncClient, int] = {}
+        self._retired_clients: set[httpx.AsyncClient] = set()
         super().__init__(configuration, options)
 
     @property
     def configuration(self) -> ClientConfiguration:
         return self._configuration
 
-    def _get_headers(self) -> dict[str, str]:
-        if self.configuration.token is None:
-            return {}
-        return {"Authorization": f"Bearer {self.configuration.token}"}
-
     def _create_inner_client(self) -> httpx.AsyncClient:
-        cafile = (
-            str(self.configuration.server_ca_file)
-            if self.configuration.server_ca_file
-            else None
-        )
-        client_cert = self.configuration.client_cert
         needs_custom_ssl = bool(
-            cafile or self.configuration.insecure_skip_tls_verify or client_cert
+            self.configuration.server_ca_file
+            or self.configuration.insecure_skip_tls_verify
+            or self.configuration.client_cert
         )
         _verify: ssl.SSLContext | bool
         if needs_custom_ssl:
-            ssl_context = ssl.create_default_context(cafile=cafile)
-            if client_cert is not None:
-                if isinstance(client_cert, tuple):
-                    ssl_context.load_cert_chain(
-                        certfile=client_cert[0], keyfile=client_cert[1]
-                    )
-                else:
-                    ssl_context.load_cert_chain(certfile=client_cert)
-            if self.configuration.insecure_skip_tls_verify:
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-            _verify = ssl_context
+            _verify = self.configuration.create_ssl_context()
         else:
             # No custom TLS settings — let httpx use its default trust bundle
             # (certifi), which is consistent with the pre-ClientOptions behavior.
@@ -297,6 +301,7 @@ class HttpxClient(BaseClient):
         kwargs: dict[str, Any] = {
             "base_url": str(self.configuration.base_url),
             "verify": _verify,
+            "headers": {ACCEPT_ENCODING_HEADER: self._accept_encoding()},
         }
         configured_timeout = self.options.timeout
         if configured_timeout is not Ellipsis:
@@ -339,7 +344,13 @@ class HttpxClient(BaseClient):
         else:
             kwargs["trust_env"] = False
 
-        kwargs.update(_build_httpx_proxy_kwargs(self.options.proxy, _verify, limits))
+        if self.options.http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError as exc:
+                raise ConfgiurationError(
+                    "h2 is required for HTTP/2; install kubex[http2]"
+                ) from exc
 
         if not isinstance(self.options.buffer_size, EllipsisType):
             warnings.warn(
@@ -366,23 +377,65 @@ class HttpxClient(BaseClient):
                 stacklevel=3,
             )
 
+        self._client_kwargs = kwargs
+        return self._build_client(_verify)
+
+    def _build_client(self, verify: ssl.SSLContext | bool) -> httpx.AsyncClient:
+        """Create a client verifying the server with *verify*."""
+        kwargs = {**self._client_kwargs, "verify": verify}
+        limits = kwargs.get("limits")
+        http2 = self.options.http2
+        if http2:
+            # WebSocket upgrades are HTTP/1.1 only; keep what is needed to
+            # open a separate HTTP/1.1 client for them on first use.
+            self._websocket_client_kwargs = {
+                **kwargs,
+                **_build_httpx_proxy_kwargs(self.options.proxy, verify, limits),
+            }
+            kwargs["http2"] = True
+        kwargs.update(
+            _build_httpx_proxy_kwargs(self.options.proxy, verify, limits, http2)
+        )
         return httpx.AsyncClient(**kwargs)
 
-    async def request(self, request: Request) -> Response:
-        headers = self._get_headers()
-        if request.headers:
-            headers.update(request.headers)
+    def _acquire(self, client: httpx.AsyncClient) -> httpx.AsyncClient:
+        self._in_flight[client] = self._in_flight.get(client, 0) + 1
+        return client
+
+    async def _release(self, client: httpx.AsyncClient) -> None:
+        remaining = self._in_flight[client] - 1
+        if remaining:
+            self._in_flight[client] = remaining
+            return
+        del self._in_flight[client]
+        if client in self._retired_clients:
+            self._retired_clients.discard(client)
+            with anyio.CancelScope(shield=True):
+                await client.aclose()
+
+    @asynccontextmanager
+    async def _lease(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Use the current client, keeping it open until the block is left."""
+        client = self._acquire(self._inner_client)
+        try:
+            yield client
+        finally:
+            await self._release(client)
+
+    async def _send(self, request: Request) -> Response:
+        headers = await self._request_headers(request)
         extra: dict[str, Any] = {}
         if request.timeout is not Ellipsis:
             extra["timeout"] = _to_httpx_timeout(request.timeout)
-        _response = await self._inner_client.request(
-            method=request.method,
-            url=request.url,
-            params=request.query_params,
-            content=request.body,
-            headers=headers,
-            **extra,
-        )
+        async with self._lease() as client:
+            _response = await client.request(
+                method=request.method,
+                url=request.url,
+                params=request.query_params,
+                content=request.body,
+                headers=headers,
+                **extra,
+            )
         status = _response.status_code
         response = Response(
             status_code=status,
@@ -394,27 +447,28 @@ class HttpxClient(BaseClient):
         ):
             for warning in api_warnings.split(","):
                 warnings.warn(
-                    f"API Warning: {warning.strip()}", UserWarning, stacklevel=2
+                    f"API Warning: {warning.strip()}", UserWarning, stacklevel=3
                 )
-        if 400 <= status < 600:
-            handle_request_error(response)
         return response
 
-    async def stream_lines(self, request: Request) -> AsyncGenerator[str, None]:
-        headers = self._get_headers()
-        if request.headers:
-            headers.update(request.headers)
+    @asynccontextmanager
+    async def _stream(self, request: Request) -> AsyncIterator[httpx.Response]:
+        await self._before_send(request)
+        headers = await self._request_headers(request)
         extra: dict[str, Any] = {}
         if request.timeout is not Ellipsis:
             extra["timeout"] = _to_httpx_timeout(request.timeout)
-        async with self._inner_client.stream(
-            method=request.method,
-            url=request.url,
-            params=request.query_params,
-            content=request.body,
-            headers=headers,
-            **extra,
-        ) as _response:
+        async with (
+            self._lease() as client,
+            client.stream(
+                method=request.method,
+                url=request.url,
+                params=request.query_params,
+                content=request.body,
+                headers=headers,
+                **extra,
+            ) as _response,
+        ):
             status = _response.status_code
             if 400 <= status < 600:
                 response = Response(
@@ -432,17 +486,99 @@ class HttpxClient(BaseClient):
                         UserWarning,
                         stacklevel=2,
                     )
+            yield _response
+
+    async def stream_lines(self, request: Request) -> AsyncGenerator[str, None]:
+        async with self._stream(request) as _response:
             async for line in _response.aiter_lines():
                 yield line
 
+    async def stream_raw_lines(self, request: Request) -> AsyncGenerator[bytes, None]:
+        async with self._stream(request) as _response:
+            # Parts of a line spanning several chunks are joined once the line
+            # is complete, so long lines are not copied once per chunk.
+            pending: list[bytes] = []
+            async for chunk in _response.aiter_bytes():
+                start = 0
+                while (end := chunk.find(b"\n", start)) != -1:
+                    pending.append(chunk[start:end])
+                    yield b"".join(pending)
+                    pending.clear()
+                    start = end + 1
+                if start < len(chunk):
+                    pending.append(chunk[start:])
+            if pending:
+                yield b"".join(pending)
+
+    async def stream_bytes(self, request: Request) -> AsyncGenerator[bytes, None]:
+        async with self._stream(request) as _response:
+            async for chunk in _response.aiter_bytes():
+                yield chunk
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: Any | None = None,
+    ) -> None:
+        try:
+            await super().__aexit__(exc_type, exc_value, traceback)
+        finally:
+            await self._close_other_clients()
+
     async def close(self) -> None:
-        await self._inner_client.aclose()
+        try:
+            await self._inner_client.aclose()
+        finally:
+            await self._close_other_clients()
+
+    async def _close_other_clients(self) -> None:
+        try:
+            await self._close_websocket_client()
+        finally:
+            retired, self._retired_clients = self._retired_clients, set()
+            for client in retired:
+                await client.aclose()
+
+    async def _use_ssl_context(self, ssl_context: ssl.SSLContext) -> None:
+        # httpx cannot swap the TLS context of a client: new requests go to a
+        # new client, and the old ones are closed once their requests,
+        # streams and WebSocket connections are done.
+        old_clients = [self._inner_client, self._websocket_client]
+        self._inner_client = self._build_client(ssl_context)
+        self._websocket_client = None
+        for client in old_clients:
+            if client is None:
+                continue
+            if client in self._in_flight:
+                self._retired_clients.add(client)
+            else:
+                await client.aclose()
+
+    def _get_websocket_client(self) -> httpx.AsyncClient:
+        """Return the client WebSocket upgrades are sent through.
+
+        That is the main client, unless it negotiates HTTP/2: the upgrade then
+        goes through a lazily created HTTP/1.1 client with the same settings.
+        """
+        if self._websocket_client_kwargs is None:
+            inner_client: httpx.AsyncClient = self._inner_client
+            return inner_client
+        if self._websocket_client is None:
+            self._websocket_client = httpx.AsyncClient(**self._websocket_client_kwargs)
+        return self._websocket_client
+
+    async def _close_websocket_client(self) -> None:
+        if self._websocket_client is not None:
+            websocket_client, self._websocket_client = self._websocket_client, None
+            await websocket_client.aclose()
 
     async def connect_websocket(
         self,
         request: Request,
         subprotocols: Sequence[str],
     ) -> WebSocketConnection:
+        await self._before_send(request)
         try:
             import httpx_ws
         except ImportError as exc:
@@ -451,9 +587,8 @@ class HttpxClient(BaseClient):
                 "install kubex[httpx-ws]"
             ) from exc
 
-        headers = self._get_headers()
-        if request.headers:
-            headers.update(request.headers)
+        # httpx-ws adds the upgrade headers to the mapping it is given.
+        headers = dict(await self._request_headers(request))
 
         params: Any = (
             request.query_param_pairs
@@ -468,9 +603,10 @@ class HttpxClient(BaseClient):
         ws_opt = self.options.ws_max_message_size
         if ws_opt is not None:
             extra["max_message_size_bytes"] = resolve_ws_max_message_size(ws_opt)
+        client = self._acquire(self._get_websocket_client())
         cm: AbstractAsyncContextManager[AsyncWebSocketSession] = httpx_ws.aconnect_ws(
             request.url,
-            client=self._inner_client,
+            client=client,
             subprotocols=list(subprotocols) if subprotocols else None,
             headers=headers,
             params=params,
@@ -478,38 +614,46 @@ class HttpxClient(BaseClient):
         )
 
         try:
-            session = await cm.__aenter__()
-        except httpx_ws.WebSocketUpgradeError as exc:
-            raise KubexClientException(f"WebSocket handshake failed: {exc}") from exc
-        except httpx.TimeoutException as exc:
-            # Normalize to KubexClientException for symmetry with the aiohttp
-            # backend, so callers using ``request_timeout`` see consistent
-            # error types regardless of the underlying HTTP client.
-            raise KubexClientException("WebSocket handshake timed out") from exc
-        except httpx.HTTPError as exc:
-            # Catches transport-level failures (``ConnectError``, ``NetworkError``,
-            # TLS / DNS / proxy errors, etc.) so callers see a uniform exec
-            # exception type regardless of whether the upgrade failed during
-            # connect, handshake, or read. Ordered after ``TimeoutException``
-            # because that is also an ``HTTPError`` subclass.
-            raise KubexClientException(f"WebSocket connection failed: {exc}") from exc
-
-        if subprotocols and session.subprotocol is None:
-            # Suppress any cleanup error so the descriptive subprotocol
-            # mismatch is what the caller sees, rather than a transport
-            # close failure masking the real diagnosis. ``except Exception``
-            # (not ``BaseException``) so a ``Cancelled`` raised during the
-            # close propagates and cooperative cancellation is not dropped.
             try:
-                await cm.__aexit__(None, None, None)
-            except Exception:
-                pass
-            raise KubexClientException(
-                "Server did not negotiate any of the requested subprotocols: "
-                f"{list(subprotocols)}"
-            )
+                session = await cm.__aenter__()
+            except httpx_ws.WebSocketUpgradeError as exc:
+                raise KubexClientException(
+                    f"WebSocket handshake failed: {exc}"
+                ) from exc
+            except httpx.TimeoutException as exc:
+                # Normalize to KubexClientException for symmetry with the aiohttp
+                # backend, so callers using ``request_timeout`` see consistent
+                # error types regardless of the underlying HTTP client.
+                raise KubexClientException("WebSocket handshake timed out") from exc
+            except httpx.HTTPError as exc:
+                # Catches transport-level failures (``ConnectError``, ``NetworkError``,
+                # TLS / DNS / proxy errors, etc.) so callers see a uniform exec
+                # exception type regardless of whether the upgrade failed during
+                # connect, handshake, or read. Ordered after ``TimeoutException``
+                # because that is also an ``HTTPError`` subclass.
+                raise KubexClientException(
+                    f"WebSocket connection failed: {exc}"
+                ) from exc
+
+            if subprotocols and session.subprotocol is None:
+                # Suppress any cleanup error so the descriptive subprotocol
+                # mismatch is what the caller sees, rather than a transport
+                # close failure masking the real diagnosis. ``except Exception``
+                # (not ``BaseException``) so a ``Cancelled`` raised during the
+                # close propagates and cooperative cancellation is not dropped.
+                try:
+                    await cm.__aexit__(None, None, None)
+                except Exception:
+                    pass
+                raise KubexClientException(
+                    "Server did not negotiate any of the requested subprotocols: "
+                    f"{list(subprotocols)}"
+                )
 
-        return HttpxWebSocketConnection(cm, session)
+        except BaseException:
+            await self._release(client)
+            raise
+        return HttpxWebSocketConnection(cm, session, lambda: self._release(client))
 
 
 class HttpxWebSocketConnection(WebSocketConnection):
@@ -519,9 +663,11 @@ class HttpxWebSocketConnection(WebSocketConnection):
         self,
         cm: AbstractAsyncContextManager[AsyncWebSocketSession],
         session: AsyncWebSocketSession,
+        on_close: Callable[[], Awaitable[None]] | None = None,
     ) -> None:
         self._cm = cm
         self._session = session
+        self._on_close = on_close
         # ``_eof`` short-circuits further ``receive_bytes()`` calls once the
         # peer closes or the transport breaks. ``_cm_exited`` guards the
         # underlying ``httpx_ws`` context manager so its ``__aexit__`` runs
@@ -607,3 +753,6 @@ class HttpxWebSocketConnection(WebSocketConnection):
             await self._cm.__aexit__(None, None, None)
         except HTTPXWSException:
             pass
+        finally:
+            if self._on_close is not None:
+                await self._on_close()
@@ -4,6 +4,8 @@ from types import EllipsisType
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from kubex.client.rate_limit import RateLimiter
+from kubex.client.retry import RetryPolicy
 from kubex.core.params import Timeout, TimeoutTypes
 
 
@@ -225,6 +227,81 @@ class ClientOptions(BaseModel):
     aiohttp's native per-request env lookup.
     """
 
+    rate_limiter: RateLimiter | None = None
+    """Client-side throttling of the requests sent to the API server.
+
+    Accepted values:
+
+    - ``None`` (default) — requests are sent as soon as they are made.
+    - :class:`~kubex.client.rate_limit.RateLimiter` — every request, stream
+      and WebSocket connection first takes a token from the limiter's
+      token buckets, e.g. ``RateLimiter(qps=5, burst=10)`` (client-go's
+      defaults). Clients created with the same limiter share its budget.
+    """
+
+    compression: bool | None = None
+    """Whether to ask the API server for gzip-compressed response bodies.
+
+    Accepted values:
+
+    - ``None`` (default) — follow the configuration: compression is requested
+      unless the kubeconfig cluster sets ``disable-compression: true``.
+    - ``True`` — always send ``Accept-Encoding: gzip``.
+    - ``False`` — send ``Accept-Encoding: identity``. Saves the compression
+      (server) and decompression (client) time on fast links, e.g. for
+      in-cluster clients reading large lists.
+
+    The API server only compresses responses larger than 128 KiB, so small
+    responses are never compressed either way. Compressed bodies, including
+    watch and log streams, are decompressed chunk by chunk as they arrive.
+    """
+
+    http2: bool = False
+    """Whether the httpx backend negotiates HTTP/2 with the API server.
+
+    With HTTP/2, concurrent requests, watches and log streams are multiplexed
+    as streams over a few shared connections instead of one TCP and TLS
+    connection each. Requires the ``h2`` package (``pip install kubex[http2]``).
+
+    A connection carries at most as many concurrent streams as the server
+    allows (``--http2-max-streams-per-connection`` of the API server); beyond
+    that another connection is opened, up to ``pool_size`` connections. Once
+    every stream of every connection is in use, new requests wait for a free
+    stream for up to ``Timeout.pool`` and then raise ``httpx.PoolTimeout``.
+
+    WebSocket connections (``exec``, ``attach``, ``portforward``) always use
+    HTTP/1.1. The aiohttp backend does not support HTTP/2; a
+    :class:`UserWarning` is emitted there and the value is ignored.
+    """
+
+    certificate_reload_interval: float | None = Field(None, gt=0)
+    """Seconds between checks of the certificate files for rotation.
+
+    When set, the first request after each interval compares the modification
+    times of the CA, client certificate and client key files of the
+    configuration. If they changed, a new TLS context is built in a worker
+    thread and used for new connections; open connections, including running
+    watches, keep the old one until they close. Concurrent requests never wait
+    for the check. ``None`` (default) disables the checks; call
+    :meth:`~kubex.client.client.BaseClient.reload_certificates` to reload
+    explicitly instead.
+    """
+
+    retry_policy: RetryPolicy | None = None
+    """Retrying of requests the API server rejected with a transient error.
+
+    Accepted values:
+
+    - ``None`` (default) — every error response is raised right away.
+    - :class:`~kubex.client.retry.RetryPolicy` — responses such as
+      ``429 Too Many Requests`` and ``503 Service Unavailable`` are retried
+      after the ``Retry-After`` delay sent by the API server, or after a
+      jittered exponential backoff, e.g. ``RetryPolicy(max_attempts=4)``.
+      Only idempotent requests are retried after a server error; ``429`` is
+      retried for every request. Streams and WebSocket connections are not
+      retried.
+    """
+
     @field_validator("trust_env", mode="before")
     @classmethod
     def _normalize_trust_env(cls, value: object) -> object:
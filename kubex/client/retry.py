@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import email.utils
+import math
+import time
+from http import HTTPStatus
+from typing import Iterable
+
+from kubex.core.backoff import Backoff
+from kubex.core.request import Request
+from kubex.core.response import Response
+
+RETRY_AFTER_HEADER = "retry-after"
+PF_FLOW_SCHEMA_HEADER = "x-kubernetes-pf-flowschema-uid"
+PF_PRIORITY_LEVEL_HEADER = "x-kubernetes-pf-prioritylevel-uid"
+
+DEFAULT_RETRY_STATUSES = frozenset(
+    (
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.INTERNAL_SERVER_ERROR,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    )
+)
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+
+
+class RetryPolicy:
+    """When and how long to wait before retrying a failed request.
+
+    A response with one of *statuses* is retried after a delay, up to
+    *max_attempts* attempts in total. The delay is the ``Retry-After`` the
+    API server asked for (it sends one with ``429`` responses, e.g. when API
+    Priority and Fairness rejects a request, and while it is shutting down);
+    without one, the delay comes from *backoff*.
+
+    Only requests with one of the idempotent *methods* are retried after an
+    error, as a non-idempotent request (``POST``, ``PATCH``) may have been
+    applied before the error was returned. ``429 Too Many Requests`` is the
+    exception: it is sent before the request is processed, so it is retried
+    for every method.
+
+    Args:
+        max_attempts: Attempts per request, including the first one.
+        backoff: Delays between attempts when the response carries no
+            ``Retry-After``. Defaults to ``Backoff()``.
+        statuses: Response statuses that are retried.
+        methods: HTTP methods retried for statuses other than ``429``.
+        max_retry_after: Give up instead of waiting when ``Retry-After`` asks
+            for a longer delay, in seconds.
+    """
+
+    __slots__ = ("max_attempts", "backoff", "statuses", "methods", "max_retry_after")
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        *,
+        backoff: Backoff | None = None,
+        statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        methods: Iterable[str] = IDEMPOTENT_METHODS,
+        max_retry_after: float = 60.0,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("RetryPolicy max_attempts must be at least 1")
+        if max_retry_after < 0:
+            raise ValueError("RetryPolicy max_retry_after must not be negative")
+        self.max_attempts = max_attempts
+        self.backoff = backoff if backoff is not None else Backoff()
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.max_retry_after = max_retry_after
+
+    def retry_delay(
+        self, request: Request, response: Response, attempt: int
+    ) -> float | None:
+        """Return the delay before retrying *request*, ``None`` to give up.
+
+        *attempt* is the number of the attempt that got *response*, starting
+        at 1.
+        """
+        status = response.status_code
+        if attempt >= self.max_attempts or status not in self.statuses:
+            return None
+        if (
+            status != HTTPStatus.TOO_MANY_REQUESTS
+            and request.method.upper() not in self.methods
+        ):
+            return None
+        retry_after = parse_retry_after(response.headers.get(RETRY_AFTER_HEADER))
+        if retry_after is None:
+            return self.backoff.delay(attempt - 1)
+        if retry_after > self.max_retry_after:
+            return None
+        return retry_after
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryPolicy(max_attempts={self.max_attempts!r}, backoff={self.backoff!r}, "
+            f"statuses={sorted(self.statuses)!r}, methods={sorted(self.methods)!r}, "
+            f"max_retry_after={self.max_retry_after!r})"
+        )
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header (seconds or an HTTP date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            date = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        seconds = date.timestamp() - time.time()
+    if math.isnan(seconds):
+        return None
+    return max(seconds, 0.0)
@@ -1,5 +1,6 @@
 import os
 import sys
+import typing
 
 import anyio
 from pydantic import Field
@@ -30,6 +31,8 @@ class ExecAuthProvider:
     def __init__(self, config: ExecConfig):
         self.config = config
         self.env = os.environ.copy()
+        for variable in config.env or []:
+            self.env[variable["name"]] = variable["value"]
 
     async def run(self) -> ExecCredential:
         _interactive = False
@@ -68,8 +71,12 @@ class ExecAuthProvider:
 
         return ExecCredential.model_validate_json(stdout)
 
-    async def refresh_token(self) -> str:
+    async def refresh_credential(self) -> ExecCredentialStatus:
         credential = await self.run()
         if credential.status is None or credential.status.token is None:
             raise ValueError("exec: token not found in response")
-        return credential.status.token
+        return credential.status
+
+    async def refresh_token(self) -> str:
+        status = await self.refresh_credential()
+        return typing.cast(str, status.token)
@@ -61,8 +61,19 @@ class OIDCAuthProvider:
                     return response
         raise ValueError("OIDC token request failed: no auth style succeeded")
 
+    def _client_secret(self) -> str:
+        secret = self.config.client_secret
+        return secret.get_secret_value() if secret is not None else ""
+
+    def _refresh_token(self) -> str:
+        if self.config.refresh_token is None:
+            raise ValueError("OIDC: no refresh-token to renew the id-token with")
+        return self.config.refresh_token.get_secret_value()
+
     def _basic_auth(self) -> str:
-        credentials = f"{self.config.client_id.get_secret_value()}:{self.config.client_secret.get_secret_value()}"
+        credentials = (
+            f"{self.config.client_id.get_secret_value()}:{self._client_secret()}"
+        )
         return b64encode(credentials.encode()).decode()
 
     async def _token_request(
@@ -80,10 +91,17 @@ class OIDCAuthProvider:
                 content=urlencode(
                     [
                         ("grant_type", "refresh_token"),
-                        ("refresh_token", self.config.refresh_token.get_secret_value()),
+                        ("refresh_token", self._refresh_token()),
                     ],
                 ),
             )
+        params = [
+            ("grant_type", "refresh_token"),
+            ("refresh_token", self._refresh_token()),
+            ("client_id", self.config.client_id.get_secret_value()),
+        ]
+        if self.config.client_secret is not None:
+            params.append(("client_secret", self._client_secret()))
         return Request(
             method="POST",
             url=token_endpoint,
@@ -91,17 +109,11 @@ class OIDCAuthProvider:
                 "Accept": "application/json",
                 "Content-Type": "application/x-www-form-urlencoded",
             },
-            content=urlencode(
-                [
-                    ("grant_type", "refresh_token"),
-                    ("refresh_token", self.config.refresh_token.get_secret_value()),
-                    ("client_id", self.config.client_id.get_secret_value()),
-                    ("client_secret", self.config.client_secret.get_secret_value()),
-                ],
-            ),
+            content=urlencode(params),
         )
 
     async def refresh_token(self) -> str:
+        self._refresh_token()
         response = await self._id_token()
         data = response.json()
         id_token = data.get("id_token")
@@ -1,80 +1,134 @@
+import base64
+import json
+import logging
+import time
 from abc import ABC, abstractmethod
-from contextlib import asynccontextmanager
+from datetime import datetime
 from pathlib import Path
-from typing import AsyncGenerator
+from typing import TYPE_CHECKING
 
 import anyio
 from pydantic import SecretStr
 
-from .exec import ExecAuthProvider
-from .oidc import OIDCAuthProvider
+if TYPE_CHECKING:
+    from kubex.configuration.configuration import OIDCConfig
+
+    from .exec import ExecAuthProvider
+    from .oidc import OIDCAuthProvider
+
+logger = logging.getLogger("kubex.configuration.auth")
 
 TOKEN_REFRESH_INTERVAL = 60
+EXPIRY_SKEW = 10
+"""Seconds before its expiry from which a token is no longer used."""
+REFRESH_RATIO = 0.8
+"""Share of a token's lifetime after which it is refreshed ahead of expiry."""
+REFRESH_RETRY_INTERVAL = 5
+"""Seconds to wait before retrying a failed refresh while the token is still valid."""
 
 
 def bearer_token(token: SecretStr) -> str:
     return f"Bearer {token.get_secret_value()}"
 
 
-class _AsyncRWLock:
-    def __init__(self) -> None:
-        self._readers = 0
-        self._reader_lock = anyio.Lock()  # Protects the readers count
-        self._writer_lock = anyio.Lock()  # Blocks writers when active
-
-    @asynccontextmanager
-    async def read_lock(self) -> AsyncGenerator[None, None]:
-        """Acquire a read lock. Multiple readers can hold the lock simultaneously.
-        Writers are blocked while any readers hold the lock.
-        """
-        async with self._reader_lock:
-            self._readers += 1
-            if self._readers == 1:
-                await self._writer_lock.acquire()  # Block writers if first reader
-        try:
-            yield
-        finally:
-            async with self._reader_lock:
-                self._readers -= 1
-                if self._readers == 0:
-                    self._writer_lock.release()  # Release writer lock if last reader
+def jwt_expiration(token: str) -> float | None:
+    """Return the ``exp`` claim of *token* as a Unix timestamp.
+
+    Returns ``None`` if *token* is not a JWT or has no numeric ``exp`` claim.
+    The signature is not verified: the claim is only used to schedule refreshes.
+    """
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    try:
+        payload = base64.urlsafe_b64decode(parts[1] + "=" * (-len(parts[1]) % 4))
+        claims = json.loads(payload)
+    except ValueError:
+        return None
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    if isinstance(exp, bool) or not isinstance(exp, (int, float)):
+        return None
+    return float(exp)
+
+
+def _deadline(timestamp: float | None) -> float:
+    """Convert a Unix *timestamp* to the ``anyio.current_time()`` clock.
 
-    @asynccontextmanager
-    async def write_lock(self) -> AsyncGenerator[None, None]:
-        """
-        Acquire a write lock. Only one writer can hold the lock,
-        and all readers are blocked while the writer holds the lock.
-        """
-        async with self._writer_lock:
-            yield
+    Without a timestamp, the token is refreshed after ``TOKEN_REFRESH_INTERVAL``.
+    """
+    now = anyio.current_time()
+    if timestamp is None:
+        return now + TOKEN_REFRESH_INTERVAL
+    return now + timestamp - time.time()
 
 
 class BaseRefreshableToken(ABC):
+    """A bearer token provider that refreshes the token before it expires.
+
+    Once a token has lived :data:`REFRESH_RATIO` of its lifetime, the next
+    caller fetches a new one while concurrent callers keep using the cached
+    token, which is still valid. Callers only wait for a fetch when there is
+    no usable token, and then share a single fetch.
+    """
+
     def __init__(self) -> None:
-        self._lock = _AsyncRWLock()
         self._last_read_token: SecretStr | None = None
         self._expires_at: float = anyio.current_time()
+        self._refresh_at: float = self._expires_at
+        self._refreshing: anyio.Event | None = None
 
     def _is_expiring(self) -> bool:
-        return self._expires_at < anyio.current_time() + 10
+        return self._expires_at < anyio.current_time() + EXPIRY_SKEW
 
     def _cached_token(self) -> SecretStr | None:
         if not self._is_expiring():
             return self._last_read_token
         return None
 
+    def _set_token(
+        self, token: SecretStr, expires_at: float, fetched_at: float
+    ) -> None:
+        self._last_read_token = token
+        self._expires_at = expires_at
+        self._refresh_at = fetched_at + (expires_at - fetched_at) * REFRESH_RATIO
+
     @abstractmethod
-    async def _id_token(self) -> SecretStr: ...
+    async def _fetch_token(self) -> tuple[SecretStr, float]:
+        """Fetch a new token; return it with its expiry on the ``anyio`` clock."""
 
-    async def to_header(self) -> str:
-        async with self._lock.read_lock():
-            token = self._cached_token()
-        if token is not None:
-            return bearer_token(token)
-        async with self._lock.write_lock():
+    async def _refresh(self) -> SecretStr:
+        while (refreshing := self._refreshing) is not None:
+            await refreshing.wait()
             token = self._cached_token()
-            if token is None:
-                token = await self._id_token()
+            if token is not None:
+                return token
+        self._refreshing = refreshing = anyio.Event()
+        try:
+            fetched_at = anyio.current_time()
+            token, expires_at = await self._fetch_token()
+            self._set_token(token, expires_at, fetched_at)
+            return token
+        finally:
+            self._refreshing = None
+            refreshing.set()
+
+    async def to_header(self) -> str:
+        """Return the ``Authorization`` header value, refreshing the token if due."""
+        token = self._cached_token()
+        if token is None:
+            token = await self._refresh()
+        elif self._refreshing is None and anyio.current_time() >= self._refresh_at:
+            # Intentionally inline: the first caller past the refresh point
+            # waits for the fetch while concurrent callers keep using the
+            # cached token. A background refresh would need a task group that
+            # outlives the call, which a token provider does not have.
+            try:
+                token = await self._refresh()
+            except Exception:
+                logger.warning(
+                    "Failed to refresh the token ahead of its expiry", exc_info=True
+                )
+                self._refresh_at = anyio.current_time() + REFRESH_RETRY_INTERVAL
         return bearer_token(token)
 
 
@@ -83,46 +137,64 @@ class FileRefreshableToken(BaseRefreshableToken):
         super().__init__()
         self.path = path
 
-    async def _id_token(self) -> SecretStr:
-        if self._is_expiring() or self._last_read_token is None:
-            raw_token = self.path.read_text().strip()
-            if not raw_token:
-                raise ValueError("Token is not set")
-            self._last_read_token = SecretStr(raw_token)
-            self._expires_at = anyio.current_time() + TOKEN_REFRESH_INTERVAL
-        return self._last_read_token
+    async def _fetch_token(self) -> tuple[SecretStr, float]:
+        raw_token = (await anyio.Path(self.path).read_text()).strip()
+        if not raw_token:
+            raise ValueError("Token is not set")
+        return SecretStr(raw_token), _deadline(None)
 
 
 class OidcRefreshableToken(BaseRefreshableToken):
-    def __init__(self, provider: OIDCAuthProvider) -> None:
+    """Renews the ID token of an ``oidc`` auth provider with its refresh token.
+
+    The ``id-token`` of the kubeconfig is used until it expires. The provider
+    talking to the identity provider, which needs httpx, is only created on
+    the first refresh.
+    """
+
+    def __init__(
+        self, config: "OIDCConfig", provider: "OIDCAuthProvider | None" = None
+    ) -> None:
         super().__init__()
+        self._config = config
         self._provider = provider
+        if config.id_token is not None:
+            id_token = config.id_token
+            self._set_token(
+                id_token,
+                self._get_expiration(id_token.get_secret_value()),
+                anyio.current_time(),
+            )
 
     def _get_expiration(self, token: str) -> float:
-        # TODO: Implement this
-        return anyio.current_time() + float(TOKEN_REFRESH_INTERVAL)
+        return _deadline(jwt_expiration(token))
 
-    async def _id_token(self) -> SecretStr:
-        if not self._is_expiring() and self._last_read_token is not None:
-            return self._last_read_token
+    async def _fetch_token(self) -> tuple[SecretStr, float]:
+        if self._provider is None:
+            from .oidc import OIDCAuthProvider
+
+            self._provider = OIDCAuthProvider(self._config)
         raw_token = await self._provider.refresh_token()
-        self._last_read_token = SecretStr(raw_token)
-        self._expires_at = self._get_expiration(raw_token)
-        return self._last_read_token
+        return SecretStr(raw_token), self._get_expiration(raw_token)
 
 
 class ExecRefreshableToken(BaseRefreshableToken):
-    def __init__(self, provider: ExecAuthProvider) -> None:
+    def __init__(self, provider: "ExecAuthProvider") -> None:
         super().__init__()
         self._provider = provider
 
-    def _get_expiration(self, token: str) -> float:
-        return anyio.current_time() + float(TOKEN_REFRESH_INTERVAL)
-
-    async def _id_token(self) -> SecretStr:
-        if not self._is_expiring() and self._last_read_token is not None:
-            return self._last_read_token
-        raw_token = await self._provider.refresh_token()
-        self._last_read_token = SecretStr(raw_token)
-        self._expires_at = self._get_expiration(raw_token)
-        return self._last_read_token
+    def _get_expiration(self, token: str, expiration_timestamp: str | None) -> float:
+        if expiration_timestamp is not None:
+            # datetime.fromisoformat() only accepts the "Z" suffix from 3.11 on.
+            expires = datetime.fromisoformat(
+                expiration_timestamp.replace("Z", "+00:00")
+            )
+            return _deadline(expires.timestamp())
+        return _deadline(jwt_expiration(token))
+
+    async def _fetch_token(self) -> tuple[SecretStr, float]:
+        status = await self._provider.refresh_credential()
+        if status.token is None:
+            raise ValueError("exec: token not found in response")
+        expires_at = self._get_expiration(status.token, status.expiration_timestamp)
+        return SecretStr(status.token), expires_at
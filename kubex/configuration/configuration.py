@@ -1,12 +1,17 @@
+import ssl
 import typing
 from enum import Enum
 from pathlib import Path
 from time import time
 
+import anyio
 from pydantic import Field, FilePath, HttpUrl, SecretStr
 
 from kubex_core.models.base import BaseK8sModel
 
+if typing.TYPE_CHECKING:
+    from kubex.configuration.auth.refreshable_token import BaseRefreshableToken
+
 
 class RawExtension(BaseK8sModel):
     """RawExtension is used to hold extensions in external versions"""
@@ -54,10 +59,12 @@ class Cluster(BaseK8sModel):
 class OIDCConfig(BaseK8sModel):
     client_id: SecretStr = Field(alias="client-id")
     """ClientID is the client ID for the OpenID Connect client, as described in https://tools.ietf.org/html/rfc6749#section-2.2."""
-    client_secret: SecretStr = Field(alias="client-secret")
-    """ClientSecret is the client secret for the OpenID Connect client, as described in https://tools.ietf.org/html/rfc6749#section-2.3."""
-    refresh_token: SecretStr = Field(alias="refresh-token")
+    client_secret: SecretStr | None = Field(None, alias="client-secret")
+    """ClientSecret is the client secret for the OpenID Connect client, as described in https://tools.ietf.org/html/rfc6749#section-2.3. Public clients have none."""
+    refresh_token: SecretStr | None = Field(None, alias="refresh-token")
     """RefreshToken is the refresh token for the OpenID Connect client, as described in https://tools.ietf.org/html/rfc6749#section-6."""
+    id_token: SecretStr | None = Field(None, alias="id-token")
+    """IDToken is the last ID token issued to the client, used until it expires."""
     idp_issuer_url: str = Field(alias="idp-issuer-url")
     """IDPIssuerURL is the URL of the OpenID issuer, only HTTPS scheme will be accepted."""
     idp_certificate_authority_data: str | None = Field(
@@ -204,6 +211,8 @@ class ClientConfiguration:
         token: str | None = None,
         namespace: str | None = None,
         try_refresh_token: bool = False,
+        disable_compression: bool = False,
+        token_provider: "BaseRefreshableToken | None" = None,
     ) -> None:
         if try_refresh_token and token_file is None:
             raise ValueError("Token file must be provided to refresh token")
@@ -231,6 +240,9 @@ class ClientConfiguration:
         self._last_token_read: float | None = None
         self._current_token: str | None = None
         self._token = token
+        self.disable_compression = disable_compression
+        # Set for exec and OIDC users; takes precedence over token/token_file.
+        self.token_provider = token_provider
 
     @property
     def verify(self) -> bool | str | None:
@@ -248,6 +260,31 @@ class ClientConfiguration:
             return str(self.client_cert_file), str(self.client_key_file)
         return str(self.client_cert_file)
 
+    @property
+    def certificate_files(self) -> list[Path]:
+        """The CA, client certificate and client key files in use."""
+        files = (self.server_ca_file, self.client_cert_file, self.client_key_file)
+        return [file for file in files if file is not None]
+
+    def create_ssl_context(self) -> ssl.SSLContext:
+        """Build the TLS context for connections to the API server.
+
+        Reads the certificate files, so call it off the event loop once the
+        client is running.
+        """
+        ssl_context = ssl.create_default_context(cafile=self.server_ca_file)
+        if (client_cert := self.client_cert) is not None:
+            if isinstance(client_cert, tuple):
+                ssl_context.load_cert_chain(
+                    certfile=client_cert[0], keyfile=client_cert[1]
+                )
+            else:
+                ssl_context.load_cert_chain(certfile=client_cert)
+        if self.insecure_skip_tls_verify:
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+        return ssl_context
+
     @property
     def token(self) -> str | None:
         if self._token is None and self.token_file is None:
@@ -259,11 +296,35 @@ class ClientConfiguration:
         if self.token_file is None:
             return None
 
-        if (
-            self._current_token is None
-            or self._last_token_read is None
-            or time() - self._last_token_read > TOKEN_REFRESH_INTERVAL
-        ):
+        if self._token_file_is_stale():
             self._current_token = self.token_file.read_text().strip()
             self._last_token_read = time()
         return self._current_token
+
+    async def get_token(self) -> str | None:
+        """Return the bearer token like :attr:`token`, without blocking the event loop.
+
+        The token file is re-read in a worker thread once the cached token is
+        older than the refresh interval. Requests made during the read keep
+        using the cached token instead of reading the file again.
+        """
+        if self._token is not None:
+            return self._token
+        if self.token_file is None or not self._token_file_is_stale():
+            return self._current_token
+        last_token_read = self._last_token_read
+        self._last_token_read = time()
+        try:
+            content = await anyio.Path(self.token_file).read_text()
+        except BaseException:
+            self._last_token_read = last_token_read
+            raise
+        self._current_token = content.strip()
+        return self._current_token
+
+    def _token_file_is_stale(self) -> bool:
+        return (
+            self._current_token is None
+            or self._last_token_read is None
+            or time() - self._last_token_read > TOKEN_REFRESH_INTERVAL
+        )
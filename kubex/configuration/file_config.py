@@ -1,16 +1,26 @@
 import atexit
+import logging
 import os
 from base64 import b64decode
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 
+from pydantic import ValidationError
 from yaml import safe_load
 
-from .configuration import ClientConfiguration, KubeConfig
+from .auth.exec import ExecAuthProvider
+from .auth.refreshable_token import (
+    BaseRefreshableToken,
+    ExecRefreshableToken,
+    OidcRefreshableToken,
+)
+from .configuration import AuthInfo, ClientConfiguration, KubeConfig, OIDCConfig
 
 DEFAULT_KUBE_CONFIG_FILE = Path.home() / ".kube" / "config"
 KUBECONFIG_ENV_VARIABLE = "KUBECONFIG"
 
+logger = logging.getLogger("kubex.configuration")
+
 _temp_files: dict[str, Path] = {}
 
 
@@ -74,14 +84,55 @@ async def configure_from_kubeconfig(
     client_key_file = user.client_key
     if client_key_file is None and user.client_key_data is not None:
         client_key_file = _decode_and_put_to_file(user.client_key_data)
+    token_provider = _token_provider(user)
     return ClientConfiguration(
         url=str(cluster.server),
         server_ca_file=ca_file,
         client_cert_file=client_cert_file,
         client_key_file=client_key_file,
+        token=user.token if token_provider is not None else _static_token(user),
+        token_file=user.token_file,
+        disable_compression=cluster.disable_compression,
+        token_provider=token_provider,
     )
 
 
+def _token_provider(user: AuthInfo) -> BaseRefreshableToken | None:
+    """Return the token provider for the ``exec`` or ``oidc`` credentials of *user*."""
+    if user.exec is not None:
+        return ExecRefreshableToken(ExecAuthProvider(user.exec))
+    auth_provider = user.auth_provider
+    if auth_provider is None:
+        return None
+    if auth_provider.name != "oidc":
+        logger.warning("Ignoring unsupported auth provider %r", auth_provider.name)
+        return None
+    # The config union resolves plain string mappings to the dict branch.
+    try:
+        oidc_config = OIDCConfig.model_validate(auth_provider.config)
+    except ValidationError:
+        logger.warning(
+            "Cannot refresh the token of the oidc auth provider, its config is "
+            "incomplete; using its id-token as a static token",
+            exc_info=True,
+        )
+        return None
+    return OidcRefreshableToken(oidc_config)
+
+
+def _static_token(user: AuthInfo) -> str | None:
+    """Return the ``token`` of *user*, or the ``id-token`` of its auth provider."""
+    if user.token is not None:
+        return user.token
+    auth_provider = user.auth_provider
+    if auth_provider is None or auth_provider.name != "oidc":
+        return None
+    config = auth_provider.config
+    if isinstance(config, OIDCConfig):
+        return config.id_token.get_secret_value() if config.id_token else None
+    return config.get("id-token")
+
+
 def _decode_and_put_to_file(data: str) -> Path:
     if len(_temp_files) == 0:
         atexit.register(_cleanup_temp_files)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import random
+
+
+class Backoff:
+    """Capped exponential backoff with full jitter.
+
+    The delay before retry number ``attempt`` (starting at 0) is drawn
+    uniformly from ``[0, min(maximum, initial * factor ** attempt)]``. The
+    randomisation spreads out clients that failed at the same moment, for
+    example when an API server restarts and every watch of a fleet is cut at
+    once, instead of having them retry in lockstep.
+
+    Args:
+        initial: Upper bound of the first delay, in seconds.
+        maximum: Cap of the delay, in seconds.
+        factor: Growth factor of the upper bound per attempt.
+        jitter: Draw a random delay below the upper bound. When ``False`` the
+            upper bound itself is used.
+    """
+
+    __slots__ = ("initial", "maximum", "factor", "jitter")
+
+    def __init__(
+        self,
+        initial: float = 0.8,
+        maximum: float = 30.0,
+        factor: float = 2.0,
+        *,
+        jitter: bool = True,
+    ) -> None:
+        if initial < 0 or maximum < 0:
+            raise ValueError("Backoff delays must not be negative")
+        if factor < 1:
+            raise ValueError("Backoff factor must be at least 1")
+        self.initial = initial
+        self.maximum = maximum
+        self.factor = factor
+        self.jitter = jitter
+
+    def delay(self, attempt: int) -> float:
+        """Return the delay in seconds before retry number *attempt*."""
+        # Cap the exponent: the bound saturates at ``maximum`` long before and
+        # large exponents would overflow the float.
+        ceiling = min(self.maximum, self.initial * self.factor ** min(attempt, 64))
+        if self.jitter:
+            return random.uniform(0, ceiling)
+        return ceiling
+
+    def __repr__(self) -> str:
+        return (
+            f"Backoff(initial={self.initial!r}, maximum={self.maximum!r}, "
+            f"factor={self.factor!r}, jitter={self.jitter!r})"
+        )
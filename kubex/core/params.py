@@ -92,6 +92,13 @@ class FieldValidation(str, Enum):
     WARN = "Warn"
 
 
+class WireFormat(str, Enum):
+    """Serialization of request and response bodies."""
+
+    JSON = "json"
+    CBOR = "cbor"
+
+
 class DryRun(str, Enum):
     ALL = "All"
 
@@ -165,12 +172,14 @@ class WatchOptions:
         allow_bookmarks: bool | None = None,
         send_initial_events: bool | None = None,
         timeout_seconds: int | None = None,
+        version_match: VersionMatch | None = None,
     ) -> None:
         self.label_selector = label_selector
         self.field_selector = field_selector
         self.allow_bookmarks = allow_bookmarks
         self.send_initial_events = send_initial_events
         self.timeout_seconds = timeout_seconds
+        self.version_match = version_match
 
     @classmethod
     def default(cls) -> WatchOptions:
@@ -190,6 +199,8 @@ class WatchOptions:
             )
         if self.timeout_seconds is not None:
             query_params["timeoutSeconds"] = str(self.timeout_seconds)
+        if self.version_match is not None:
+            query_params["resourceVersionMatch"] = self.version_match.value
         return query_params
 
 
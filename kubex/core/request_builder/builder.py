@@ -9,6 +9,7 @@ from kubex.core.params import (
     PostOptions,
     TimeoutTypes,
     WatchOptions,
+    WireFormat,
 )
 from kubex.core.patch import Patch
 from kubex.core.request import Request
@@ -19,7 +20,13 @@ from kubex.core.request_builder.metadata import MetadataRequestBuilder
 from kubex.core.request_builder.portforward import PortforwardRequestBuilder
 from kubex_core.models.resource_config import ResourceConfig
 
-from .constants import ACCEPT_HEADER, APPLICATION_JSON_MIME_TYPE, CONTENT_TYPE_HEADER
+from .constants import (
+    ACCEPT_HEADER,
+    APPLICATION_CBOR_MIME_TYPE,
+    APPLICATION_JSON_MIME_TYPE,
+    CBOR_ACCEPT,
+    CONTENT_TYPE_HEADER,
+)
 from .subresource import SubresourceRequestBuilder
 
 
@@ -31,8 +38,22 @@ class RequestBuilder(
     AttachRequestBuilder,
     PortforwardRequestBuilder,
 ):
-    def __init__(self, resource_config: ResourceConfig[Any]) -> None:
+    def __init__(
+        self,
+        resource_config: ResourceConfig[Any],
+        wire_format: WireFormat = WireFormat.JSON,
+    ) -> None:
         self.resource_config = resource_config
+        self.wire_format = wire_format
+
+    def _headers(self, *, body: bool = False) -> dict[str, str] | None:
+        """Headers selecting the wire format of the response (and *body*)."""
+        if self.wire_format is not WireFormat.CBOR:
+            return None
+        headers = {ACCEPT_HEADER: CBOR_ACCEPT}
+        if body:
+            headers[CONTENT_TYPE_HEADER] = APPLICATION_CBOR_MIME_TYPE
+        return headers
 
     def get(
         self,
@@ -47,6 +68,7 @@ class RequestBuilder(
             method="GET",
             url=self.resource_config.url(namespace, name),
             query_params=query_params,
+            headers=self._headers(),
             timeout=request_timeout,
         )
 
@@ -62,6 +84,27 @@ class RequestBuilder(
             method="GET",
             url=self.resource_config.url(namespace),
             query_params=query_params,
+            headers=self._headers(),
+            timeout=request_timeout,
+        )
+
+    def list_stream(
+        self,
+        namespace: str | None,
+        options: ListOptions,
+        *,
+        request_timeout: TimeoutTypes | EllipsisType = ...,
+    ) -> Request:
+        """A list request whose response is JSON, whatever the wire format.
+
+        The streaming list parser reads JSON only.
+        """
+        query_params = options.as_query_params()
+        return Request(
+            method="GET",
+            url=self.resource_config.url(namespace),
+            query_params=query_params,
+            headers={ACCEPT_HEADER: APPLICATION_JSON_MIME_TYPE},
             timeout=request_timeout,
         )
 
@@ -79,6 +122,7 @@ class RequestBuilder(
             url=self.resource_config.url(namespace),
             query_params=query_params,
             body=data,
+            headers=self._headers(body=True),
             timeout=request_timeout,
         )
 
@@ -95,6 +139,7 @@ class RequestBuilder(
             method="DELETE",
             url=self.resource_config.url(namespace, name),
             body=body,
+            headers=self._headers(),
             timeout=request_timeout,
         )
 
@@ -113,6 +158,7 @@ class RequestBuilder(
             url=self.resource_config.url(namespace),
             query_params=query_params,
             body=body,
+            headers=self._headers(),
             timeout=request_timeout,
         )
 
@@ -152,6 +198,7 @@ class RequestBuilder(
             url=self.resource_config.url(namespace, name),
             query_params=query_params,
             body=data,
+            headers=self._headers(body=True),
             timeout=request_timeout,
         )
 
@@ -170,5 +217,6 @@ class RequestBuilder(
             method="GET",
             url=self.resource_config.url(namespace),
             query_params=query_params,
+            headers=self._headers(),
             timeout=request_timeout,
         )
@@ -1,7 +1,13 @@
 ACCEPT_HEADER = "accept"
+ACCEPT_ENCODING_HEADER = "accept-encoding"
+AUTHORIZATION_HEADER = "authorization"
 CONTENT_TYPE_HEADER = "content-type"
 METADATA_MIME_TYPE = "application/json;as=PartialObjectMetadata;g=meta.k8s.io;v=v1"
 METADATA_LIST_MIME_TYPE = (
     "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1"
 )
 APPLICATION_JSON_MIME_TYPE = "application/json"
+APPLICATION_CBOR_MIME_TYPE = "application/cbor"
+APPLICATION_CBOR_SEQ_MIME_TYPE = "application/cbor-seq"
+# Prefer CBOR, but accept JSON from API servers that do not serve CBOR.
+CBOR_ACCEPT = f"{APPLICATION_CBOR_MIME_TYPE}, {APPLICATION_JSON_MIME_TYPE};q=0.9"
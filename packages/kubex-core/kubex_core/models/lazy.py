@@ -0,0 +1,290 @@
+"""Lazily validated models.
+
+``model_validate_json`` builds the complete object tree of every item of a
+list, although most consumers only read a few fields such as
+``metadata.name`` or ``status.phase``. The functions of this module parse
+the JSON document into plain Python objects instead and validate each field
+of a model the first time it is read. Fields holding a model (or a list of
+models) produce lazy models themselves, so only the path to the fields that
+are actually used is ever validated.
+"""
+
+from __future__ import annotations
+
+import functools
+import types
+import typing
+from typing import Any, Type, TypeVar, Union
+
+import pydantic_core
+from pydantic import BaseModel, create_model
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_MISSING: Any = object()
+# Slot holding the parsed JSON object of a lazy model until it is materialized.
+_RAW = "__kubex_raw__"
+
+
+def lazy_validate_json(model_type: Type[ModelT], data: str | bytes) -> ModelT:
+    """Parse the JSON *data* into a lazily validated *model_type*.
+
+    See :func:`lazy_validate_python`.
+    """
+    return lazy_validate_python(model_type, pydantic_core.from_json(data))
+
+
+def lazy_validate_python(model_type: Type[ModelT], data: Any) -> ModelT:
+    """Wrap the parsed JSON object *data* into a lazily validated *model_type*.
+
+    The returned object is an instance of a subclass of *model_type*, so
+    ``isinstance`` checks and attribute access work as usual, but each field
+    is only validated when it is first read. Validation errors are therefore
+    raised on access of the invalid field rather than upfront. Serializing,
+    comparing, copying or printing the object validates it completely first,
+    see :func:`materialize`.
+
+    Models that customize validation (validators, private attributes,
+    ``extra`` handling, strict or frozen configuration) are validated eagerly.
+    """
+    if not isinstance(data, dict) or _lazy_type(model_type) is None:
+        return model_type.model_validate(data)
+    return _construct(model_type, data)
+
+
+def is_lazy(obj: Any) -> bool:
+    """Return whether *obj* is a lazily validated model."""
+    return isinstance(obj, _LazyModel)
+
+
+def materialize(obj: ModelT) -> ModelT:
+    """Validate all fields of *obj* and of its nested models in place.
+
+    Afterwards the parsed JSON is released and *obj* behaves like an eagerly
+    validated model. Returns *obj*; models that are not lazy are returned as
+    they are.
+    """
+    _materialize_value(obj)
+    return obj
+
+
+class _LazyModel:
+    """Mixin of the lazy subclasses.
+
+    Fields that have not been read are missing from the instance
+    ``__dict__``; the ``BaseModel`` methods that read it directly validate
+    the remaining fields first.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        raw = None
+        if name in type(self).__pydantic_fields__:  # type: ignore[attr-defined]
+            raw = getattr(self, _RAW, None)
+        if raw is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        value = _load_field(_eager_type(type(self)), name, raw)
+        self.__dict__[name] = value
+        return value
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        _materialize_value(self)
+        _materialize_value(other)
+        return (
+            _eager_type(type(self)) is _eager_type(type(other))
+            and self.__dict__ == other.__dict__
+        )
+
+    def __iter__(self) -> Any:
+        _materialize_value(self)
+        return super().__iter__()  # type: ignore[misc]
+
+    def __repr_args__(self) -> Any:
+        _materialize_value(self)
+        return super().__repr_args__()  # type: ignore[misc]
+
+    def __copy__(self) -> Any:
+        _materialize_value(self)
+        return super().__copy__()  # type: ignore[misc]
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> Any:
+        _materialize_value(self)
+        return super().__deepcopy__(memo)  # type: ignore[misc]
+
+    def __reduce__(self) -> Any:
+        # The lazy classes are created at runtime and cannot be looked up by
+        # pickle, so unpickling produces an instance of the eager model.
+        _materialize_value(self)
+        state = super().__getstate__()  # type: ignore[misc]
+        return _unpickle, (_eager_type(type(self)), state)
+
+    def model_dump(self, *args: Any, **kwargs: Any) -> Any:
+        _materialize_value(self)
+        return super().model_dump(*args, **kwargs)  # type: ignore[misc]
+
+    def model_dump_json(self, *args: Any, **kwargs: Any) -> Any:
+        _materialize_value(self)
+        return super().model_dump_json(*args, **kwargs)  # type: ignore[misc]
+
+    def model_copy(self, *args: Any, **kwargs: Any) -> Any:
+        _materialize_value(self)
+        return super().model_copy(*args, **kwargs)  # type: ignore[misc]
+
+
+def _unpickle(model_type: Type[BaseModel], state: dict[Any, Any]) -> BaseModel:
+    obj = model_type.__new__(model_type)
+    obj.__setstate__(state)
+    return obj
+
+
+def _eager_type(model_type: type) -> Any:
+    if issubclass(model_type, _LazyModel):
+        return model_type.__bases__[1]
+    return model_type
+
+
+@functools.cache
+def _lazy_type(model_type: Type[ModelT]) -> Type[ModelT] | None:
+    """Return the lazy subclass of *model_type*, ``None`` if it has to be
+    validated eagerly."""
+    config = model_type.model_config
+    decorators = model_type.__pydantic_decorators__
+    if (
+        decorators.validators
+        or decorators.field_validators
+        or decorators.model_validators
+        or decorators.root_validators
+        or model_type.__private_attributes__
+        or model_type.__pydantic_root_model__
+        or config.get("extra") not in (None, "ignore")
+        or config.get("strict")
+        or config.get("frozen")
+        or config.get("validate_assignment")
+        or any(
+            field.validation_alias not in (None, field.alias)
+            for field in model_type.__pydantic_fields__.values()
+        )
+    ):
+        return None
+    lazy_type = type(model_type)(
+        model_type.__name__,
+        (_LazyModel, model_type),
+        {
+            "__module__": model_type.__module__,
+            "__qualname__": model_type.__qualname__,
+            "__slots__": (_RAW,),
+        },
+    )
+    return typing.cast(Type[ModelT], lazy_type)
+
+
+@functools.cache
+def _keys(model_type: Type[BaseModel]) -> tuple[tuple[str, str], ...]:
+    return tuple(
+        (name, field.alias or name)
+        for name, field in model_type.__pydantic_fields__.items()
+    )
+
+
+def _construct(model_type: Type[ModelT], raw: dict[str, Any]) -> ModelT:
+    lazy_type = _lazy_type(model_type)
+    assert lazy_type is not None
+    obj = lazy_type.__new__(lazy_type)
+    fields_set = {name for name, key in _keys(model_type) if key in raw or name in raw}
+    object.__setattr__(obj, "__dict__", {})
+    object.__setattr__(obj, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(obj, "__pydantic_extra__", None)
+    object.__setattr__(obj, "__pydantic_private__", None)
+    object.__setattr__(obj, _RAW, raw)
+    return obj
+
+
+@functools.lru_cache(maxsize=1024)
+def _fields_model(
+    model_type: Type[BaseModel], names: tuple[str, ...]
+) -> Type[BaseModel]:
+    """A model of the fields *names* of *model_type*, validating them (with
+    their aliases, defaults and constraints) without the other fields."""
+    fields = model_type.__pydantic_fields__
+    return create_model(  # type: ignore[call-overload,no-any-return]
+        model_type.__name__,
+        __config__=model_type.model_config,
+        __module__=model_type.__module__,
+        **{name: (fields[name].annotation, fields[name]) for name in names},
+    )
+
+
+@functools.cache
+def _field_shape(model_type: Type[BaseModel], name: str) -> tuple[Any, bool, bool]:
+    """Return ``(model, is_list, optional)`` if the field holds a model or a
+    list of models that can be validated lazily, ``(None, False, False)``
+    otherwise."""
+    annotation = model_type.__pydantic_fields__[name].annotation
+    optional = False
+    if typing.get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return None, False, False
+        optional = True
+        annotation = args[0]
+    is_list = typing.get_origin(annotation) is list
+    if is_list:
+        (annotation,) = typing.get_args(annotation) or (Any,)
+    if (
+        isinstance(annotation, type)
+        and issubclass(annotation, BaseModel)
+        and _lazy_type(annotation) is not None
+    ):
+        return annotation, is_list, optional
+    return None, False, False
+
+
+def _load_field(model_type: Type[BaseModel], name: str, raw: dict[str, Any]) -> Any:
+    nested, is_list, optional = _field_shape(model_type, name)
+    if nested is not None:
+        key = model_type.__pydantic_fields__[name].alias or name
+        value = raw.get(key, raw.get(name, _MISSING))
+        if value is None and optional:
+            return None
+        if not is_list and isinstance(value, dict):
+            return _construct(nested, value)
+        if is_list and isinstance(value, list):
+            if all(isinstance(item, dict) for item in value):
+                return [_construct(nested, item) for item in value]
+    # Anything else, including missing and malformed values, goes through
+    # regular validation of the field.
+    return _fields_model(model_type, (name,)).model_validate(raw).__dict__[name]
+
+
+def _materialize_value(value: Any) -> None:
+    if isinstance(value, _LazyModel):
+        raw = getattr(value, _RAW, None)
+        if raw is None:
+            return
+        object.__setattr__(value, _RAW, None)
+        model_type = _eager_type(type(value))
+        loaded = value.__dict__
+        names = tuple(model_type.__pydantic_fields__)
+        missing = tuple(name for name in names if name not in loaded)
+        validated: dict[str, Any] = {}
+        if missing:
+            validated = _fields_model(model_type, missing).model_validate(raw).__dict__
+        for name in names:
+            if name in loaded:
+                _materialize_value(loaded[name])
+        object.__setattr__(
+            value,
+            "__dict__",
+            {
+                name: loaded[name] if name in loaded else validated[name]
+                for name in names
+            },
+        )
+    elif isinstance(value, list):
+        for item in value:
+            _materialize_value(item)
@@ -0,0 +1,129 @@
+"""Models restricted to a subset of the fields of a resource.
+
+Between the full resource and the metadata-only ``PartialObjectMetadata``,
+a projection keeps exactly the fields a caller asks for, for example
+``metadata``, ``status.phase`` and ``spec.node_name``. JSON validated with
+the trimmed model skips every other subtree without building it, while the
+kept fields retain their original types, aliases and defaults.
+"""
+
+from __future__ import annotations
+
+import functools
+import types
+import typing
+from typing import Any, Iterable, Type, TypeVar, Union
+
+from pydantic import BaseModel, create_model
+
+from kubex_core.models.base import BaseK8sModel
+from kubex_core.models.base_entity import BaseEntity
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# A selection of fields: ``(name, sub-selection)`` pairs sorted by name, where
+# a sub-selection of ``None`` keeps the whole field.
+_Selection = tuple[tuple[str, "_Selection | None"], ...]
+
+
+def project(model_type: Type[ModelT], fields: Iterable[str]) -> Type[ModelT]:
+    """Return a model of *model_type* that only has the given *fields*.
+
+    *fields* are dotted paths of attribute names, e.g. ``"status.phase"`` or
+    ``"spec.containers.image"``; paths cross optional fields, lists and dicts
+    of models. Selecting a field keeps its whole subtree.
+
+    Resources (subclasses of ``BaseEntity``) always keep ``api_version``,
+    ``kind`` and ``metadata``, which identify the object; select, e.g.,
+    ``"metadata.name"`` to trim the metadata as well.
+
+    The projected models are cached, so repeated calls with the same fields
+    return the same class. The class is not a subclass of *model_type*: the
+    return type only reflects that the selected fields keep their types.
+    Reading a field that was not selected raises ``AttributeError``.
+
+    Raises:
+        ValueError: If a path is empty, names a field the model does not
+            have, or selects sub-fields of a field that holds no model.
+    """
+    return typing.cast(Type[ModelT], _project(model_type, _selection(fields), ""))
+
+
+def _selection(fields: Iterable[str]) -> _Selection:
+    if isinstance(fields, str):
+        fields = (fields,)
+    tree: dict[str, Any] = {}
+    for path in fields:
+        parts = path.split(".")
+        if not all(parts):
+            raise ValueError(f"Invalid field path {path!r}")
+        node = tree
+        for part in parts[:-1]:
+            child = node.setdefault(part, {})
+            if child is None:
+                # The whole field is selected already.
+                break
+            node = child
+        else:
+            node[parts[-1]] = None
+    if not tree:
+        raise ValueError("At least one field must be selected")
+    return _freeze(tree)
+
+
+def _freeze(tree: dict[str, Any]) -> _Selection:
+    return tuple(
+        (name, None if sub is None else _freeze(sub))
+        for name, sub in sorted(tree.items())
+    )
+
+
+@functools.cache
+def _project(
+    model_type: Type[BaseModel], selection: _Selection, prefix: str
+) -> Type[BaseModel]:
+    fields = model_type.__pydantic_fields__
+    definitions: dict[str, Any] = {}
+    for name, sub in selection:
+        path = f"{prefix}{name}"
+        if name not in fields:
+            raise ValueError(f"{model_type.__name__} has no field {path!r}")
+        field = fields[name]
+        annotation = field.annotation
+        if sub is not None:
+            annotation = _project_annotation(annotation, sub, path)
+        definitions[name] = (annotation, field)
+    options: dict[str, Any]
+    if issubclass(model_type, BaseEntity):
+        options = {"__base__": BaseEntity}
+    elif issubclass(model_type, BaseK8sModel):
+        options = {"__base__": BaseK8sModel}
+    else:
+        options = {"__config__": model_type.model_config}
+    projected: Type[BaseModel] = create_model(
+        model_type.__name__,
+        __module__=model_type.__module__,
+        __doc__=model_type.__doc__,
+        **options,
+        **definitions,
+    )
+    return projected
+
+
+def _project_annotation(annotation: Any, selection: _Selection, path: str) -> Any:
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin in (Union, types.UnionType):
+        return Union[
+            tuple(
+                arg if arg is type(None) else _project_annotation(arg, selection, path)
+                for arg in args
+            )
+        ]
+    if origin is list:
+        return list[_project_annotation(args[0], selection, path)]  # type: ignore[misc]
+    if origin is dict:
+        return dict[args[0], _project_annotation(args[1], selection, path)]  # type: ignore[misc]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _project(annotation, selection, f"{path}.")
+    raise ValueError(f"Field {path!r} has no sub-fields to select")
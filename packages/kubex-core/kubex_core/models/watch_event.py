@@ -1,5 +1,8 @@
 from enum import Enum
-from typing import Any, Generic, Type
+from functools import lru_cache
+from typing import Annotated, Any, Generic, Literal, Type, Union
+
+from pydantic import BaseModel, Field, TypeAdapter
 
 from .base_entity import BaseEntity
 from .typing import ResourceType
@@ -14,9 +17,68 @@ class EventType(str, Enum):
     BOOKMARK = "BOOKMARK"
 
 
+INITIAL_EVENTS_END_ANNOTATION = "k8s.io/initial-events-end"
+"""Annotation set on the bookmark that ends the initial events of a watch list."""
+
+
 class Bookmark(BaseEntity):
     """Bookmark is a pointer to a resource in a stream."""
 
+    @property
+    def is_initial_events_end(self) -> bool:
+        """Whether this bookmark marks the end of the initial events.
+
+        Sent by the API server on watches requested with
+        ``sendInitialEvents=true`` once the current state has been streamed.
+        """
+        annotations = self.metadata.annotations
+        return (
+            annotations is not None
+            and annotations.get(INITIAL_EVENTS_END_ANNOTATION) == "true"
+        )
+
+
+class ObjectEventEnvelope(BaseModel, Generic[ResourceType]):
+    """Wire format of an ``ADDED``, ``MODIFIED`` or ``DELETED`` watch event."""
+
+    type: Literal["ADDED", "MODIFIED", "DELETED"]
+    object: ResourceType
+
+
+class BookmarkEventEnvelope(BaseModel):
+    """Wire format of a ``BOOKMARK`` watch event."""
+
+    type: Literal["BOOKMARK"]
+    object: Bookmark
+
+
+class ErrorEventEnvelope(BaseModel):
+    """Wire format of an ``ERROR`` watch event; ``object`` is usually a ``Status``."""
+
+    type: Literal["ERROR"]
+    object: dict[str, Any]
+
+
+@lru_cache(maxsize=None)
+def watch_event_adapter(
+    resource_type: Type[ResourceType],
+) -> "TypeAdapter[ObjectEventEnvelope[ResourceType] | BookmarkEventEnvelope | ErrorEventEnvelope]":
+    """Return the validator of watch events carrying *resource_type* objects.
+
+    The envelope is a union discriminated on ``type``, so a raw event line is
+    validated into the right object model in a single pass without an
+    intermediate ``dict``. Adapters are built once per resource type.
+    """
+    envelope: Any = Annotated[
+        Union[
+            ObjectEventEnvelope[resource_type],  # type: ignore[valid-type]
+            BookmarkEventEnvelope,
+            ErrorEventEnvelope,
+        ],
+        Field(discriminator="type"),
+    ]
+    return TypeAdapter(envelope)
+
 
 class WatchEvent(Generic[ResourceType]):
     """WatchEvent represents a single event from a watch stream."""
@@ -32,5 +94,21 @@ class WatchEvent(Generic[ResourceType]):
         else:
             self.object = self._resource_type.model_validate(raw_event["object"])
 
+    @classmethod
+    def from_object(
+        cls, event_type: EventType, obj: ResourceType | Bookmark
+    ) -> "WatchEvent[ResourceType]":
+        """Build an event around an already validated object."""
+        event: WatchEvent[ResourceType] = cls.__new__(cls)
+        event._resource_type = type(obj)  # type: ignore[assignment]
+        event.type = event_type
+        event.object = obj
+        return event
+
+    @property
+    def is_initial_events_end(self) -> bool:
+        """Whether this event is the bookmark ending the initial events."""
+        return isinstance(self.object, Bookmark) and self.object.is_initial_events_end
+
     def __repr__(self) -> str:
         return f"WatchEvent(type={self.type}, object={self.object})"
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, AsyncGenerator, Iterable
+from typing import Any, AsyncGenerator, Iterable, Mapping
+
+import anyio
 
 from kubex.client.client import BaseClient
 from kubex.configuration import ClientConfiguration
@@ -17,7 +19,9 @@ class StubClient(BaseClient):
         *,
         response_content: bytes = b"{}",
         status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
         stream_lines: Iterable[str] = (),
+        stream_chunks: Iterable[bytes] = (),
     ) -> None:
         super().__init__(
             configuration
@@ -29,7 +33,9 @@ class StubClient(BaseClient):
         self.requests: list[Request] = []
         self._response_content = response_content
         self._status_code = status_code
+        self._headers = dict(headers or {})
         self._stream_lines = list(stream_lines)
+        self._stream_chunks = list(stream_chunks)
 
     def _create_inner_client(self) -> Any:
         return object()
@@ -42,9 +48,12 @@ class StubClient(BaseClient):
 
     async def request(self, request: Request) -> Response:
         self.requests.append(request)
+        return await self._send(request)
+
+    async def _send(self, request: Request) -> Response:
         return Response(
             content=self._response_content,
-            headers=HeadersWrapper({}),
+            headers=HeadersWrapper(self._headers),
             status_code=self._status_code,
         )
 
@@ -53,6 +62,11 @@ class StubClient(BaseClient):
         for line in self._stream_lines:
             yield line
 
+    async def stream_bytes(self, request: Request) -> AsyncGenerator[bytes, None]:
+        self.requests.append(request)
+        for chunk in self._stream_chunks:
+            yield chunk
+
     async def close(self) -> None:
         return None
 
@@ -60,3 +74,41 @@ class StubClient(BaseClient):
     def last_request(self) -> Request:
         assert self.requests, "StubClient received no requests"
         return self.requests[-1]
+
+
+class ScriptedClient(StubClient):
+    """A ``StubClient`` that replays queued responses and watch streams in order.
+
+    Each queued response is either the response body or an exception to raise.
+    Each queued stream is a sequence of lines, optionally ending with an
+    exception raised after the lines were yielded. Once the stream queue is
+    exhausted, ``stream_lines`` blocks forever so that long-running consumers
+    can be cancelled by the test.
+    """
+
+    def __init__(
+        self,
+        *,
+        responses: Iterable[bytes | BaseException] = (),
+        streams: Iterable[Iterable[str | BaseException]] = (),
+    ) -> None:
+        super().__init__()
+        self._responses = list(responses)
+        self._streams = [list(stream) for stream in streams]
+
+    async def request(self, request: Request) -> Response:
+        self.requests.append(request)
+        assert self._responses, f"Unexpected request: {request!r}"
+        item = self._responses.pop(0)
+        if isinstance(item, BaseException):
+            raise item
+        return Response(content=item, headers=HeadersWrapper({}), status_code=200)
+
+    async def stream_lines(self, request: Request) -> AsyncGenerator[str, None]:
+        self.requests.append(request)
+        if not self._streams:
+            await anyio.sleep_forever()
+        for item in self._streams.pop(0):
+            if isinstance(item, BaseException):
+                raise item
+            yield item
@@ -2,15 +2,19 @@ from __future__ import annotations
 
 import json
 
+import anyio
 import pytest
 
 from kubex.api import Api
+from kubex.core.exceptions import Gone
 from kubex.core.params import Timeout
 from kubex.k8s.v1_35.core.v1.node import Node
 from kubex.k8s.v1_35.core.v1.pod import Pod
+from kubex_core.models.lazy import is_lazy
 from kubex_core.models.list_entity import ListEntity
 from kubex_core.models.status import Status
-from test.stub_client import StubClient
+from kubex_core.models.watch_event import Bookmark
+from test.stub_client import ScriptedClient, StubClient
 
 
 @pytest.fixture
@@ -283,3 +287,232 @@ async def test_delete_collection_with_request_timeout() -> None:
     req = client.last_request
     assert isinstance(req.timeout, Timeout)
     assert req.timeout.total == 20
+
+
+@pytest.mark.anyio
+async def test_watch_raises_on_error_event() -> None:
+    error_event = json.dumps(
+        {
+            "type": "ERROR",
+            "object": {
+                "apiVersion": "v1",
+                "kind": "Status",
+                "metadata": {},
+                "status": "Failure",
+                "reason": "Expired",
+                "code": 410,
+            },
+        }
+    )
+    client = StubClient(stream_lines=[error_event])
+    api: Api[Pod] = Api(Pod, client=client, namespace="default")
+    with pytest.raises(Gone) as exc_info:
+        async for _ in api.watch():
+            pass
+    assert isinstance(exc_info.value.content, Status)
+    assert exc_info.value.content.reason == "Expired"
+
+
+def _pod_page(names: list[str], continue_token: str | None = None) -> bytes:
+    metadata: dict[str, str] = {"resourceVersion": "100"}
+    if continue_token is not None:
+        metadata["continue"] = continue_token
+    return json.dumps(
+        {
+            "apiVersion": "v1",
+            "kind": "PodList",
+            "metadata": metadata,
+            "items": [
+                {
+                    "apiVersion": "v1",
+                    "kind": "Pod",
+                    "metadata": {"name": name, "namespace": "default"},
+                }
+                for name in names
+            ],
+        }
+    ).encode()
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("prefetch", [False, True])
+async def test_list_iter_follows_continue_token(prefetch: bool) -> None:
+    client = ScriptedClient(
+        responses=[
+            _pod_page(["a", "b"], continue_token="page-2"),
+            _pod_page(["c", "d"], continue_token="page-3"),
+            _pod_page(["e"]),
+        ]
+    )
+    api: Api[Pod] = Api(Pod, client=client, namespace="default")
+    async with api.list_iter(
+        limit=2, resource_version="0", label_selector="app=web", prefetch=prefetch
+    ) as pods:
+        names = [pod.metadata.name async for pod in pods]
+    assert names == ["a", "b", "c", "d", "e"]
+    assert [r.query_params for r in client.requests] == [
+        {"labelSelector": "app=web", "limit": "2", "resourceVersion": "0"},
+        {"labelSelector": "app=web", "limit": "2", "continue": "page-2"},
+        {"labelSelector": "app=web", "limit": "2", "continue": "page-3"},
+    ]
+
+
+@pytest.mark.anyio
+async def test_list_iter_prefetches_next_page() -> None:
+    client = ScriptedClient(
+        responses=[_pod_page(["a"], continue_token="page-2"), _pod_page(["b"])]
+    )
+    api: Api[Pod] = Api(Pod, client=client, namespace="default")
+    async with api.list_iter(prefetch=True) as pods:
+        first = await pods.__anext__()
+        assert first.metadata.name == "a"
+        # Yield to the background task fetching the second page.
+        await anyio.wait_all_tasks_blocked()
+        assert len(client.requests) == 2
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("prefetch", [False, True])
+async def test_list_iter_propagates_errors(prefetch: bool) -> None:
+    client = ScriptedClient(
+        responses=[
+            _pod_page(["a"], continue_token="page-2"),
+            Gone(content="continue token expired"),
+        ]
+    )
+    api: Api[Pod] = Api(Pod, client=client, namespace="default")
+    names = []
+    with pytest.raises(Gone):
+        async with api.list_iter(prefetch=prefetch) as pods:
+            async for pod in pods:
+                names.append(pod.metadata.name)
+    assert names == ["a"]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio", "trio"])
+@pytest.mark.parametrize("prefetch", [False, True])
+async def test_list_iter_can_be_left_early(prefetch: bool) -> None:
+    client = ScriptedClient(
+        responses=[
+            _pod_page(["a", "b"], continue_token="page-2"),
+            _pod_page(["c"], continue_token="page-3"),
+            _pod_page(["d"]),
+        ]
+    )
+    api: Api[Pod] = Api(Pod, client=client, namespace="default")
+    async with api.list_iter(limit=2, prefetch=prefetch) as pods:
+        async for pod in pods:
+            break
+    assert pod.metadata.name == "a"
+    assert len(client.requests) <= 2
+    if not prefetch:
+        async for pod in api.list_iter(limit=2):
+            break
+        assert pod.metadata.name == "c"
+
+
+@pytest.mark.anyio
+async def test_list_iter_with_prefetch_must_be_entered() -> None:
+    api: Api[Pod] = Api(Pod, client=ScriptedClient(), namespace="default")
+    with pytest.raises(RuntimeError, match="async with"):
+        async for _ in api.list_iter(prefetch=True):
+            pass
+
+
+@pytest.mark.anyio
+async def test_watch_list_requests_initial_events_and_flags_end_bookmark() -> None:
+    added = json.dumps(
+        {
+            "type": "ADDED",
+            "object": {
+                "apiVersion": "v1",
+                "kind": "Pod",
+                "metadata": {"name": "pod-1", "namespace": "default"},
+            },
+        }
+    )
+    end = json.dumps(
+        {
+            "type": "BOOKMARK",
+            "object": {
+                "apiVersion": "v1",
+                "kind": "Pod",
+                "metadata": {
+                    "resourceVersion": "100",
+                    "annotations": {"k8s.io/initial-events-end": "true"},
+                },
+            },
+        }
+    )
+    client = StubClient(stream_lines=[added, end])
+    api: Api[Pod] = Api(Pod, client=client, namespace="default")
+    events = [event async for event in api.watch_list(label_selector="app=web")]
+    assert [event.is_initial_events_end for event in events] == [False, True]
+    assert client.last_request.query_params == {
+        "watch": "true",
+        "labelSelector": "app=web",
+        "allowBookmarks": "true",
+        "sendInitialEvents": "true",
+        "resourceVersionMatch": "NotOlderThan",
+    }
+
+
+@pytest.mark.anyio
+async def test_list_lazy_validates_items_on_access() -> None:
+    client = StubClient(response_content=POD_LIST_JSON)
+    api: Api[Pod] = Api(Pod, client=client, namespace="default")
+    result = await api.list(lazy=True)
+    assert all(is_lazy(pod) for pod in result.items)
+    assert [pod.metadata.name for pod in result.items] == ["pod-1", "pod-2"]
+    assert result == await api.list()
+
+
+@pytest.mark.anyio
+async def test_watch_lazy_validates_event_objects_on_access() -> None:
+    added = json.dumps(
+        {
+            "type": "ADDED",
+            "object": {
+                "apiVersion": "v1",
+                "kind": "Pod",
+                "metadata": {"name": "pod-1", "namespace": "default"},
+            },
+        }
+    )
+    bookmark = json.dumps(
+        {
+            "type": "BOOKMARK",
+            "object": {"kind": "Pod", "metadata": {"resourceVersion": "12"}},
+        }
+    )
+    client = StubClient(stream_lines=[added, bookmark])
+    api: Api[Pod] = Api(Pod, client=client, namespace="default")
+    events = [event async for event in api.watch(lazy=True)]
+    assert is_lazy(events[0].object)
+    assert events[0].object.metadata.name == "pod-1"
+    assert isinstance(events[1].object, Bookmark)
+    assert events[1].object.metadata.resource_version == "12"
+
+
+@pytest.mark.anyio
+async def test_list_with_fields_validates_only_the_selected_fields() -> None:
+    client = StubClient(response_content=POD_LIST_JSON)
+    api: Api[Pod] = Api(Pod, client=client, namespace="default")
+    result = await api.list(fields=["metadata.name"])
+    assert [pod.metadata.name for pod in result.items] == ["pod-1", "pod-2"]
+    assert not hasattr(result.items[0], "spec")
+    assert not hasattr(result.items[0].metadata, "namespace")
+    assert client.last_request.query_params is None
+
+
+@pytest.mark.anyio
+async def test_get_and_watch_with_fields() -> None:
+    added = json.dumps({"type": "ADDED", "object": json.loads(POD_JSON)})
+    client = StubClient(response_content=POD_JSON, stream_lines=[added])
+    api: Api[Pod] = Api(Pod, client=client, namespace="default")
+    pod = await api.get("my-pod", fields=["status.phase"])
+    assert pod.metadata.name == "my-pod"
+    assert not hasattr(pod, "spec")
+    events = [event async for event in api.watch(fields=["status.phase"])]
+    assert type(events[0].object) is type(pod)
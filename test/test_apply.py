@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import anyio
+import pytest
+from yaml import safe_load
+
+from kubex.api import Api, Applier
+from kubex.core.exceptions import Conflict
+from kubex.core.patch import ApplyPatch
+from kubex.core.request import Request
+from kubex.core.response import HeadersWrapper, Response
+from kubex.k8s.v1_35.core.v1.config_map import ConfigMap
+from kubex.k8s.v1_35.core.v1.namespace import Namespace
+from kubex_core.models.metadata import ObjectMetadata
+from test.stub_client import StubClient
+
+
+@pytest.fixture(params=["asyncio", "trio"])
+def anyio_backend(request: pytest.FixtureRequest) -> str:
+    return str(request.param)
+
+
+class ApplyClient(StubClient):
+    """Echoes apply bodies, failing the requests while ``failing`` is set."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.failing = False
+
+    async def request(self, request: Request) -> Response:
+        self.requests.append(request)
+        if self.failing:
+            raise Conflict(content="conflict with another manager")
+        assert request.body is not None
+        return Response(
+            content=request.body if isinstance(request.body, bytes) else b"",
+            headers=HeadersWrapper({}),
+            status_code=200,
+        )
+
+
+def _config_map(value: str, **metadata: Any) -> ConfigMap:
+    return ConfigMap(
+        metadata=ObjectMetadata(name="cm", **metadata), data={"key": value}
+    )
+
+
+@pytest.mark.anyio
+async def test_apply_sends_a_stripped_json_body() -> None:
+    client = ApplyClient()
+    applier = Applier(
+        Api(ConfigMap, client=client, namespace="default"), "kubex", force=True
+    )
+    desired = ConfigMap.model_validate(
+        {
+            "metadata": {
+                "name": "cm",
+                "labels": {"b": "2", "a": "1"},
+                "resourceVersion": "42",
+                "managedFields": [{"manager": "kubectl", "operation": "Apply"}],
+            },
+            "data": {"key": "value"},
+        }
+    )
+
+    result = await applier.apply(desired)
+
+    assert result is not None and result.data == {"key": "value"}
+    (request,) = client.requests
+    assert request.method == "PATCH"
+    assert request.url == "/api/v1/namespaces/default/configmaps/cm"
+    assert request.headers is not None
+    assert request.headers["content-type"] == "application/apply-patch+yaml"
+    assert request.query_params == {"fieldManager": "kubex", "force": "true"}
+    assert request.body is not None
+    assert json.loads(request.body) == {
+        "apiVersion": "v1",
+        "kind": "ConfigMap",
+        "metadata": {"name": "cm", "labels": {"a": "1", "b": "2"}},
+        "data": {"key": "value"},
+    }
+
+
+@pytest.mark.anyio
+async def test_unchanged_state_is_not_applied_again() -> None:
+    client = ApplyClient()
+    applier = Applier(Api(ConfigMap, client=client, namespace="default"), "kubex")
+
+    assert await applier.apply(_config_map("v1")) is not None
+    # Server-owned fields and key order do not count as changes.
+    assert await applier.apply(_config_map("v1", resource_version="7")) is None
+    assert len(client.requests) == 1
+
+    assert await applier.apply(_config_map("v2")) is not None
+    assert await applier.apply(_config_map("v2", namespace="other")) is not None
+    assert len(client.requests) == 3
+    assert len(applier) == 2
+
+    applier.forget("cm")
+    assert await applier.apply(_config_map("v2")) is not None
+    assert len(client.requests) == 4
+
+
+@pytest.mark.anyio
+async def test_failed_apply_is_retried() -> None:
+    client = ApplyClient()
+    applier = Applier(Api(ConfigMap, client=client, namespace="default"), "kubex")
+    await applier.apply(_config_map("v1"))
+
+    client.failing = True
+    with pytest.raises(Conflict):
+        await applier.apply(_config_map("v2"))
+    with pytest.raises(Conflict):
+        await applier.apply(_config_map("v1"))
+    client.failing = False
+    assert await applier.apply(_config_map("v1")) is not None
+    assert len(client.requests) == 4
+
+
+@pytest.mark.anyio
+async def test_max_age_and_cache_size_expire_digests() -> None:
+    client = ApplyClient()
+    api = Api(ConfigMap, client=client, namespace="default")
+    applier = Applier(api, "kubex", max_age=0.05)
+    await applier.apply(_config_map("v1"))
+    await anyio.sleep(0.06)
+    assert await applier.apply(_config_map("v1")) is not None
+
+    applier = Applier(api, "kubex", cache_size=1)
+    await applier.apply(_config_map("v1"))
+    await applier.apply(_config_map("v1", namespace="other"))
+    assert len(applier) == 1
+    assert await applier.apply(_config_map("v1")) is not None
+
+
+@pytest.mark.anyio
+async def test_cluster_scoped_objects_and_missing_names() -> None:
+    client = ApplyClient()
+    applier = Applier(Api(Namespace, client=client), "kubex")
+    await applier.apply(Namespace(metadata=ObjectMetadata(name="team-a")))
+    assert client.requests[0].url == "/api/v1/namespaces/team-a"
+    with pytest.raises(ValueError):
+        await applier.apply(Namespace(metadata=ObjectMetadata()))
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"field_manager": ""}, {"max_age": 0}, {"cache_size": 0}]
+)
+def test_invalid_arguments(kwargs: dict[str, Any]) -> None:
+    options: dict[str, Any] = {"field_manager": "kubex", **kwargs}
+    with pytest.raises(ValueError):
+        Applier(Api(ConfigMap, client=StubClient(), namespace="default"), **options)
+
+
+def test_apply_patch_serializes_json_readable_as_yaml() -> None:
+    body = ApplyPatch(_config_map("a: b")).serialize()
+    expected = {"metadata": {"name": "cm"}, "data": {"key": "a: b"}}
+    assert json.loads(body) == expected
+    assert safe_load(body) == expected
@@ -79,8 +79,8 @@ class _FakeClient(BaseClient):
     def _create_inner_client(self) -> Any:  # pragma: no cover
         return object()
 
-    async def request(self, request: Request) -> Any:  # pragma: no cover
-        raise AssertionError("request should not be called for attach")
+    async def _send(self, request: Request) -> Any:  # pragma: no cover
+        raise AssertionError("_send should not be called for attach")
 
     def stream_lines(self, request: Request) -> Any:  # pragma: no cover
         raise AssertionError("stream_lines should not be called for attach")
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from kubex.core.backoff import Backoff
+
+
+def test_backoff_without_jitter_grows_exponentially_up_to_maximum() -> None:
+    backoff = Backoff(initial=1.0, maximum=10.0, factor=2.0, jitter=False)
+    assert [backoff.delay(attempt) for attempt in range(6)] == [1, 2, 4, 8, 10, 10]
+    assert backoff.delay(10_000) == 10.0
+
+
+def test_backoff_with_jitter_stays_below_the_bound() -> None:
+    backoff = Backoff(initial=1.0, maximum=5.0)
+    for attempt in range(10):
+        bound = min(5.0, 2.0**attempt)
+        delays = {backoff.delay(attempt) for _ in range(50)}
+        assert all(0 <= delay <= bound for delay in delays)
+        assert len(delays) > 1
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"initial": -1.0}, {"maximum": -1.0}, {"factor": 0.5}]
+)
+def test_backoff_rejects_invalid_arguments(kwargs: dict[str, Any]) -> None:
+    with pytest.raises(ValueError):
+        Backoff(**kwargs)
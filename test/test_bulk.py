@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import json
+from typing import Any, AsyncIterator
+
+import anyio
+import pytest
+
+from kubex.api import Api, BulkResult
+from kubex.core.exceptions import Conflict, NotFound
+from kubex.core.patch import MergePatch
+from kubex.core.request import Request
+from kubex.core.response import HeadersWrapper, Response
+from kubex.k8s.v1_35.core.v1.config_map import ConfigMap
+from kubex_core.models.metadata import ObjectMetadata
+from test.stub_client import StubClient
+
+
+@pytest.fixture(params=["asyncio", "trio"])
+def anyio_backend(request: pytest.FixtureRequest) -> str:
+    return str(request.param)
+
+
+class SlowClient(StubClient):
+    """Echoes request bodies after a delay that depends on the object name."""
+
+    def __init__(self, failing: frozenset[str] = frozenset()) -> None:
+        super().__init__()
+        self.failing = failing
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def request(self, request: Request) -> Response:
+        self.requests.append(request)
+        name = request.url.split("?", 1)[0].rsplit("/", 1)[-1]
+        if request.body is not None:
+            body = json.loads(request.body)
+            name = body.get("metadata", {}).get("name", name)
+        else:
+            body = {"metadata": {"name": name}}
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await anyio.sleep(0.03 if name.endswith("slow") else 0.005)
+        finally:
+            self.in_flight -= 1
+        if name in self.failing:
+            raise Conflict(content=f"{name} already exists")
+        body.setdefault("metadata", {}).setdefault("name", name)
+        body.update(apiVersion="v1", kind="ConfigMap")
+        return Response(
+            content=json.dumps(body).encode(),
+            headers=HeadersWrapper({}),
+            status_code=200,
+        )
+
+
+def _config_map(name: str, namespace: str | None = None) -> ConfigMap:
+    return ConfigMap(
+        metadata=ObjectMetadata(name=name, namespace=namespace), data={"k": name}
+    )
+
+
+@pytest.mark.anyio
+async def test_create_many_bounds_concurrency_and_streams_results() -> None:
+    client = SlowClient()
+    api: Api[ConfigMap] = Api(ConfigMap, client=client, namespace="default")
+    objects = [_config_map("first-slow")] + [_config_map(f"cm-{n}") for n in range(20)]
+
+    async with api.create_many(objects, concurrency=4) as created:
+        results = [result async for result in created]
+
+    assert client.max_in_flight == 4
+    assert all(result.ok for result in results)
+    names = [str(result.unwrap().metadata.name) for result in results]
+    assert sorted(names) == sorted(str(obj.metadata.name) for obj in objects)
+    # Results arrive in completion order: the slow first object is not first.
+    assert names[0] != "first-slow"
+    assert results[0].item.metadata.name == names[0]
+
+
+@pytest.mark.anyio
+async def test_create_many_uses_the_namespace_of_each_object() -> None:
+    client = SlowClient()
+    api: Api[ConfigMap] = Api(ConfigMap, client=client, namespace="default")
+    objects = [_config_map("a", "team-a"), _config_map("b")]
+    async with api.create_many(objects) as results:
+        async for _ in results:
+            pass
+    urls = sorted(request.url for request in client.requests)
+    assert urls == [
+        "/api/v1/namespaces/default/configmaps",
+        "/api/v1/namespaces/team-a/configmaps",
+    ]
+
+
+@pytest.mark.anyio
+async def test_errors_are_reported_per_item() -> None:
+    client = SlowClient(failing=frozenset({"cm-3"}))
+    api: Api[ConfigMap] = Api(ConfigMap, client=client, namespace="default")
+    async with api.replace_many(
+        (_config_map(f"cm-{n}") for n in range(6)), concurrency=2
+    ) as replaced:
+        results = [result async for result in replaced]
+    assert len(results) == 6
+    (failed,) = [result for result in results if not result.ok]
+    assert failed.item.metadata.name == "cm-3"
+    assert isinstance(failed.error, Conflict)
+    assert failed.result is None
+    with pytest.raises(Conflict):
+        failed.unwrap()
+    assert {request.method for request in client.requests} == {"PUT"}
+
+
+@pytest.mark.anyio
+async def test_stop_on_error_starts_no_further_items() -> None:
+    client = SlowClient(failing=frozenset({"cm-2"}))
+    api: Api[ConfigMap] = Api(ConfigMap, client=client, namespace="default")
+    async with api.delete_many(
+        [f"cm-{n}" for n in range(100)], concurrency=3, stop_on_error=True
+    ) as deleted:
+        results = [result async for result in deleted]
+    assert len(client.requests) < 10
+    assert len(results) == len(client.requests)
+    assert any(isinstance(result.error, Conflict) for result in results)
+
+
+@pytest.mark.anyio
+async def test_patch_many_accepts_an_async_iterable() -> None:
+    client = SlowClient()
+    api: Api[ConfigMap] = Api(ConfigMap, client=client, namespace="default")
+
+    async def patches() -> AsyncIterator[tuple[str, MergePatch[ConfigMap]]]:
+        for n in range(5):
+            labels = {"n": str(n)}
+            yield (
+                f"cm-{n}",
+                MergePatch(ConfigMap(metadata=ObjectMetadata(labels=labels))),
+            )
+
+    async with api.patch_many(patches()) as patched:
+        results = [result async for result in patched]
+    assert all(result.ok for result in results)
+    assert sorted(result.item[0] for result in results) == [f"cm-{n}" for n in range(5)]
+    assert {request.method for request in client.requests} == {"PATCH"}
+
+
+@pytest.mark.anyio
+async def test_input_errors_are_raised() -> None:
+    api: Api[ConfigMap] = Api(ConfigMap, client=SlowClient(), namespace="default")
+
+    def names() -> Any:
+        yield "cm-0"
+        raise NotFound(content="source is gone")
+
+    received: list[BulkResult[str, Any]] = []
+    with pytest.raises(NotFound):
+        async with api.delete_many(names()) as results:
+            async for result in results:
+                received.append(result)
+    assert [result.item for result in received] == ["cm-0"]
+
+
+@pytest.mark.anyio
+async def test_stopping_early_cancels_the_remaining_requests() -> None:
+    client = SlowClient()
+    api: Api[ConfigMap] = Api(ConfigMap, client=client, namespace="default")
+    async with api.delete_many(
+        [f"cm-{n}" for n in range(100)], concurrency=5
+    ) as results:
+        async for _ in results:
+            break
+    assert client.in_flight == 0
+    assert len(client.requests) < 10
+
+
+@pytest.mark.anyio
+async def test_breaking_out_of_the_loop_leaves_no_request_running() -> None:
+    client = SlowClient()
+    api: Api[ConfigMap] = Api(ConfigMap, client=client, namespace="default")
+    objects = [_config_map("cm-0")] + [_config_map(f"cm-{n}-slow") for n in range(19)]
+    async with api.create_many(objects, concurrency=4) as results:
+        async for result in results:
+            assert result.ok
+            break
+        # Still inside the block: the remaining requests keep running.
+        assert client.in_flight > 0
+    assert client.in_flight == 0
+    assert len(client.requests) < 20
+
+
+@pytest.mark.anyio
+async def test_bulk_operations_must_be_entered() -> None:
+    api: Api[ConfigMap] = Api(ConfigMap, client=SlowClient(), namespace="default")
+    operation = api.delete_many(["a"])
+    with pytest.raises(RuntimeError, match="async with"):
+        async for _ in operation:
+            pass
+    async with operation as results:
+        assert [result.item async for result in results] == ["a"]
+
+
+@pytest.mark.anyio
+async def test_concurrency_must_be_positive() -> None:
+    api: Api[ConfigMap] = Api(ConfigMap, client=SlowClient(), namespace="default")
+    with pytest.raises(ValueError):
+        api.delete_many(["a"], concurrency=0)
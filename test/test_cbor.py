@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import base64
+import json
+from typing import Any
+
+import pytest
+
+from kubex.api import Api
+from kubex.client.client import handle_request_error
+from kubex.core import cbor
+from kubex.core.exceptions import NotFound
+from kubex.core.params import WireFormat
+from kubex.core.response import HeadersWrapper, Response
+from kubex.core.request_builder.constants import (
+    ACCEPT_HEADER,
+    APPLICATION_CBOR_MIME_TYPE,
+    CONTENT_TYPE_HEADER,
+)
+from kubex.k8s.v1_35.core.v1.pod import Pod
+from kubex.k8s.v1_35.core.v1.secret import Secret
+from kubex_core.models.lazy import is_lazy
+from kubex_core.models.status import Status
+from test.stub_client import StubClient
+
+cbor2 = pytest.importorskip("cbor2")
+
+CBOR_HEADERS = {CONTENT_TYPE_HEADER: APPLICATION_CBOR_MIME_TYPE}
+
+POD = {
+    "apiVersion": "v1",
+    "kind": "Pod",
+    "metadata": {
+        "name": "my-pod",
+        "namespace": "default",
+        "creationTimestamp": "2024-01-01T00:00:00Z",
+    },
+    "spec": {"containers": [{"name": "app", "image": "nginx"}]},
+}
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+def _api(client: StubClient) -> Api[Pod]:
+    return Api(Pod, client=client, namespace="default", wire_format=WireFormat.CBOR)
+
+
+def test_loads_decodes_self_described_documents() -> None:
+    data = cbor.SELF_DESCRIBED_CBOR + cbor2.dumps({"data": cbor2.CBORTag(22, b"hi")})
+    assert cbor.loads(data) == {"data": "aGk="}
+    assert cbor.loads(cbor.dumps({"items": [1, "a"]})) == {"items": [1, "a"]}
+
+
+def test_loads_rejects_invalid_data() -> None:
+    with pytest.raises(ValueError):
+        cbor.loads(b"\x5f\x41")
+
+
+@pytest.mark.parametrize("step", [1, 5, 1024])
+def test_sequence_decoder_handles_split_documents(step: int) -> None:
+    documents = [{"type": "ADDED", "object": {"n": n}} for n in range(3)]
+    data = b"".join(cbor.dumps(document) for document in documents)
+    decoder = cbor.CborSequenceDecoder()
+    decoded: list[Any] = []
+    for start in range(0, len(data), step):
+        decoded += decoder.feed(data[start : start + step])
+    assert decoded == documents
+    assert decoder.pending == 0
+
+
+def test_sequence_decoder_decodes_each_document_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    document = {
+        "object": {"items": [{"n": n, "f": n / 2, "ok": True} for n in range(200)]},
+        "data": cbor2.CBORTag(22, b"x" * 300),
+        "none": None,
+    }
+    # Indefinite-length array, map and byte string: [1, {"a": b"hi"}]
+    indefinite = b"\x9f\x01\xbf\x61a\x5f\x41h\x41i\xff\xff\xff"
+    data = cbor.dumps(document) + cbor.SELF_DESCRIBED_CBOR + indefinite
+    decoded_sizes: list[int] = []
+    loads = cbor.loads
+
+    def counting_loads(chunk: bytes) -> Any:
+        decoded_sizes.append(len(chunk))
+        return loads(chunk)
+
+    monkeypatch.setattr(cbor, "loads", counting_loads)
+    decoder = cbor.CborSequenceDecoder()
+    decoded: list[Any] = []
+    for offset in range(len(data)):
+        decoded += decoder.feed(data[offset : offset + 1])
+    assert decoded == [
+        {**document, "data": base64.b64encode(b"x" * 300).decode()},
+        [1, {"a": b"hi"}],
+    ]
+    assert decoded_sizes == [len(data) - len(indefinite) - 3, len(indefinite) + 3]
+    assert decoder.pending == 0
+
+
+@pytest.mark.parametrize("data", [b"\x01\xff", b"\x1c", b"\x82\x01\xff"])
+def test_sequence_decoder_rejects_invalid_data(data: bytes) -> None:
+    with pytest.raises(ValueError):
+        cbor.CborSequenceDecoder().feed(data)
+
+
+@pytest.mark.anyio
+async def test_get_requests_and_decodes_cbor() -> None:
+    client = StubClient(response_content=cbor.dumps(POD), headers=CBOR_HEADERS)
+    pod = await _api(client).get("my-pod")
+    assert pod.metadata.name == "my-pod"
+    assert pod.metadata.creation_timestamp is not None
+    assert pod.spec is not None and pod.spec.containers[0].image == "nginx"
+    assert client.last_request.headers is not None
+    assert client.last_request.headers[ACCEPT_HEADER].startswith(
+        APPLICATION_CBOR_MIME_TYPE
+    )
+
+
+@pytest.mark.anyio
+async def test_get_lazy_cbor() -> None:
+    client = StubClient(response_content=cbor.dumps(POD), headers=CBOR_HEADERS)
+    pod = await _api(client).get("my-pod", lazy=True)
+    assert is_lazy(pod)
+    assert pod.metadata.name == "my-pod"
+
+
+@pytest.mark.anyio
+async def test_json_response_is_accepted() -> None:
+    client = StubClient(
+        response_content=json.dumps(POD).encode(),
+        headers={CONTENT_TYPE_HEADER: "application/json"},
+    )
+    pod = await _api(client).get("my-pod")
+    assert pod.metadata.name == "my-pod"
+
+
+@pytest.mark.anyio
+async def test_list_decodes_cbor() -> None:
+    pod_list = {
+        "apiVersion": "v1",
+        "kind": "PodList",
+        "metadata": {"resourceVersion": "7"},
+        "items": [POD],
+    }
+    client = StubClient(response_content=cbor.dumps(pod_list), headers=CBOR_HEADERS)
+    result = await _api(client).list()
+    assert [pod.metadata.name for pod in result.items] == ["my-pod"]
+
+
+@pytest.mark.anyio
+async def test_create_sends_cbor_body() -> None:
+    client = StubClient(response_content=cbor.dumps(POD), headers=CBOR_HEADERS)
+    pod = Pod.model_validate(POD)
+    await _api(client).create(pod)
+    request = client.last_request
+    assert request.headers is not None
+    assert request.headers[CONTENT_TYPE_HEADER] == APPLICATION_CBOR_MIME_TYPE
+    assert isinstance(request.body, bytes)
+    assert cbor.loads(request.body)["metadata"]["name"] == "my-pod"
+
+
+@pytest.mark.anyio
+async def test_base64_fields_round_trip() -> None:
+    secret = {
+        "apiVersion": "v1",
+        "kind": "Secret",
+        "metadata": {"name": "token"},
+        "data": {"token": cbor2.CBORTag(22, b"s3cr3t")},
+    }
+    client = StubClient(response_content=cbor.dumps(secret), headers=CBOR_HEADERS)
+    api: Api[Secret] = Api(
+        Secret, client=client, namespace="default", wire_format=WireFormat.CBOR
+    )
+    result = await api.get("token")
+    assert result.data == {"token": "czNjcjN0"}
+
+
+@pytest.mark.anyio
+async def test_watch_decodes_cbor_sequence() -> None:
+    events = [
+        {"type": "ADDED", "object": POD},
+        {
+            "type": "BOOKMARK",
+            "object": {"kind": "Pod", "metadata": {"resourceVersion": "9"}},
+        },
+    ]
+    data = b"".join(cbor.dumps(event) for event in events)
+    client = StubClient(stream_chunks=[data[:10], data[10:50], data[50:]])
+    received = [event async for event in _api(client).watch()]
+    assert isinstance(received[0].object, Pod)
+    assert received[0].object.metadata.name == "my-pod"
+    assert received[1].object.metadata.resource_version == "9"
+
+
+@pytest.mark.anyio
+async def test_watch_falls_back_to_json_lines() -> None:
+    lines = json.dumps({"type": "ADDED", "object": POD}).encode() + b"\n"
+    client = StubClient(stream_chunks=[lines[:20], lines[20:] + lines])
+    received = [event async for event in _api(client).watch()]
+    assert [event.object.metadata.name for event in received] == ["my-pod"] * 2
+
+
+def test_cbor_error_status_is_raised() -> None:
+    status = {
+        "apiVersion": "v1",
+        "kind": "Status",
+        "metadata": {},
+        "status": "Failure",
+        "message": 'pods "x" not found',
+        "reason": "NotFound",
+        "code": 404,
+    }
+    response = Response(
+        status_code=404,
+        headers=HeadersWrapper(CBOR_HEADERS),
+        content=cbor.dumps(status),
+    )
+    with pytest.raises(NotFound) as exc_info:
+        handle_request_error(response)
+    assert isinstance(exc_info.value.content, Status)
+    assert exc_info.value.content.reason == "NotFound"
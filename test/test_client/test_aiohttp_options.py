@@ -401,3 +401,13 @@ def test_trust_env_true_proxy_dict_no_matching_scheme_does_not_disable_trust_env
         for w in caught
     )
     assert kwargs.get("trust_env") is True
+
+
+def test_http2_warns_and_is_ignored() -> None:
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        _patched_session_client(ClientOptions(http2=True))
+    assert any(
+        issubclass(w.category, UserWarning) and "http2" in str(w.message)
+        for w in caught
+    )
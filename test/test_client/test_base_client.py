@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import warnings
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -76,3 +77,112 @@ async def test_log_api_warnings_false_suppresses_warning() -> None:
             issubclass(w.category, UserWarning) and "API Warning" in str(w.message)
             for w in caught
         )
+
+
+@pytest.mark.anyio
+async def test_stream_bytes_yields_body_chunks() -> None:
+    from kubex.core.request import Request
+
+    client = HttpxClient(_config())
+    body = b'{"items": []}' * 1000
+
+    def handler(request: Any) -> Any:
+        assert request.url.params["limit"] == "10"
+        return httpx.Response(200, content=body)
+
+    client._inner_client = httpx.AsyncClient(
+        base_url="https://example.invalid", transport=httpx.MockTransport(handler)
+    )
+    req = Request(method="GET", url="/api/v1/pods", query_params={"limit": "10"})
+    chunks = [chunk async for chunk in client.stream_bytes(req)]
+    assert b"".join(chunks) == body
+
+
+@pytest.mark.anyio
+async def test_stream_bytes_raises_for_error_status() -> None:
+    from kubex.core.exceptions import NotFound
+    from kubex.core.request import Request
+
+    client = HttpxClient(_config())
+    client._inner_client = httpx.AsyncClient(
+        base_url="https://example.invalid",
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(404, content=b"not found")
+        ),
+    )
+    req = Request(method="GET", url="/api/v1/pods", query_params={})
+    with pytest.raises(NotFound):
+        async for _ in client.stream_bytes(req):
+            pass
+
+
+@pytest.mark.anyio
+async def test_stream_raw_lines_splits_lines_across_chunks() -> None:
+    from kubex.core.request import Request
+
+    client = HttpxClient(_config())
+    chunks = [b'{"a": 1}\n{"b"', b": 2}\n", b'{"c":', b" 3}\n\n", b'{"d": 4}']
+
+    async def body() -> Any:
+        for chunk in chunks:
+            yield chunk
+
+    client._inner_client = httpx.AsyncClient(
+        base_url="https://example.invalid",
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=body())
+        ),
+    )
+    req = Request(method="GET", url="/api/v1/pods", query_params={"watch": "true"})
+    lines = [line async for line in client.stream_raw_lines(req)]
+    assert lines == [b'{"a": 1}', b'{"b": 2}', b'{"c": 3}', b"", b'{"d": 4}']
+
+
+@pytest.mark.anyio
+async def test_request_headers_are_cached_until_the_token_changes() -> None:
+    from kubex.core.request import Request
+
+    config = ClientConfiguration(
+        url="https://example.invalid", insecure_skip_tls_verify=True, token="one"
+    )
+    client = HttpxClient(config)
+    request = Request(method="GET", url="/api/v1/pods")
+    headers = await client._request_headers(request)
+    assert headers == {"authorization": "Bearer one"}
+    assert await client._request_headers(request) is headers
+
+    merged = await client._request_headers(
+        Request(method="GET", url="/api/v1/pods", headers={"accept": "text/plain"})
+    )
+    assert merged == {"authorization": "Bearer one", "accept": "text/plain"}
+    assert headers == {"authorization": "Bearer one"}
+
+    config._token = "two"
+    assert await client._request_headers(request) == {"authorization": "Bearer two"}
+
+
+@pytest.mark.anyio
+async def test_request_headers_without_token() -> None:
+    from kubex.core.request import Request
+
+    client = HttpxClient(_config())
+    assert await client._request_headers(Request(method="GET", url="/")) == {}
+
+
+@pytest.mark.anyio
+async def test_request_headers_use_token_provider() -> None:
+    from kubex.core.request import Request
+
+    token_provider = AsyncMock()
+    token_provider.to_header = AsyncMock(return_value="Bearer provided")
+    config = _config()
+    config.token_provider = token_provider
+    client = HttpxClient(config)
+    request = Request(method="GET", url="/api/v1/pods")
+    assert await client._request_headers(request) == {
+        "authorization": "Bearer provided"
+    }
+    token_provider.to_header.return_value = "Bearer refreshed"
+    assert await client._request_headers(request) == {
+        "authorization": "Bearer refreshed"
+    }
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import warnings
-from unittest.mock import AsyncMock, patch
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -78,3 +79,34 @@ async def test_aiohttp_log_api_warnings_false_suppresses_warning() -> None:
             issubclass(w.category, UserWarning) and "API Warning" in str(w.message)
             for w in caught
         )
+
+
+@pytest.mark.anyio
+async def test_aiohttp_stream_bytes_yields_body_chunks() -> None:
+    client = AioHttpClient(_config(), ClientOptions(log_api_warnings=False))
+    chunks = [b'{"items": [', b"]}"]
+
+    async def iter_any() -> Any:
+        for chunk in chunks:
+            yield chunk
+
+    close = MagicMock()
+    mock_response_obj = type(
+        "FakeResp",
+        (),
+        {
+            "status": 200,
+            "headers": CIMultiDict(),
+            "content": type("FakeContent", (), {"iter_any": staticmethod(iter_any)})(),
+            "close": close,
+        },
+    )()
+    with patch.object(
+        client._inner_client, "request", new=AsyncMock(return_value=mock_response_obj)
+    ):
+        from kubex.core.request import Request
+
+        req = Request(method="GET", url="/api/v1/pods", query_params={})
+        received = [chunk async for chunk in client.stream_bytes(req)]
+    assert received == chunks
+    close.assert_called_once()
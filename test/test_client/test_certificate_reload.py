@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Any
+
+import anyio
+import pytest
+
+from kubex.client.options import ClientOptions
+from kubex.configuration import ClientConfiguration
+from kubex.core.request import Request
+
+certifi = pytest.importorskip("certifi")
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+def ca_file(tmp_path: Path) -> Path:
+    path = tmp_path / "ca.crt"
+    shutil.copyfile(certifi.where(), path)
+    return path
+
+
+def _config(ca_file: Path) -> ClientConfiguration:
+    return ClientConfiguration(url="https://example.invalid", server_ca_file=ca_file)
+
+
+def _rotate(path: Path, content: str | None = None) -> None:
+    path.write_text(content if content is not None else path.read_text())
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _httpx_ssl_contexts(client: Any) -> list[Any]:
+    transports = [client._inner_client._transport]
+    transports += client._inner_client._mounts.values()
+    return [transport._pool._ssl_context for transport in transports]
+
+
+def test_create_ssl_context(ca_file: Path) -> None:
+    config = _config(ca_file)
+    assert config.certificate_files == [ca_file]
+    assert config.create_ssl_context().get_ca_certs()
+
+
+@pytest.mark.anyio
+async def test_httpx_reload_certificates_builds_a_new_client(ca_file: Path) -> None:
+    pytest.importorskip("httpx")
+    from kubex.client.httpx import HttpxClient
+
+    client = HttpxClient(
+        _config(ca_file),
+        ClientOptions(proxy={"https": "http://proxy.example.com:8080"}),
+    )
+    old = client._inner_client
+    before = _httpx_ssl_contexts(client)
+    await client.reload_certificates()
+    after = _httpx_ssl_contexts(client)
+    assert client._inner_client is not old
+    assert old.is_closed
+    assert len(set(map(id, after))) == 1
+    assert not set(map(id, before)) & set(map(id, after))
+    await client.close()
+
+
+@pytest.mark.anyio
+async def test_httpx_reload_certificates_updates_websocket_client(
+    ca_file: Path,
+) -> None:
+    pytest.importorskip("h2")
+    from kubex.client.httpx import HttpxClient
+
+    client = HttpxClient(_config(ca_file), ClientOptions(http2=True))
+    old_websocket_client: Any = client._get_websocket_client()
+    await client.reload_certificates()
+    (ssl_context,) = set(_httpx_ssl_contexts(client))
+    websocket_client: Any = client._get_websocket_client()
+    assert websocket_client is not old_websocket_client
+    assert old_websocket_client.is_closed
+    assert websocket_client._transport._pool._ssl_context is ssl_context
+    await client.close()
+
+
+@pytest.mark.anyio
+async def test_httpx_reload_certificates_lets_requests_finish(ca_file: Path) -> None:
+    httpx = pytest.importorskip("httpx")
+    from kubex.client.httpx import HttpxClient
+
+    started = anyio.Event()
+    release = anyio.Event()
+
+    async def handler(request: Any) -> Any:
+        started.set()
+        await release.wait()
+        return httpx.Response(200, json={"kind": "Status"})
+
+    client = HttpxClient(_config(ca_file))
+    old = client._inner_client = httpx.AsyncClient(
+        base_url="https://example.invalid", transport=httpx.MockTransport(handler)
+    )
+    responses: list[Any] = []
+
+    async def send() -> None:
+        responses.append(
+            await client.request(Request(method="GET", url="/api/v1/pods"))
+        )
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(send)
+        await started.wait()
+        await client.reload_certificates()
+        assert client._inner_client is not old
+        assert not old.is_closed
+        release.set()
+    assert responses[0].status_code == 200
+    assert old.is_closed
+    await client.close()
+
+
+@pytest.mark.anyio
+async def test_aiohttp_reload_certificates(ca_file: Path) -> None:
+    pytest.importorskip("aiohttp")
+    from kubex.client.aiohttp import AioHttpClient
+
+    client = AioHttpClient(_config(ca_file))
+    assert client._ssl is True
+    await client.reload_certificates()
+    assert client._ssl is not True
+    assert client._ssl is not client._inner_client.connector._ssl
+    await client.close()
+
+
+def _periodic_client(ca_file: Path) -> Any:
+    pytest.importorskip("httpx")
+    from kubex.client.httpx import HttpxClient
+
+    client = HttpxClient(
+        _config(ca_file), ClientOptions(certificate_reload_interval=60)
+    )
+    client._certificates_checked_at -= 61
+    return client
+
+
+@pytest.mark.anyio
+async def test_rotated_certificates_are_reloaded(ca_file: Path) -> None:
+    client = _periodic_client(ca_file)
+    request = Request(method="GET", url="/api/v1/pods")
+    before = _httpx_ssl_contexts(client)
+    await client._before_send(request)
+    assert _httpx_ssl_contexts(client) == before
+
+    _rotate(ca_file)
+    await client._before_send(request)
+    assert _httpx_ssl_contexts(client) == before
+
+    client._certificates_checked_at -= 61
+    await client._before_send(request)
+    assert _httpx_ssl_contexts(client) != before
+
+
+@pytest.mark.anyio
+async def test_invalid_rotated_certificates_are_retried(
+    ca_file: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    client = _periodic_client(ca_file)
+    request = Request(method="GET", url="/api/v1/pods")
+    before = _httpx_ssl_contexts(client)
+    valid = ca_file.read_text()
+
+    _rotate(ca_file, "not a certificate")
+    with caplog.at_level(logging.WARNING, logger="kubex.client"):
+        await client._before_send(request)
+    assert "Failed to reload the TLS certificates" in caplog.text
+    assert _httpx_ssl_contexts(client) == before
+
+    _rotate(ca_file, valid)
+    client._certificates_checked_at -= 61
+    await client._before_send(request)
+    assert _httpx_ssl_contexts(client) != before
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import gzip
+import json
+from typing import Any
+
+import pytest
+
+from kubex.client.options import ClientOptions
+from kubex.configuration import ClientConfiguration
+from kubex.core.request import Request
+from kubex.core.request_builder.constants import ACCEPT_ENCODING_HEADER
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+def _config(disable_compression: bool = False) -> ClientConfiguration:
+    return ClientConfiguration(
+        url="https://example.invalid",
+        insecure_skip_tls_verify=True,
+        disable_compression=disable_compression,
+    )
+
+
+@pytest.mark.parametrize(
+    "compression,disable_compression,expected",
+    [
+        pytest.param(None, False, "gzip", id="default"),
+        pytest.param(None, True, "identity", id="kubeconfig_disabled"),
+        pytest.param(False, False, "identity", id="option_disabled"),
+        pytest.param(True, True, "gzip", id="option_overrides_kubeconfig"),
+    ],
+)
+def test_accept_encoding(
+    compression: bool | None, disable_compression: bool, expected: str
+) -> None:
+    pytest.importorskip("httpx")
+    from kubex.client.httpx import HttpxClient
+
+    client = HttpxClient(
+        _config(disable_compression), ClientOptions(compression=compression)
+    )
+    assert client._inner_client.headers[ACCEPT_ENCODING_HEADER] == expected
+
+
+@pytest.mark.parametrize("compression,expected", [(None, "gzip"), (False, "identity")])
+@pytest.mark.anyio
+async def test_aiohttp_accept_encoding(compression: bool | None, expected: str) -> None:
+    pytest.importorskip("aiohttp")
+    from kubex.client.aiohttp import AioHttpClient
+
+    client = AioHttpClient(_config(), ClientOptions(compression=compression))
+    try:
+        assert client._inner_client.headers[ACCEPT_ENCODING_HEADER] == expected
+    finally:
+        await client.close()
+
+
+def _gzip_client(body: bytes) -> tuple[Any, list[str]]:
+    httpx = pytest.importorskip("httpx")
+    from kubex.client.httpx import HttpxClient
+
+    client = HttpxClient(_config())
+    sent: list[str] = []
+
+    def handler(request: Any) -> Any:
+        sent.append(request.headers[ACCEPT_ENCODING_HEADER])
+        return httpx.Response(
+            200,
+            headers={"content-encoding": "gzip"},
+            content=gzip.compress(body),
+        )
+
+    client._inner_client._transport = httpx.MockTransport(handler)
+    return client, sent
+
+
+@pytest.mark.anyio
+async def test_gzip_response_is_decompressed() -> None:
+    body = json.dumps({"kind": "PodList", "items": []}).encode()
+    client, sent = _gzip_client(body)
+    response = await client.request(Request(method="GET", url="/api/v1/pods"))
+    assert response.content == body
+    assert sent == ["gzip"]
+
+
+@pytest.mark.anyio
+async def test_gzip_stream_is_decompressed() -> None:
+    lines = [json.dumps({"type": "ADDED", "n": n}).encode() for n in range(100)]
+    client, _ = _gzip_client(b"\n".join(lines) + b"\n")
+    request = Request(method="GET", url="/api/v1/pods", query_params={"watch": "1"})
+    assert [line async for line in client.stream_raw_lines(request)] == lines
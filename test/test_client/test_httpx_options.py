@@ -20,6 +20,7 @@ from kubex.client.httpx import (  # noqa: E402
 from kubex.client.options import resolve_ws_max_message_size  # noqa: E402
 from kubex.client.options import ClientOptions  # noqa: E402
 from kubex.configuration import ClientConfiguration  # noqa: E402
+from kubex.core.exceptions import ConfgiurationError  # noqa: E402
 from kubex.core.request import Request  # noqa: E402
 
 
@@ -293,6 +294,50 @@ async def test_connect_websocket_none_max_message_size_warns_and_skips_param() -
     assert "max_message_size_bytes" not in kwargs
 
 
+def test_create_inner_client_http2_disabled_by_default() -> None:
+    client = _client(ClientOptions())
+    assert _pool(client)._http2 is False
+
+
+def test_create_inner_client_http2() -> None:
+    client = _client(ClientOptions(http2=True))
+    assert _pool(client)._http2 is True
+
+
+def test_create_inner_client_http2_applies_to_proxy_mounts() -> None:
+    client = _client(
+        ClientOptions(http2=True, proxy={"https": "http://proxy.example.com:8080"})
+    )
+    assert all(
+        transport._pool._http2 for transport in client._inner_client._mounts.values()
+    )
+
+
+def test_create_inner_client_http2_without_h2_raises() -> None:
+    with patch.dict("sys.modules", {"h2": None}):
+        with pytest.raises(ConfgiurationError, match="kubex\\[http2\\]"):
+            _client(ClientOptions(http2=True))
+
+
+@pytest.mark.anyio
+async def test_connect_websocket_uses_http1_client_with_http2() -> None:
+    client = _client(ClientOptions(http2=True))
+    kwargs = await _connect_ws_and_get_kwargs(client)
+    websocket_client = kwargs["client"]
+    assert websocket_client is not client._inner_client
+    assert websocket_client._transport._pool._http2 is False
+    assert (await _connect_ws_and_get_kwargs(client))["client"] is websocket_client
+    await client.close()
+    assert websocket_client.is_closed
+
+
+@pytest.mark.anyio
+async def test_connect_websocket_uses_inner_client_without_http2() -> None:
+    client = _client(ClientOptions())
+    kwargs = await _connect_ws_and_get_kwargs(client)
+    assert kwargs["client"] is client._inner_client
+
+
 def test_regression_defaults_no_limits_no_proxy() -> None:
     with warnings.catch_warnings(record=True) as caught:
         warnings.simplefilter("always")
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from typing import Any
+
+import anyio
+import pytest
+
+from kubex.client.options import ClientOptions
+from kubex.client.rate_limit import RateLimiter, TokenBucket
+from kubex.configuration import ClientConfiguration
+from kubex.core.request import Request
+
+
+@pytest.fixture(params=["asyncio", "trio"])
+def anyio_backend(request: pytest.FixtureRequest) -> str:
+    return str(request.param)
+
+
+@pytest.mark.anyio
+async def test_bucket_allows_burst_then_paces() -> None:
+    bucket = TokenBucket(qps=50, burst=3)
+    start = anyio.current_time()
+    for _ in range(3):
+        await bucket.acquire()
+    assert anyio.current_time() - start < 0.02
+    for _ in range(2):
+        await bucket.acquire()
+    assert anyio.current_time() - start >= 2 / 50 - 0.005
+
+
+@pytest.mark.anyio
+async def test_cancelled_waiter_returns_its_token() -> None:
+    bucket = TokenBucket(qps=10, burst=1)
+    await bucket.acquire()
+    with anyio.move_on_after(0.01):
+        await bucket.acquire()
+    start = anyio.current_time()
+    await bucket.acquire()
+    # Only the remainder of the first refill is waited for, not a second one.
+    assert anyio.current_time() - start < 0.15
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"qps": 0, "burst": 1}, {"qps": float("inf"), "burst": 1}, {"qps": 1, "burst": 0}],
+)
+def test_bucket_rejects_invalid_limits(kwargs: dict[str, Any]) -> None:
+    with pytest.raises(ValueError):
+        TokenBucket(**kwargs)
+
+
+@pytest.mark.parametrize(
+    "method,url,query,bucket",
+    [
+        ("GET", "/api/v1/namespaces/default/pods", {}, "pods"),
+        ("GET", "/api/v1/namespaces/default/pods/web", {}, "pods"),
+        ("GET", "/api/v1/namespaces", {"watch": "true"}, "watch"),
+        ("GET", "/api/v1/namespaces/default", {}, "get"),
+        ("PUT", "/apis/coordination.k8s.io/v1/namespaces/a/leases/l", {}, "leases"),
+        ("POST", "/apis/apps/v1/namespaces/default/deployments", {}, "create"),
+        ("DELETE", "/apis/apps/v1/namespaces/default/deployments", {}, "default"),
+    ],
+)
+def test_limiter_selects_most_specific_bucket(
+    method: str, url: str, query: dict[str, str], bucket: str
+) -> None:
+    limiter = RateLimiter(
+        verbs={"watch": (1, 1), "get": (2, 2), "create": (3, 3)},
+        resources={"pods": (4, 4), "leases.coordination.k8s.io": (5, 5)},
+    )
+    buckets = {
+        "default": limiter.default,
+        "watch": limiter.verbs["watch"],
+        "get": limiter.verbs["get"],
+        "create": limiter.verbs["create"],
+        "pods": limiter.resources["pods"],
+        "leases": limiter.resources["leases.coordination.k8s.io"],
+    }
+    request = Request(method=method, url=url, query_params=query)
+    assert limiter.bucket(request) is buckets[bucket]
+
+
+@pytest.mark.anyio
+async def test_client_requests_wait_for_the_limiter() -> None:
+    httpx = pytest.importorskip("httpx")
+    from kubex.client.httpx import HttpxClient
+
+    limiter = RateLimiter(qps=50, burst=1)
+    client = HttpxClient(
+        ClientConfiguration(
+            url="https://example.invalid", insecure_skip_tls_verify=True
+        ),
+        ClientOptions(rate_limiter=limiter),
+    )
+    client._inner_client = httpx.AsyncClient(
+        base_url="https://example.invalid",
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=b"{}")
+        ),
+    )
+    request = Request(method="GET", url="/api/v1/pods")
+    start = anyio.current_time()
+    await client.request(request)
+    async for _ in client.stream_bytes(request):
+        pass
+    await client.request(request)
+    assert anyio.current_time() - start >= 2 / 50 - 0.005
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import email.utils
+import time
+from typing import Any
+
+import anyio
+import pytest
+
+from kubex.client.options import ClientOptions
+from kubex.client.retry import RetryPolicy, parse_retry_after
+from kubex.configuration import ClientConfiguration
+from kubex.core.backoff import Backoff
+from kubex.core.exceptions import KubexApiError
+from kubex.core.request import Request
+from kubex.core.response import HeadersWrapper, Response
+
+
+@pytest.fixture(params=["asyncio", "trio"])
+def anyio_backend(request: pytest.FixtureRequest) -> str:
+    return str(request.param)
+
+
+def _response(status: int, headers: dict[str, str] | None = None) -> Response:
+    return Response(
+        status_code=status, headers=HeadersWrapper(headers or {}), content=b""
+    )
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [(None, None), ("", None), ("3", 3.0), (" 1.5 ", 1.5), ("-2", 0.0), ("x", None)],
+)
+def test_parse_retry_after_seconds(value: str | None, expected: float | None) -> None:
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date() -> None:
+    value = email.utils.formatdate(time.time() + 30, usegmt=True)
+    delay = parse_retry_after(value)
+    assert delay is not None and 28 <= delay <= 30
+
+
+@pytest.mark.parametrize(
+    "method,status,headers,attempt,expected",
+    [
+        ("GET", 429, {"retry-after": "2"}, 1, 2.0),
+        ("POST", 429, {"retry-after": "2"}, 1, 2.0),
+        ("GET", 503, {}, 2, 0.2),
+        ("POST", 503, {}, 1, None),
+        ("PATCH", 500, {"retry-after": "1"}, 1, None),
+        ("GET", 404, {}, 1, None),
+        ("GET", 429, {"retry-after": "120"}, 1, None),
+        ("GET", 429, {"retry-after": "1"}, 3, None),
+    ],
+)
+def test_retry_delay(
+    method: str,
+    status: int,
+    headers: dict[str, str],
+    attempt: int,
+    expected: float | None,
+) -> None:
+    policy = RetryPolicy(
+        max_attempts=3, backoff=Backoff(initial=0.1, jitter=False), max_retry_after=60
+    )
+    request = Request(method=method, url="/api/v1/pods")
+    assert policy.retry_delay(request, _response(status, headers), attempt) == expected
+
+
+@pytest.mark.parametrize("kwargs", [{"max_attempts": 0}, {"max_retry_after": -1}])
+def test_policy_rejects_invalid_settings(kwargs: dict[str, Any]) -> None:
+    with pytest.raises(ValueError):
+        RetryPolicy(**kwargs)
+
+
+def _client(policy: RetryPolicy | None, responses: list[Any]) -> Any:
+    httpx = pytest.importorskip("httpx")
+    from kubex.client.httpx import HttpxClient
+
+    client = HttpxClient(
+        ClientConfiguration(
+            url="https://example.invalid", insecure_skip_tls_verify=True
+        ),
+        ClientOptions(retry_policy=policy),
+    )
+    sent: list[str] = []
+
+    def handler(request: Any) -> Any:
+        sent.append(request.method)
+        return responses[len(sent) - 1]
+
+    client._inner_client = httpx.AsyncClient(
+        base_url="https://example.invalid", transport=httpx.MockTransport(handler)
+    )
+    return client, sent
+
+
+@pytest.mark.anyio
+async def test_client_waits_for_retry_after() -> None:
+    httpx = pytest.importorskip("httpx")
+    client, sent = _client(
+        RetryPolicy(),
+        [
+            httpx.Response(429, headers={"Retry-After": "0.05"}),
+            httpx.Response(201, content=b"{}"),
+        ],
+    )
+    start = anyio.current_time()
+    response = await client.request(Request(method="POST", url="/api/v1/pods"))
+    assert response.status_code == 201
+    assert anyio.current_time() - start >= 0.045
+    assert sent == ["POST", "POST"]
+
+
+@pytest.mark.anyio
+async def test_client_does_not_retry_non_idempotent_requests() -> None:
+    httpx = pytest.importorskip("httpx")
+    client, sent = _client(
+        RetryPolicy(), [httpx.Response(503), httpx.Response(201, content=b"{}")]
+    )
+    with pytest.raises(KubexApiError):
+        await client.request(Request(method="POST", url="/api/v1/pods"))
+    assert sent == ["POST"]
+
+
+@pytest.mark.anyio
+async def test_client_retries_idempotent_requests() -> None:
+    httpx = pytest.importorskip("httpx")
+    client, sent = _client(
+        RetryPolicy(backoff=Backoff(initial=0.01, jitter=False)),
+        [
+            httpx.Response(429, headers={"Retry-After": "0.01"}),
+            httpx.Response(503),
+            httpx.Response(200, content=b"{}"),
+        ],
+    )
+    response = await client.request(Request(method="GET", url="/api/v1/pods"))
+    assert response.status_code == 200
+    assert sent == ["GET", "GET", "GET"]
+
+
+@pytest.mark.anyio
+async def test_client_raises_when_attempts_are_exhausted() -> None:
+    httpx = pytest.importorskip("httpx")
+    client, sent = _client(
+        RetryPolicy(max_attempts=2, backoff=Backoff(initial=0.01, jitter=False)),
+        [httpx.Response(503), httpx.Response(503), httpx.Response(200)],
+    )
+    with pytest.raises(KubexApiError):
+        await client.request(Request(method="GET", url="/api/v1/pods"))
+    assert sent == ["GET", "GET"]
+
+
+@pytest.mark.anyio
+async def test_client_without_policy_does_not_retry() -> None:
+    httpx = pytest.importorskip("httpx")
+    client, sent = _client(
+        None, [httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(200)]
+    )
+    with pytest.raises(KubexApiError):
+        await client.request(Request(method="GET", url="/api/v1/pods"))
+    assert sent == ["GET"]
+
+
+def test_client_without_send_cannot_be_created() -> None:
+    from kubex.client.client import BaseClient
+
+    class IncompleteClient(BaseClient):
+        def _create_inner_client(self) -> Any:
+            return object()
+
+        async def stream_lines(self, request: Request) -> Any:
+            yield ""
+
+        async def close(self) -> None:
+            return None
+
+    with pytest.raises(TypeError, match="_send"):
+        IncompleteClient(  # type: ignore[abstract]
+            ClientConfiguration(
+                url="https://example.invalid", insecure_skip_tls_verify=True
+            )
+        )
@@ -124,7 +124,7 @@ class _MinimalClient(BaseClient):
     def _create_inner_client(self) -> Any:
         return object()
 
-    async def request(self, request: Request) -> Response:
+    async def _send(self, request: Request) -> Response:
         raise NotImplementedError
 
     async def stream_lines(self, request: Request) -> AsyncGenerator[str, None]:
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import json
+
+import anyio
+import pytest
+
+from kubex.api import Api, RequestCoalescer
+from kubex.api._coalescer import request_key
+from kubex.core.exceptions import NotFound
+from kubex.core.patch import MergePatch
+from kubex.core.request import Request
+from kubex.core.response import Response
+from kubex.k8s.v1_35.core.v1.pod import Pod
+from kubex_core.models.metadata import ObjectMetadata
+from test.stub_client import StubClient
+
+
+@pytest.fixture(params=["asyncio", "trio"])
+def anyio_backend(request: pytest.FixtureRequest) -> str:
+    return str(request.param)
+
+
+POD_JSON = json.dumps(
+    {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {"name": "my-pod", "namespace": "default"},
+    }
+).encode()
+
+METADATA_JSON = json.dumps(
+    {
+        "apiVersion": "meta.k8s.io/v1",
+        "kind": "PartialObjectMetadata",
+        "metadata": {"name": "my-pod", "namespace": "default"},
+    }
+).encode()
+
+
+class GatedClient(StubClient):
+    """A ``StubClient`` whose requests wait until ``release`` is set."""
+
+    def __init__(self, content: bytes = POD_JSON, *, status_code: int = 200) -> None:
+        super().__init__(response_content=content, status_code=status_code)
+        self.release = anyio.Event()
+
+    async def request(self, request: Request) -> Response:
+        response = await super().request(request)
+        await self.release.wait()
+        if response.status_code == 404:
+            raise NotFound(content="not found")
+        return response
+
+
+@pytest.mark.anyio
+async def test_identical_gets_share_one_request() -> None:
+    client = GatedClient()
+    coalescer = RequestCoalescer()
+    api: Api[Pod] = Api(Pod, client=client, namespace="default", coalescer=coalescer)
+    pods: list[Pod] = []
+
+    async def get() -> None:
+        pods.append(await api.get("my-pod"))
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(30):
+            tg.start_soon(get)
+        await anyio.wait_all_tasks_blocked()
+        assert len(coalescer) == 1
+        client.release.set()
+    assert len(client.requests) == 1
+    assert len(pods) == 30
+    assert all(pod is pods[0] for pod in pods)
+    assert len(coalescer) == 0
+
+
+@pytest.mark.anyio
+async def test_different_gets_are_not_coalesced() -> None:
+    client = GatedClient()
+    api: Api[Pod] = Api(
+        Pod, client=client, namespace="default", coalescer=RequestCoalescer()
+    )
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(api.get, "my-pod")
+        tg.start_soon(api.get, "other-pod")
+        tg.start_soon(lambda: api.get("my-pod", fields=["status.phase"]))
+        await anyio.wait_all_tasks_blocked()
+        client.release.set()
+    assert len(client.requests) == 3
+
+
+@pytest.mark.anyio
+async def test_metadata_gets_share_one_request() -> None:
+    client = GatedClient(METADATA_JSON)
+    api: Api[Pod] = Api(
+        Pod, client=client, namespace="default", coalescer=RequestCoalescer()
+    )
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(5):
+            tg.start_soon(api.metadata.get, "my-pod")
+        await anyio.wait_all_tasks_blocked()
+        client.release.set()
+    assert len(client.requests) == 1
+
+
+@pytest.mark.anyio
+async def test_concurrent_metadata_patches_are_all_sent() -> None:
+    client = GatedClient(METADATA_JSON)
+    api: Api[Pod] = Api(
+        Pod, client=client, namespace="default", coalescer=RequestCoalescer()
+    )
+
+    def patch(value: str) -> MergePatch[Pod]:
+        return MergePatch(Pod(metadata=ObjectMetadata(labels={"value": value})))
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(api.metadata.patch, "my-pod", patch("a"))
+        tg.start_soon(api.metadata.patch, "my-pod", patch("b"))
+        await anyio.wait_all_tasks_blocked()
+        client.release.set()
+    bodies = [json.loads(request.body or "") for request in client.requests]
+    values = sorted(body["metadata"]["labels"]["value"] for body in bodies)
+    assert values == ["a", "b"]
+
+
+@pytest.mark.parametrize("method", ["POST", "PUT", "PATCH", "DELETE"])
+def test_writes_have_no_coalescing_key(method: str) -> None:
+    with pytest.raises(ValueError):
+        request_key(StubClient(), Request(method=method, url="/api/v1/pods"))
+
+
+@pytest.mark.anyio
+async def test_errors_are_shared() -> None:
+    client = GatedClient(status_code=404)
+    api: Api[Pod] = Api(
+        Pod, client=client, namespace="default", coalescer=RequestCoalescer()
+    )
+    errors: list[BaseException] = []
+
+    async def get() -> None:
+        try:
+            await api.get("my-pod")
+        except NotFound as error:
+            errors.append(error)
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(3):
+            tg.start_soon(get)
+        await anyio.wait_all_tasks_blocked()
+        client.release.set()
+    assert len(client.requests) == 1
+    assert len(errors) == 3
+
+
+@pytest.mark.anyio
+async def test_waiter_takes_over_from_cancelled_caller() -> None:
+    client = GatedClient()
+    api: Api[Pod] = Api(
+        Pod, client=client, namespace="default", coalescer=RequestCoalescer()
+    )
+    pods: list[Pod] = []
+
+    async def get() -> None:
+        pods.append(await api.get("my-pod"))
+
+    async with anyio.create_task_group() as tg:
+        async with anyio.create_task_group() as first:
+            first.start_soon(get)
+            await anyio.wait_all_tasks_blocked()
+            tg.start_soon(get)
+            await anyio.wait_all_tasks_blocked()
+            first.cancel_scope.cancel()
+        await anyio.wait_all_tasks_blocked()
+        client.release.set()
+    assert len(pods) == 1
+    assert len(client.requests) == 2
+
+
+@pytest.mark.anyio
+async def test_sequential_gets_are_not_cached() -> None:
+    client = StubClient(response_content=POD_JSON)
+    api: Api[Pod] = Api(
+        Pod, client=client, namespace="default", coalescer=RequestCoalescer()
+    )
+    await api.get("my-pod")
+    await api.get("my-pod")
+    assert len(client.requests) == 2
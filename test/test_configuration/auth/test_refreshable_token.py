@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import base64
+import json
+import time
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import AsyncMock
 
@@ -7,15 +11,21 @@ import anyio
 import pytest
 from pydantic import SecretStr
 
-from kubex.configuration.auth.exec import ExecAuthProvider
+from kubex.configuration.auth.exec import ExecAuthProvider, ExecCredentialStatus
 from kubex.configuration.auth.refreshable_token import (
     TOKEN_REFRESH_INTERVAL,
+    BaseRefreshableToken,
     ExecRefreshableToken,
     FileRefreshableToken,
-    _AsyncRWLock,
+    OidcRefreshableToken,
     bearer_token,
+    jwt_expiration,
+)
+from kubex.configuration.configuration import (
+    ExecConfig,
+    ExecInteractiveMode,
+    OIDCConfig,
 )
-from kubex.configuration.configuration import ExecConfig, ExecInteractiveMode
 
 
 def test_bearer_token_formats_correctly() -> None:
@@ -37,87 +47,49 @@ def test_bearer_token_with_special_characters() -> None:
 
 
 @pytest.mark.anyio
-async def test_file_refreshable_token_id_token_reads_from_file(tmp_path: Path) -> None:
-    token_file = tmp_path / "token"
-    token_file.write_text("test-token-value")
-    ft = FileRefreshableToken(token_file)
-    result = await ft._id_token()
-    assert result.get_secret_value() == "test-token-value"
-
-
-@pytest.mark.anyio
-async def test_file_refreshable_token_id_token_strips_whitespace(
+async def test_file_refreshable_token_strips_whitespace(
     tmp_path: Path,
 ) -> None:
     token_file = tmp_path / "token"
     token_file.write_text("  test-token  \n")
     ft = FileRefreshableToken(token_file)
-    result = await ft._id_token()
-    assert result.get_secret_value() == "test-token"
+    assert await ft.to_header() == "Bearer test-token"
 
 
 @pytest.mark.anyio
-async def test_file_refreshable_token_id_token_raises_on_empty_file(
+async def test_file_refreshable_token_raises_on_empty_file(
     tmp_path: Path,
 ) -> None:
     token_file = tmp_path / "token"
     token_file.write_text("")
     ft = FileRefreshableToken(token_file)
     with pytest.raises(ValueError, match="Token is not set"):
-        await ft._id_token()
+        await ft.to_header()
 
 
 @pytest.mark.anyio
-async def test_file_refreshable_token_id_token_raises_on_whitespace_only(
+async def test_file_refreshable_token_raises_on_whitespace_only(
     tmp_path: Path,
 ) -> None:
     token_file = tmp_path / "token"
     token_file.write_text("   \n  ")
     ft = FileRefreshableToken(token_file)
     with pytest.raises(ValueError, match="Token is not set"):
-        await ft._id_token()
+        await ft.to_header()
 
 
 @pytest.mark.anyio
-async def test_file_refreshable_token_id_token_sets_expiry(tmp_path: Path) -> None:
+async def test_file_refreshable_token_sets_expiry(tmp_path: Path) -> None:
     token_file = tmp_path / "token"
     token_file.write_text("test-token")
     ft = FileRefreshableToken(token_file)
     before = anyio.current_time()
-    await ft._id_token()
+    await ft.to_header()
     after = anyio.current_time()
     assert ft._expires_at >= before + TOKEN_REFRESH_INTERVAL
     assert ft._expires_at <= after + TOKEN_REFRESH_INTERVAL
 
 
-@pytest.mark.anyio
-async def test_file_refreshable_token_id_token_caches_when_not_expired(
-    tmp_path: Path,
-) -> None:
-    token_file = tmp_path / "token"
-    token_file.write_text("first-token")
-    ft = FileRefreshableToken(token_file)
-    first = await ft._id_token()
-    token_file.write_text("second-token")
-    second = await ft._id_token()
-    assert first.get_secret_value() == "first-token"
-    assert second.get_secret_value() == "first-token"
-
-
-@pytest.mark.anyio
-async def test_file_refreshable_token_id_token_refreshes_when_expired(
-    tmp_path: Path,
-) -> None:
-    token_file = tmp_path / "token"
-    token_file.write_text("first-token")
-    ft = FileRefreshableToken(token_file)
-    await ft._id_token()
-    ft._expires_at = anyio.current_time() - 1
-    token_file.write_text("second-token")
-    result = await ft._id_token()
-    assert result.get_secret_value() == "second-token"
-
-
 @pytest.mark.anyio
 async def test_file_refreshable_token_to_header(tmp_path: Path) -> None:
     token_file = tmp_path / "token"
@@ -154,7 +126,7 @@ async def test_file_refreshable_token_to_header_refreshes_when_expired(
 
 
 @pytest.mark.anyio
-async def test_exec_refreshable_token_id_token_delegates_to_provider() -> None:
+async def test_exec_refreshable_token_delegates_to_provider() -> None:
     provider = ExecAuthProvider(
         config=ExecConfig(
             api_version="client.authentication.k8s.io/v1",
@@ -168,39 +140,44 @@ async def test_exec_refreshable_token_id_token_delegates_to_provider() -> None:
         )
     )
     et = ExecRefreshableToken(provider)
-    result = await et._id_token()
-    assert result.get_secret_value() == "exec-token"
+    assert await et.to_header() == "Bearer exec-token"
 
 
 @pytest.mark.anyio
-async def test_exec_refreshable_token_id_token_caches_when_not_expired() -> None:
+async def test_exec_refreshable_token_caches_when_not_expired() -> None:
     mock_provider = AsyncMock(spec=ExecAuthProvider)
-    mock_provider.refresh_token = AsyncMock(return_value="exec-token")
+    mock_provider.refresh_credential = AsyncMock(
+        return_value=ExecCredentialStatus(token="exec-token")
+    )
     et = ExecRefreshableToken(mock_provider)
-    await et._id_token()
+    await et.to_header()
     et._expires_at = anyio.current_time() + TOKEN_REFRESH_INTERVAL
-    second = await et._id_token()
-    assert second.get_secret_value() == "exec-token"
-    mock_provider.refresh_token.assert_called_once()
+    assert await et.to_header() == "Bearer exec-token"
+    mock_provider.refresh_credential.assert_called_once()
 
 
 @pytest.mark.anyio
-async def test_exec_refreshable_token_id_token_refreshes_when_expired() -> None:
+async def test_exec_refreshable_token_refreshes_when_expired() -> None:
     mock_provider = AsyncMock(spec=ExecAuthProvider)
-    mock_provider.refresh_token = AsyncMock(side_effect=["token-1", "token-2"])
+    mock_provider.refresh_credential = AsyncMock(
+        side_effect=[
+            ExecCredentialStatus(token="token-1"),
+            ExecCredentialStatus(token="token-2"),
+        ]
+    )
     et = ExecRefreshableToken(mock_provider)
-    first = await et._id_token()
-    assert first.get_secret_value() == "token-1"
+    assert await et.to_header() == "Bearer token-1"
     et._expires_at = anyio.current_time() - 1
-    second = await et._id_token()
-    assert second.get_secret_value() == "token-2"
-    assert mock_provider.refresh_token.call_count == 2
+    assert await et.to_header() == "Bearer token-2"
+    assert mock_provider.refresh_credential.call_count == 2
 
 
 @pytest.mark.anyio
 async def test_exec_refreshable_token_to_header() -> None:
     mock_provider = AsyncMock(spec=ExecAuthProvider)
-    mock_provider.refresh_token = AsyncMock(return_value="exec-header-token")
+    mock_provider.refresh_credential = AsyncMock(
+        return_value=ExecCredentialStatus(token="exec-header-token")
+    )
     et = ExecRefreshableToken(mock_provider)
     header = await et.to_header()
     assert header == "Bearer exec-header-token"
@@ -209,10 +186,12 @@ async def test_exec_refreshable_token_to_header() -> None:
 @pytest.mark.anyio
 async def test_exec_refreshable_token_sets_expiry() -> None:
     mock_provider = AsyncMock(spec=ExecAuthProvider)
-    mock_provider.refresh_token = AsyncMock(return_value="some-token")
+    mock_provider.refresh_credential = AsyncMock(
+        return_value=ExecCredentialStatus(token="some-token")
+    )
     et = ExecRefreshableToken(mock_provider)
     before = anyio.current_time()
-    await et._id_token()
+    await et.to_header()
     after = anyio.current_time()
     assert (
         before + TOKEN_REFRESH_INTERVAL
@@ -221,65 +200,148 @@ async def test_exec_refreshable_token_sets_expiry() -> None:
     )
 
 
+def _jwt(claims: dict[str, object]) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=")
+    return f"eyJhbGciOiJub25lIn0.{payload.decode()}.signature"
+
+
+def test_jwt_expiration() -> None:
+    assert jwt_expiration(_jwt({"exp": 1700000000})) == 1700000000.0
+    assert jwt_expiration(_jwt({"sub": "me"})) is None
+    assert jwt_expiration(_jwt({"exp": "soon"})) is None
+    assert jwt_expiration("opaque-token") is None
+    assert jwt_expiration("a.!!!.c") is None
+
+
 @pytest.mark.anyio
-async def test_async_rw_lock_read_lock_basic() -> None:
-    lock = _AsyncRWLock()
-    async with lock.read_lock():
-        assert lock._readers == 1
+async def test_exec_refreshable_token_uses_expiration_timestamp() -> None:
+    expires = datetime.now(timezone.utc) + timedelta(minutes=15)
+    mock_provider = AsyncMock(spec=ExecAuthProvider)
+    mock_provider.refresh_credential = AsyncMock(
+        return_value=ExecCredentialStatus(
+            token="exec-token",
+            expirationTimestamp=expires.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        )
+    )
+    et = ExecRefreshableToken(mock_provider)
+    await et.to_header()
+    assert et._expires_at == pytest.approx(anyio.current_time() + 15 * 60, abs=2)
 
 
 @pytest.mark.anyio
-async def test_async_rw_lock_write_lock_basic() -> None:
-    lock = _AsyncRWLock()
-    async with lock.write_lock():
-        assert lock._readers == 0
+async def test_exec_refreshable_token_falls_back_to_jwt_expiry() -> None:
+    token = _jwt({"exp": time.time() + 600})
+    mock_provider = AsyncMock(spec=ExecAuthProvider)
+    mock_provider.refresh_credential = AsyncMock(
+        return_value=ExecCredentialStatus(token=token)
+    )
+    et = ExecRefreshableToken(mock_provider)
+    await et.to_header()
+    assert et._expires_at == pytest.approx(anyio.current_time() + 600, abs=2)
+
+
+def _oidc_config(**fields: str) -> OIDCConfig:
+    return OIDCConfig.model_validate(
+        {"client-id": "kubex", "idp-issuer-url": "https://issuer.example.com", **fields}
+    )
 
 
 @pytest.mark.anyio
-async def test_async_rw_lock_multiple_nested_readers() -> None:
-    lock = _AsyncRWLock()
-    async with lock.read_lock():
-        assert lock._readers == 1
-        async with lock.read_lock():
-            assert lock._readers == 2
-            async with lock.read_lock():
-                assert lock._readers == 3
-            assert lock._readers == 2
-        assert lock._readers == 1
-    assert lock._readers == 0
+async def test_oidc_refreshable_token_uses_jwt_expiry() -> None:
+    provider = AsyncMock()
+    provider.refresh_token = AsyncMock(return_value=_jwt({"exp": time.time() + 300}))
+    ot = OidcRefreshableToken(_oidc_config(), provider)
+    assert await ot.to_header() == f"Bearer {provider.refresh_token.return_value}"
+    assert ot._expires_at == pytest.approx(anyio.current_time() + 300, abs=2)
 
 
 @pytest.mark.anyio
-async def test_async_rw_lock_writer_blocks_readers() -> None:
-    lock = _AsyncRWLock()
-    events: list[str] = []
-    writer_acquired = anyio.Event()
-
-    async def writer() -> None:
-        async with lock.write_lock():
-            events.append("writer_acquired")
-            writer_acquired.set()
-            await anyio.sleep(0.05)
-            events.append("writer_released")
-
-    async def reader() -> None:
-        await writer_acquired.wait()
-        async with lock.read_lock():
-            events.append("reader_acquired")
+async def test_oidc_refreshable_token_starts_from_the_id_token() -> None:
+    id_token = _jwt({"exp": time.time() + 300})
+    ot = OidcRefreshableToken(_oidc_config(**{"id-token": id_token}))
+    assert await ot.to_header() == f"Bearer {id_token}"
+    # The provider, and httpx with it, is only needed for a refresh.
+    assert ot._provider is None
+
+
+@pytest.mark.anyio
+async def test_oidc_refreshable_token_refreshes_an_expired_id_token() -> None:
+    provider = AsyncMock()
+    provider.refresh_token = AsyncMock(return_value="fresh-token")
+    expired = _jwt({"exp": time.time() - 60})
+    ot = OidcRefreshableToken(_oidc_config(**{"id-token": expired}), provider)
+    assert await ot.to_header() == "Bearer fresh-token"
+    provider.refresh_token.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_oidc_refresh_without_refresh_token_fails() -> None:
+    ot = OidcRefreshableToken(_oidc_config())
+    with pytest.raises(ValueError, match="refresh-token"):
+        await ot.to_header()
+
+
+class _GatedToken(BaseRefreshableToken):
+    def __init__(self) -> None:
+        super().__init__()
+        self.fetches = 0
+        self.release = anyio.Event()
+        self.fail = False
+
+    async def _fetch_token(self) -> tuple[SecretStr, float]:
+        self.fetches += 1
+        await self.release.wait()
+        if self.fail:
+            raise ValueError("refresh failed")
+        return SecretStr(f"token-{self.fetches}"), anyio.current_time() + 100
+
+
+@pytest.mark.anyio
+async def test_concurrent_callers_share_one_fetch() -> None:
+    token = _GatedToken()
+    headers: list[str] = []
+
+    async def get_header() -> None:
+        headers.append(await token.to_header())
 
     async with anyio.create_task_group() as tg:
-        tg.start_soon(writer)
-        tg.start_soon(reader)
+        for _ in range(5):
+            tg.start_soon(get_header)
+        await anyio.wait_all_tasks_blocked()
+        token.release.set()
+    assert headers == ["Bearer token-1"] * 5
+    assert token.fetches == 1
+
+
+@pytest.mark.anyio
+async def test_refresh_ahead_of_expiry_does_not_block_other_callers() -> None:
+    token = _GatedToken()
+    token.release.set()
+    assert await token.to_header() == "Bearer token-1"
+    assert token._refresh_at == pytest.approx(anyio.current_time() + 80, abs=1)
 
-    assert events.index("writer_released") < events.index("reader_acquired")
+    token._refresh_at = anyio.current_time() - 1
+    token.release = anyio.Event()
+    refreshed: list[str] = []
+
+    async def refresh() -> None:
+        refreshed.append(await token.to_header())
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(refresh)
+        await anyio.wait_all_tasks_blocked()
+        assert await token.to_header() == "Bearer token-1"
+        token.release.set()
+    assert refreshed == ["Bearer token-2"]
+    assert await token.to_header() == "Bearer token-2"
 
 
 @pytest.mark.anyio
-async def test_async_rw_lock_readers_release_count() -> None:
-    lock = _AsyncRWLock()
-    async with lock.read_lock():
-        assert lock._readers == 1
-        async with lock.read_lock():
-            assert lock._readers == 2
-        assert lock._readers == 1
-    assert lock._readers == 0
+async def test_failed_refresh_ahead_of_expiry_keeps_cached_token() -> None:
+    token = _GatedToken()
+    token.release.set()
+    await token.to_header()
+    token._refresh_at = anyio.current_time() - 1
+    token.fail = True
+    assert await token.to_header() == "Bearer token-1"
+    assert token._refresh_at > anyio.current_time()
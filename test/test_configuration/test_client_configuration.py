@@ -1,6 +1,10 @@
+from pathlib import Path
+from time import time
+
 import pytest
 
 from kubex.configuration import ClientConfiguration
+from kubex.configuration.configuration import TOKEN_REFRESH_INTERVAL
 
 
 def test_timeout_param_removed() -> None:
@@ -11,3 +15,30 @@ def test_timeout_param_removed() -> None:
 def test_log_api_warnings_param_removed() -> None:
     with pytest.raises(TypeError, match="log_api_warnings"):
         ClientConfiguration(url="https://example.com", log_api_warnings=False)  # type: ignore[call-arg]
+
+
+@pytest.mark.anyio
+async def test_get_token_reads_token_file(tmp_path: Path) -> None:
+    token_file = tmp_path / "token"
+    token_file.write_text("first\n")
+    config = ClientConfiguration(
+        url="https://example.com", insecure_skip_tls_verify=True, token_file=token_file
+    )
+    assert await config.get_token() == "first"
+    token_file.write_text("second\n")
+    assert await config.get_token() == "first"
+    config._last_token_read = time() - TOKEN_REFRESH_INTERVAL - 1
+    assert await config.get_token() == "second"
+    assert config.token == "second"
+
+
+@pytest.mark.anyio
+async def test_get_token_prefers_static_token() -> None:
+    config = ClientConfiguration(
+        url="https://example.com", insecure_skip_tls_verify=True, token="static"
+    )
+    assert await config.get_token() == "static"
+    config = ClientConfiguration(
+        url="https://example.com", insecure_skip_tls_verify=True
+    )
+    assert await config.get_token() is None
@@ -11,6 +11,10 @@ from unittest.mock import patch
 import pytest
 from yaml import dump
 
+from kubex.configuration.auth.refreshable_token import (
+    ExecRefreshableToken,
+    OidcRefreshableToken,
+)
 from kubex.configuration.configuration import KubeConfig
 from kubex.configuration.file_config import (
     DEFAULT_KUBE_CONFIG_FILE,
@@ -355,3 +359,113 @@ async def test_configure_no_certs() -> None:
     assert client_config.server_ca_file is None
     assert client_config.client_cert_file is None
     assert client_config.client_key_file is None
+
+
+@pytest.mark.anyio
+async def test_configure_from_kubeconfig_disable_compression(tmp_path: Path) -> None:
+    data = _minimal_kubeconfig()
+    data["clusters"][0]["cluster"]["disable-compression"] = True
+    config_file = _write_kubeconfig(tmp_path / "config", data)
+    kube_config = _load_kube_config(config_file)
+    client_config = await configure_from_kubeconfig(config=kube_config)
+    assert client_config.disable_compression is True
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "user,provider_type",
+    [
+        pytest.param(
+            {
+                "exec": {
+                    "apiVersion": "client.authentication.k8s.io/v1",
+                    "command": "aws",
+                }
+            },
+            ExecRefreshableToken,
+            id="exec",
+        ),
+        pytest.param(
+            {
+                "auth-provider": {
+                    "name": "oidc",
+                    "config": {
+                        "client-id": "kubex",
+                        "client-secret": "secret",
+                        "refresh-token": "refresh",
+                        "idp-issuer-url": "https://issuer.example.com",
+                    },
+                }
+            },
+            OidcRefreshableToken,
+            id="oidc",
+        ),
+        pytest.param(
+            {
+                "auth-provider": {
+                    "name": "oidc",
+                    "config": {
+                        "client-id": "kubex",
+                        "idp-issuer-url": "https://issuer.example.com",
+                        "id-token": "id-token",
+                    },
+                }
+            },
+            OidcRefreshableToken,
+            id="oidc_public_client",
+        ),
+        pytest.param(
+            {"auth-provider": {"name": "gcp", "config": {"cmd-path": "gcloud"}}},
+            type(None),
+            id="unsupported_auth_provider",
+        ),
+    ],
+)
+async def test_configure_from_kubeconfig_token_provider(
+    tmp_path: Path, user: dict[str, Any], provider_type: type
+) -> None:
+    data = _minimal_kubeconfig()
+    data["users"][0]["user"] = user
+    config_file = _write_kubeconfig(tmp_path / "config", data)
+    client_config = await configure_from_kubeconfig(
+        config=_load_kube_config(config_file)
+    )
+    assert isinstance(client_config.token_provider, provider_type)
+
+
+@pytest.mark.anyio
+async def test_configure_from_kubeconfig_incomplete_oidc_uses_id_token(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    data = _minimal_kubeconfig()
+    data["users"][0]["user"] = {
+        "auth-provider": {"name": "oidc", "config": {"id-token": "id-token"}}
+    }
+    config_file = _write_kubeconfig(tmp_path / "config", data)
+    client_config = await configure_from_kubeconfig(
+        config=_load_kube_config(config_file)
+    )
+    assert client_config.token_provider is None
+    assert await client_config.get_token() == "id-token"
+    assert "static token" in caplog.text
+
+
+@pytest.mark.anyio
+async def test_configure_from_kubeconfig_token(tmp_path: Path) -> None:
+    token_file = tmp_path / "token"
+    token_file.write_text("file-token\n")
+    data = _minimal_kubeconfig()
+    data["users"][0]["user"] = {"token": "static-token"}
+    config_file = _write_kubeconfig(tmp_path / "config", data)
+    client_config = await configure_from_kubeconfig(
+        config=_load_kube_config(config_file)
+    )
+    assert await client_config.get_token() == "static-token"
+
+    data["users"][0]["user"] = {"tokenFile": str(token_file)}
+    config_file = _write_kubeconfig(tmp_path / "config", data)
+    client_config = await configure_from_kubeconfig(
+        config=_load_kube_config(config_file)
+    )
+    assert client_config.token_provider is None
+    assert await client_config.get_token() == "file-token"
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import json
+from typing import Any, AsyncGenerator
+
+import anyio
+import pytest
+
+from kubex.api import Api, Controller, WorkQueue
+from kubex.core.backoff import Backoff
+from kubex.core.request import Request
+from kubex.core.response import HeadersWrapper, Response
+from kubex.k8s.v1_35.apps.v1.deployment import Deployment
+from kubex.k8s.v1_35.core.v1.pod import Pod
+from test.stub_client import StubClient
+
+
+@pytest.fixture(params=["asyncio", "trio"])
+def anyio_backend(request: pytest.FixtureRequest) -> str:
+    return str(request.param)
+
+
+class RoutedClient(StubClient):
+    """Answers list requests and the first watch by the resource in the URL."""
+
+    def __init__(self, lists: dict[str, bytes], streams: dict[str, list[str]]) -> None:
+        super().__init__()
+        self._lists = lists
+        self._streams = streams
+
+    def _resource(self, request: Request) -> str:
+        return request.url.split("?", 1)[0].rsplit("/", 1)[-1]
+
+    async def request(self, request: Request) -> Response:
+        self.requests.append(request)
+        return Response(
+            content=self._lists[self._resource(request)],
+            headers=HeadersWrapper({}),
+            status_code=200,
+        )
+
+    async def stream_lines(self, request: Request) -> AsyncGenerator[str, None]:
+        self.requests.append(request)
+        for line in self._streams.pop(self._resource(request), []):
+            yield line
+        await anyio.sleep_forever()
+
+
+def _owner(kind: str, name: str, controller: bool | None = True) -> dict[str, Any]:
+    return {
+        "apiVersion": "apps/v1",
+        "kind": kind,
+        "name": name,
+        "uid": f"uid-{name}",
+        "controller": controller,
+    }
+
+
+def _object(kind: str, name: str, *owners: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "apiVersion": "apps/v1" if kind == "Deployment" else "v1",
+        "kind": kind,
+        "metadata": {
+            "name": name,
+            "namespace": "default",
+            "uid": f"uid-{name}",
+            "resourceVersion": "1",
+            "ownerReferences": list(owners),
+        },
+    }
+
+
+def _list(kind: str, *items: dict[str, Any]) -> bytes:
+    return json.dumps(
+        {
+            "apiVersion": "apps/v1" if kind == "Deployment" else "v1",
+            "kind": f"{kind}List",
+            "metadata": {"resourceVersion": "10"},
+            "items": list(items),
+        }
+    ).encode()
+
+
+def _client() -> RoutedClient:
+    return RoutedClient(
+        lists={
+            "deployments": _list(
+                "Deployment", _object("Deployment", "d1"), _object("Deployment", "d2")
+            ),
+            "pods": _list(
+                "Pod",
+                _object("Pod", "p1", _owner("Deployment", "d1")),
+                _object("Pod", "p2", _owner("Deployment", "d4", controller=None)),
+                _object("Pod", "p3", _owner("ReplicaSet", "r1")),
+            ),
+        },
+        streams={
+            "pods": [
+                json.dumps(
+                    {
+                        "type": "ADDED",
+                        "object": _object("Pod", "p4", _owner("Deployment", "d3")),
+                    }
+                )
+            ]
+        },
+    )
+
+
+async def _run_until(controller: Controller[Any], condition: Any) -> None:
+    with anyio.fail_after(5):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(controller.run)
+            while not condition():
+                await anyio.sleep(0.01)
+            await anyio.sleep(0.05)
+            tg.cancel_scope.cancel()
+
+
+@pytest.mark.anyio
+async def test_reconciles_primary_objects_and_owners_of_secondaries() -> None:
+    client = _client()
+    calls: list[str] = []
+
+    async def reconcile(key: str) -> None:
+        assert controller.has_synced
+        calls.append(key)
+
+    controller = Controller(
+        Api(Deployment, client=client, namespace="default"), reconcile, workers=2
+    )
+    pods = controller.owns(Api(Pod, client=client, namespace="default"))
+    await _run_until(controller, lambda: "default/d3" in calls)
+
+    assert sorted(calls) == ["default/d1", "default/d2", "default/d3"]
+    assert controller.store.get("default/d1") is not None
+    assert [pod.metadata.name for pod in pods.by_index("owner", "uid-d1")] == ["p1"]
+
+
+@pytest.mark.anyio
+async def test_owns_can_follow_every_owner_reference() -> None:
+    client = _client()
+    calls: list[str] = []
+
+    async def reconcile(key: str) -> None:
+        calls.append(key)
+
+    controller = Controller(
+        Api(Deployment, client=client, namespace="default"), reconcile
+    )
+    controller.owns(Api(Pod, client=client, namespace="default"), controller_only=False)
+    await _run_until(controller, lambda: len(calls) >= 4)
+    assert sorted(calls) == ["default/d1", "default/d2", "default/d3", "default/d4"]
+
+
+@pytest.mark.anyio
+async def test_requeue_after_reconciles_again() -> None:
+    client = _client()
+    calls: list[str] = []
+
+    async def reconcile(key: str) -> float | None:
+        calls.append(key)
+        return 0.01 if calls.count(key) < 3 else None
+
+    controller = Controller(
+        Api(Deployment, client=client, namespace="default"),
+        reconcile,
+        queue=WorkQueue(qps=None),
+    )
+    await _run_until(controller, lambda: calls.count("default/d2") >= 3)
+    assert calls.count("default/d1") == 3
+    assert calls.count("default/d2") == 3
+
+
+@pytest.mark.anyio
+async def test_requeue_delay_is_jittered() -> None:
+    async def reconcile(key: str) -> float | None:
+        return 1.0 if key == "default/later" else None
+
+    controller = Controller(
+        Api(Deployment, client=StubClient(), namespace="default"),
+        reconcile,
+        requeue_jitter=0.5,
+    )
+    delays = {await controller._reconcile_key("default/later") for _ in range(20)}
+    assert all(delay is not None and 1.0 <= delay <= 1.5 for delay in delays)
+    assert len(delays) > 1
+    assert await controller._reconcile_key("default/now") is None
+
+
+class FlakyClient(RoutedClient):
+    """Cuts the first watch of deployments after one event."""
+
+    def __init__(self) -> None:
+        super().__init__(lists={"deployments": _list("Deployment")}, streams={})
+        self.watches = 0
+
+    async def stream_lines(self, request: Request) -> AsyncGenerator[str, None]:
+        self.requests.append(request)
+        self.watches += 1
+        name = "d1" if self.watches == 1 else "d2"
+        yield json.dumps({"type": "ADDED", "object": _object("Deployment", name)})
+        if self.watches == 1:
+            raise ConnectionResetError("connection reset by peer")
+        await anyio.sleep_forever()
+
+
+@pytest.mark.anyio
+async def test_keeps_reconciling_after_a_dropped_watch() -> None:
+    client = FlakyClient()
+    calls: list[str] = []
+
+    async def reconcile(key: str) -> None:
+        calls.append(key)
+
+    controller = Controller(
+        Api(Deployment, client=client, namespace="default"),
+        reconcile,
+        backoff=Backoff(0.01, 0.01),
+    )
+    await _run_until(controller, lambda: "default/d2" in calls)
+    assert calls == ["default/d1", "default/d2"]
+    assert client.watches == 2
+
+
+def test_invalid_arguments() -> None:
+    async def reconcile(key: str) -> None: ...
+
+    api = Api(Deployment, client=StubClient(), namespace="default")
+    with pytest.raises(ValueError):
+        Controller(api, reconcile, workers=0)
+    with pytest.raises(ValueError):
+        Controller(api, reconcile, requeue_jitter=-1)
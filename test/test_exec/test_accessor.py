@@ -81,8 +81,8 @@ class _FakeClient(BaseClient):
     def _create_inner_client(self) -> Any:  # pragma: no cover - never invoked
         return object()
 
-    async def request(self, request: Request) -> Any:  # pragma: no cover
-        raise AssertionError("request should not be called for exec")
+    async def _send(self, request: Request) -> Any:  # pragma: no cover
+        raise AssertionError("_send should not be called for exec")
 
     def stream_lines(self, request: Request) -> Any:  # pragma: no cover
         raise AssertionError("stream_lines should not be called for exec")
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import anyio
+import pytest
+
+from kubex.api import SharedInformerFactory, Subscription
+from kubex.core.backoff import Backoff
+from kubex.core.request import Request
+from kubex.k8s.v1_35.core.v1.pod import Pod
+from kubex_core.models.watch_event import EventType, WatchEvent
+from test.stub_client import ScriptedClient
+
+
+@pytest.fixture(params=["asyncio", "trio"])
+def anyio_backend(request: pytest.FixtureRequest) -> str:
+    return str(request.param)
+
+
+def _pod(name: str, resource_version: str = "1") -> dict[str, Any]:
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": name,
+            "namespace": "default",
+            "resourceVersion": resource_version,
+        },
+    }
+
+
+def _pod_list(*pods: dict[str, Any], resource_version: str = "10") -> bytes:
+    return json.dumps(
+        {
+            "apiVersion": "v1",
+            "kind": "PodList",
+            "metadata": {"resourceVersion": resource_version},
+            "items": list(pods),
+        }
+    ).encode()
+
+
+def _event(event_type: str, obj: dict[str, Any]) -> str:
+    return json.dumps({"type": event_type, "object": obj})
+
+
+async def _collect(events: Any, count: int, into: list[WatchEvent[Pod]]) -> None:
+    async for event in events:
+        into.append(event)
+        if len(into) == count:
+            return
+
+
+def _watch_requests(client: ScriptedClient) -> list[Request]:
+    return [r for r in client.requests if (r.query_params or {}).get("watch")]
+
+
+def test_factory_deduplicates_informers() -> None:
+    factory = SharedInformerFactory(ScriptedClient())
+    first = factory.informer(Pod, namespace="default", label_selector="app=web")
+    assert factory.informer(Pod, namespace="default", label_selector="app=web") is first
+    assert factory.informer(Pod, namespace="default") is not first
+    assert (
+        factory.informer(Pod, namespace="other", label_selector="app=web") is not first
+    )
+
+
+@pytest.mark.anyio
+async def test_one_upstream_watch_fans_out_to_all_subscribers() -> None:
+    gate = anyio.Event()
+    client = ScriptedClient(
+        responses=[_pod_list(_pod("a"))],
+        streams=[
+            [
+                _event("ADDED", _pod("b", "11")),
+                _event("DELETED", _pod("a", "12")),
+            ]
+        ],
+    )
+    original_stream_lines = client.stream_lines
+
+    async def gated_stream_lines(request: Any) -> Any:
+        await gate.wait()
+        async for line in original_stream_lines(request):
+            yield line
+
+    client.stream_lines = gated_stream_lines  # type: ignore[method-assign]
+
+    factory = SharedInformerFactory(client, backoff=Backoff(0, 0))
+    informer = factory.informer(Pod, namespace="default")
+    first: list[WatchEvent[Pod]] = []
+    second: list[WatchEvent[Pod]] = []
+    with anyio.fail_after(5):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(factory.run)
+            await factory.wait_for_sync()
+            async with (
+                informer.subscribe() as events_1,
+                informer.subscribe(max_buffer_size=1) as events_2,
+            ):
+                async with anyio.create_task_group() as consumers:
+                    consumers.start_soon(_collect, events_1, 3, first)
+                    consumers.start_soon(_collect, events_2, 3, second)
+                    gate.set()
+            while len(_watch_requests(client)) < 2:
+                await anyio.sleep(0)
+            tg.cancel_scope.cancel()
+
+    for received in (first, second):
+        assert [(e.type, e.object.metadata.name) for e in received] == [
+            (EventType.ADDED, "a"),
+            (EventType.ADDED, "b"),
+            (EventType.DELETED, "a"),
+        ]
+    # Both subscribers share the objects decoded from the single upstream watch.
+    assert first[1].object is second[1].object
+    list_requests = [
+        r for r in client.requests if not (r.query_params or {}).get("watch")
+    ]
+    assert len(list_requests) == 1
+    # The only further watch is the resume after the scripted stream ended.
+    resume_versions = [
+        (r.query_params or {}).get("resourceVersion") for r in _watch_requests(client)
+    ]
+    assert resume_versions[:2] == ["10", "12"]
+
+
+@pytest.mark.anyio
+async def test_relist_is_reported_as_diff_events() -> None:
+    gone = _event(
+        "ERROR",
+        {
+            "kind": "Status",
+            "apiVersion": "v1",
+            "metadata": {},
+            "status": "Failure",
+            "code": 410,
+        },
+    )
+    client = ScriptedClient(
+        responses=[
+            _pod_list(_pod("a"), _pod("b")),
+            _pod_list(_pod("b", "20"), _pod("c"), resource_version="30"),
+        ],
+        streams=[[gone]],
+    )
+    factory = SharedInformerFactory(client, backoff=Backoff(0, 0))
+    informer = factory.informer(Pod, namespace="default")
+    received: list[WatchEvent[Pod]] = []
+    with anyio.fail_after(5):
+        async with informer.subscribe() as events:
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(factory.run)
+                await _collect(events, 5, received)
+                tg.cancel_scope.cancel()
+
+    assert [(e.type, e.object.metadata.name) for e in received] == [
+        (EventType.ADDED, "a"),
+        (EventType.ADDED, "b"),
+        (EventType.MODIFIED, "b"),
+        (EventType.ADDED, "c"),
+        (EventType.DELETED, "a"),
+    ]
+    assert sorted(informer.store.keys()) == ["default/b", "default/c"]
+
+
+@pytest.mark.anyio
+async def test_informer_requested_while_running_is_started() -> None:
+    client = ScriptedClient(responses=[_pod_list(_pod("a"))])
+    factory = SharedInformerFactory(client)
+    with anyio.fail_after(5):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(factory.run)
+            await anyio.sleep(0)
+            informer = factory.informer(Pod, namespace="default")
+            await informer.wait_for_sync()
+            assert informer.store.keys() == ["default/a"]
+            tg.cancel_scope.cancel()
+
+
+@pytest.mark.anyio
+async def test_subscriber_stream_ends_when_informer_stops() -> None:
+    client = ScriptedClient(responses=[_pod_list()])
+    factory = SharedInformerFactory(client)
+    informer = factory.informer(Pod, namespace="default")
+    received: list[WatchEvent[Pod]] = []
+    with anyio.fail_after(5):
+        async with informer.subscribe() as events:
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(factory.run)
+                await informer.wait_for_sync()
+                tg.cancel_scope.cancel()
+            async for event in events:
+                received.append(event)
+    assert received == []
+
+
+@pytest.mark.anyio
+async def test_subscriber_joining_during_a_relist_gets_each_object_once() -> None:
+    client = ScriptedClient(responses=[_pod_list(_pod("a"), _pod("b"), _pod("c"))])
+    factory = SharedInformerFactory(client)
+    informer = factory.informer(Pod, namespace="default")
+    first: list[WatchEvent[Pod]] = []
+    joined: list[Subscription[Pod]] = []
+
+    async def join() -> None:
+        async with informer.subscribe() as events:
+            joined.append(events)
+            await anyio.sleep_forever()
+
+    with anyio.fail_after(5):
+        async with informer.subscribe(max_buffer_size=1) as events:
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(factory.run)
+                await informer.wait_for_sync()
+                # The list is being dispatched: the first subscriber's buffer
+                # is full, so the informer waits for it to catch up.
+                await anyio.wait_all_tasks_blocked()
+                tg.start_soon(join)
+                await anyio.wait_all_tasks_blocked()
+                await _collect(events, 3, first)
+                await anyio.wait_all_tasks_blocked()
+                (second,) = joined
+                received = list(second._replay)
+                with pytest.raises(anyio.WouldBlock):
+                    second._receive_stream.receive_nowait()
+                tg.cancel_scope.cancel()
+
+    assert [(e.type, e.object.metadata.name) for e in first] == [
+        (EventType.ADDED, "a"),
+        (EventType.ADDED, "b"),
+        (EventType.ADDED, "c"),
+    ]
+    assert [pod.metadata.name for pod in received] == ["a", "b", "c"]
+
+
+@pytest.mark.anyio
+async def test_subscribing_to_a_stopped_informer_ends_after_the_replay() -> None:
+    client = ScriptedClient(responses=[_pod_list(_pod("a"))])
+    factory = SharedInformerFactory(client)
+    informer = factory.informer(Pod, namespace="default")
+    with anyio.fail_after(5):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(factory.run)
+            await informer.wait_for_sync()
+            tg.cancel_scope.cancel()
+        async with informer.subscribe() as events:
+            received = [event async for event in events]
+    assert [(e.type, e.object.metadata.name) for e in received] == [
+        (EventType.ADDED, "a")
+    ]
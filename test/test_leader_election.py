@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import anyio
+import pytest
+
+from kubex.api import Api, LeaderElector
+from kubex.core.exceptions import Conflict, NotFound
+from kubex.core.request import Request
+from kubex.core.response import HeadersWrapper, Response
+from kubex.k8s.v1_35.coordination.v1.lease import Lease
+from test.stub_client import StubClient
+
+
+@pytest.fixture(params=["asyncio", "trio"])
+def anyio_backend(request: pytest.FixtureRequest) -> str:
+    return str(request.param)
+
+
+TIMINGS = {"lease_duration": 0.4, "renew_deadline": 0.25, "retry_period": 0.05}
+
+
+class LeaseServer:
+    """A single lease with the optimistic concurrency of the API server."""
+
+    def __init__(self) -> None:
+        self.lease: dict[str, Any] | None = None
+        self.version = 0
+        self.available = True
+
+    def store(self, body: str | bytes | None) -> bytes:
+        assert body is not None
+        lease = json.loads(body)
+        self.version += 1
+        lease["metadata"]["resourceVersion"] = str(self.version)
+        self.lease = lease
+        return json.dumps(lease).encode()
+
+
+class LeaseClient(StubClient):
+    def __init__(self, server: LeaseServer) -> None:
+        super().__init__()
+        self.server = server
+
+    async def request(self, request: Request) -> Response:
+        self.requests.append(request)
+        server = self.server
+        if not server.available:
+            raise OSError("connection refused")
+        if request.method == "GET":
+            if server.lease is None:
+                raise NotFound(content="not found")
+            content = json.dumps(server.lease).encode()
+        elif request.method == "POST":
+            if server.lease is not None:
+                raise Conflict(content="already exists")
+            content = server.store(request.body)
+        else:
+            assert request.method == "PUT" and server.lease is not None
+            assert request.body is not None
+            version = json.loads(request.body)["metadata"].get("resourceVersion")
+            if version != server.lease["metadata"]["resourceVersion"]:
+                raise Conflict(content="the object has been modified")
+            content = server.store(request.body)
+        return Response(content=content, headers=HeadersWrapper({}), status_code=200)
+
+
+class Candidate:
+    def __init__(self, server: LeaseServer, identity: str, **kwargs: Any) -> None:
+        self.started = 0
+        self.stopped = 0
+        self.leading = False
+        self.elector = LeaderElector(
+            Api(Lease, client=LeaseClient(server), namespace="default"),
+            "operator",
+            identity,
+            on_started_leading=self._lead,
+            on_stopped_leading=self._stop,
+            **{**TIMINGS, **kwargs},
+        )
+
+    async def _lead(self) -> None:
+        self.started += 1
+        self.leading = True
+        try:
+            await anyio.sleep_forever()
+        finally:
+            self.leading = False
+
+    async def _stop(self) -> None:
+        self.stopped += 1
+
+
+async def _wait_for(condition: Any) -> None:
+    with anyio.fail_after(3):
+        while not condition():
+            await anyio.sleep(0.01)
+
+
+@pytest.mark.anyio
+async def test_leads_and_releases_the_lease_on_cancel() -> None:
+    server = LeaseServer()
+    candidate = Candidate(server, "a")
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(candidate.elector.run)
+        await _wait_for(lambda: candidate.leading)
+        assert candidate.elector.is_leader
+        assert candidate.elector.leader == "a"
+        version = server.version
+        await _wait_for(lambda: server.version > version)
+        tg.cancel_scope.cancel()
+
+    assert (candidate.started, candidate.stopped) == (1, 1)
+    assert not candidate.leading and not candidate.elector.is_leader
+    assert server.lease is not None
+    assert "holderIdentity" not in server.lease["spec"]
+    assert server.lease["spec"]["leaseTransitions"] == 0
+
+
+async def _run_in(scope: anyio.CancelScope, elector: LeaderElector[Any]) -> None:
+    with scope:
+        await elector.run()
+
+
+@pytest.mark.anyio
+async def test_only_one_candidate_leads_and_the_standby_takes_over() -> None:
+    server = LeaseServer()
+    first, second = Candidate(server, "a"), Candidate(server, "b")
+    first_scope = anyio.CancelScope()
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(_run_in, first_scope, first.elector)
+        await _wait_for(lambda: first.leading)
+        tg.start_soon(second.elector.run)
+        await anyio.sleep(0.5)
+        assert not second.leading
+        assert second.elector.leader == "a"
+
+        first_scope.cancel()
+        await _wait_for(lambda: second.leading)
+        assert first.stopped == 1
+        assert server.lease is not None
+        assert server.lease["spec"]["holderIdentity"] == "b"
+        assert server.lease["spec"]["leaseTransitions"] == 1
+        tg.cancel_scope.cancel()
+
+
+@pytest.mark.anyio
+async def test_standby_takes_over_an_expired_lease() -> None:
+    server = LeaseServer()
+    first = Candidate(server, "a", release_on_cancel=False)
+    second = Candidate(server, "b")
+    first_scope = anyio.CancelScope()
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(_run_in, first_scope, first.elector)
+        await _wait_for(lambda: first.leading)
+        tg.start_soon(second.elector.run)
+        await anyio.sleep(0.1)
+        first_scope.cancel()
+        await _wait_for(lambda: not first.leading)
+        started = anyio.current_time()
+        await _wait_for(lambda: second.leading)
+        assert anyio.current_time() - started >= 0.2
+        tg.cancel_scope.cancel()
+
+
+@pytest.mark.anyio
+async def test_leader_steps_down_when_renewal_fails() -> None:
+    server = LeaseServer()
+    candidate = Candidate(server, "a")
+    with anyio.fail_after(3):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(candidate.elector.run)
+            await _wait_for(lambda: candidate.leading)
+            server.available = False
+            started = anyio.current_time()
+            await _wait_for(lambda: candidate.stopped)
+            # The leader stops before the lease expires for the other candidates.
+            assert anyio.current_time() - started < TIMINGS["lease_duration"]
+    assert not candidate.leading and not candidate.elector.is_leader
+    assert candidate.started == 1
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"identity": ""},
+        {"lease_duration": 1, "renew_deadline": 1},
+        {"renew_deadline": 0.1, "retry_period": 0.1},
+        {"retry_period": 0},
+    ],
+)
+def test_invalid_arguments(kwargs: dict[str, Any]) -> None:
+    async def lead() -> None: ...
+
+    options: dict[str, Any] = {"identity": "a", **kwargs}
+    with pytest.raises(ValueError):
+        LeaderElector(
+            Api(Lease, client=StubClient(), namespace="default"),
+            "operator",
+            on_started_leading=lead,
+            **options,
+        )
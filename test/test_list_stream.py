@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+
+from kubex.api import Api
+from kubex.api._list_stream import ListItemsSplitter
+from kubex.core.params import WireFormat
+from kubex.k8s.v1_35.core.v1.pod import Pod
+from test.stub_client import StubClient
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+def _pod_list(count: int) -> dict[str, Any]:
+    return {
+        "apiVersion": "v1",
+        "kind": "PodList",
+        "metadata": {"resourceVersion": "42", "continue": "next"},
+        "items": [
+            {
+                "apiVersion": "v1",
+                "kind": "Pod",
+                "metadata": {
+                    "name": f"pod-{i}",
+                    "namespace": "default",
+                    # Brackets, quotes and escapes inside strings must not
+                    # confuse the splitter.
+                    "annotations": {"note": 'a "quoted" [value] {x} \\ é'},
+                },
+                "spec": {"containers": [{"name": "c", "args": ["[", "]"]}]},
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def _chunks(data: bytes, size: int) -> list[bytes]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 20])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_splitter_yields_items_and_envelope(
+    chunk_size: int, indent: int | None
+) -> None:
+    document = _pod_list(5)
+    body = json.dumps(document, indent=indent, ensure_ascii=False).encode()
+    splitter = ListItemsSplitter()
+    items: list[bytes] = []
+    for chunk in _chunks(body, chunk_size):
+        items.extend(splitter.feed(chunk))
+    assert [json.loads(item) for item in items] == document["items"]
+    assert splitter.close() == {**document, "items": []}
+
+
+def test_splitter_only_buffers_the_current_item() -> None:
+    body = json.dumps(_pod_list(50)).encode()
+    item_size = len(json.dumps(_pod_list(1)["items"][0]))
+    splitter = ListItemsSplitter()
+    for chunk in _chunks(body, 100):
+        splitter.feed(chunk)
+        assert len(splitter._buffer) < item_size + 100
+
+
+def test_splitter_handles_empty_list() -> None:
+    splitter = ListItemsSplitter()
+    assert splitter.feed(b'{"kind":"PodList","metadata":{},"items":[]}') == []
+    assert splitter.close() == {"kind": "PodList", "metadata": {}, "items": []}
+
+
+def test_splitter_rejects_truncated_body() -> None:
+    splitter = ListItemsSplitter()
+    splitter.feed(b'{"kind":"PodList","items":[{"metadata":')
+    with pytest.raises(ValueError, match="Truncated"):
+        splitter.close()
+
+
+@pytest.mark.anyio
+async def test_list_stream_validates_items_incrementally() -> None:
+    body = json.dumps(_pod_list(3)).encode()
+    client = StubClient(stream_chunks=_chunks(body, 16))
+    api: Api[Pod] = Api(Pod, client=client, namespace="default")
+    pods = api.list_stream(label_selector="app=web", limit=3)
+    with pytest.raises(RuntimeError):
+        pods.metadata
+    assert client.requests == []
+
+    names = [pod.metadata.name async for pod in pods]
+
+    assert names == ["pod-0", "pod-1", "pod-2"]
+    assert pods.metadata.resource_version == "42"
+    assert pods.metadata.continue_ == "next"
+    request = client.last_request
+    assert request.url == "/api/v1/namespaces/default/pods"
+    assert request.query_params == {"labelSelector": "app=web", "limit": "3"}
+
+
+@pytest.mark.anyio
+async def test_list_stream_requests_json_on_a_cbor_api() -> None:
+    body = json.dumps(_pod_list(2)).encode()
+    client = StubClient(stream_chunks=_chunks(body, 16))
+    api: Api[Pod] = Api(
+        Pod, client=client, namespace="default", wire_format=WireFormat.CBOR
+    )
+
+    names = [pod.metadata.name async for pod in api.list_stream()]
+
+    assert names == ["pod-0", "pod-1"]
+    assert client.last_request.headers == {"accept": "application/json"}
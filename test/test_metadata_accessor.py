@@ -11,7 +11,7 @@ from kubex.k8s.v1_35.core.v1.node import Node
 from kubex.k8s.v1_35.core.v1.pod import Pod
 from kubex_core.models.partial_object_meta import PartialObjectMetadata
 from kubex_core.models.watch_event import EventType, WatchEvent
-from test.stub_client import StubClient
+from test.stub_client import ScriptedClient, StubClient
 
 
 @pytest.fixture
@@ -165,6 +165,24 @@ async def test_metadata_list_builds_correct_request() -> None:
     assert result.items[1].metadata.name == "pod-2"
 
 
+@pytest.mark.anyio
+async def test_metadata_list_iter_follows_continue_token() -> None:
+    first_page = json.loads(PARTIAL_META_LIST_JSON)
+    first_page["metadata"]["continue"] = "page-2"
+    client = ScriptedClient(
+        responses=[json.dumps(first_page).encode(), PARTIAL_META_LIST_JSON] * 2
+    )
+    api: Api[Pod] = Api(Pod, client=client, namespace="default")
+    items = [item async for item in api.metadata.list_iter(limit=2)]
+    async with api.metadata.list_iter(limit=2, prefetch=True) as prefetched:
+        items_prefetched = [item async for item in prefetched]
+    assert items_prefetched == items
+    assert [item.metadata.name for item in items] == ["pod-1", "pod-2"] * 2
+    assert all(isinstance(item, PartialObjectMetadata) for item in items)
+    assert client.requests[1].query_params == {"limit": "2", "continue": "page-2"}
+    assert client.requests[1].headers == client.requests[0].headers
+
+
 @pytest.mark.anyio
 async def test_metadata_list_with_explicit_namespace() -> None:
     client = StubClient(response_content=PARTIAL_META_LIST_JSON)
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import copy
+import json
+import pickle
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from kubex.k8s.v1_35.core.v1.pod import Pod
+from kubex.k8s.v1_35.core.v1.pod_status import PodStatus
+from kubex_core.models.lazy import (
+    is_lazy,
+    lazy_validate_json,
+    lazy_validate_python,
+    materialize,
+)
+
+POD: dict[str, Any] = {
+    "apiVersion": "v1",
+    "kind": "Pod",
+    "metadata": {
+        "name": "web",
+        "namespace": "default",
+        "labels": {"app": "web"},
+        "creationTimestamp": "2024-01-01T00:00:00Z",
+    },
+    "spec": {
+        "containers": [
+            {"name": "nginx", "image": "nginx:1.25", "ports": [{"containerPort": 80}]}
+        ]
+    },
+    "status": {
+        "phase": "Running",
+        "conditions": [{"type": "Ready", "status": "True"}],
+    },
+}
+
+POD_LIST: dict[str, Any] = {
+    "apiVersion": "v1",
+    "kind": "PodList",
+    "metadata": {"resourceVersion": "100"},
+    "items": [POD, {**POD, "metadata": {**POD["metadata"], "name": "api"}}],
+}
+
+
+def test_fields_are_validated_on_first_access() -> None:
+    pod = lazy_validate_json(Pod, json.dumps(POD))
+    assert isinstance(pod, Pod)
+    assert is_lazy(pod)
+    assert pod.__dict__ == {}
+    assert pod.metadata.name == "web"
+    assert list(pod.__dict__) == ["metadata"]
+    assert is_lazy(pod.metadata)
+    assert isinstance(pod.status, PodStatus)
+    assert pod.status.phase == "Running"
+    assert "spec" not in pod.__dict__
+
+
+def test_list_items_are_lazy() -> None:
+    list_model = Pod.__RESOURCE_CONFIG__.list_model
+    pods = lazy_validate_json(list_model, json.dumps(POD_LIST).encode())
+    assert pods.metadata.resource_version == "100"
+    assert [pod.metadata.name for pod in pods.items] == ["web", "api"]
+    assert all(is_lazy(pod) for pod in pods.items)
+    assert pods == list_model.model_validate(POD_LIST)
+
+
+def test_matches_eager_validation() -> None:
+    eager = Pod.model_validate(POD)
+    assert lazy_validate_python(Pod, POD) == eager
+    assert eager == lazy_validate_python(Pod, POD)
+    assert lazy_validate_python(Pod, POD).model_dump() == eager.model_dump()
+    assert lazy_validate_python(Pod, POD).model_dump_json(
+        by_alias=True, exclude_unset=True
+    ) == eager.model_dump_json(by_alias=True, exclude_unset=True)
+    assert repr(lazy_validate_python(Pod, POD)) == repr(eager)
+    assert lazy_validate_python(Pod, POD).model_fields_set == eager.model_fields_set
+
+
+def test_partially_accessed_model_serializes_completely() -> None:
+    pod = lazy_validate_python(Pod, POD)
+    assert pod.status is not None
+    pod.status.phase = "Succeeded"
+    dumped = pod.model_dump(by_alias=True, exclude_unset=True)
+    assert dumped["status"]["phase"] == "Succeeded"
+    assert dumped["spec"] == POD["spec"]
+
+
+def test_validation_errors_are_raised_on_access() -> None:
+    pod = lazy_validate_python(Pod, {**POD, "metadata": {"name": 1}})
+    assert pod.kind == "Pod"
+    with pytest.raises(ValidationError):
+        pod.metadata.name
+    with pytest.raises(ValidationError):
+        lazy_validate_python(Pod, {"apiVersion": "v1", "kind": "Pod"}).metadata
+
+
+def test_non_mapping_data_is_validated_eagerly() -> None:
+    with pytest.raises(ValidationError):
+        lazy_validate_python(Pod, [POD])
+
+
+def test_materialize_releases_raw_data() -> None:
+    pod = materialize(lazy_validate_python(Pod, POD))
+    assert list(pod.__dict__) == ["api_version", "kind", "metadata", "spec", "status"]
+    assert pod == Pod.model_validate(POD)
+
+
+def test_copies_and_pickles() -> None:
+    eager = Pod.model_validate(POD)
+    assert copy.deepcopy(lazy_validate_python(Pod, POD)) == eager
+    assert lazy_validate_python(Pod, POD).model_copy() == eager
+    unpickled = pickle.loads(pickle.dumps(lazy_validate_python(Pod, POD)))
+    assert type(unpickled) is Pod
+    assert unpickled == eager
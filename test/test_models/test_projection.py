@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from kubex.k8s.v1_35.core.v1.pod import Pod
+from kubex_core.models.list_entity import ListEntity
+from kubex_core.models.projection import project
+
+POD: dict[str, Any] = {
+    "apiVersion": "v1",
+    "kind": "Pod",
+    "metadata": {"name": "web", "namespace": "default", "labels": {"app": "web"}},
+    "spec": {
+        "nodeName": "node-1",
+        "containers": [
+            {"name": "nginx", "image": "nginx:1.25", "ports": [{"containerPort": 80}]}
+        ],
+    },
+    "status": {"phase": "Running", "podIP": "10.0.0.1"},
+}
+
+
+def test_keeps_only_selected_fields() -> None:
+    projected = project(
+        Pod, ["status.phase", "spec.node_name", "spec.containers.image"]
+    )
+    pod = projected.model_validate(POD)
+    assert pod.metadata.labels == {"app": "web"}
+    assert pod.status is not None
+    assert pod.status.phase == "Running"
+    assert pod.spec is not None
+    assert pod.spec.node_name == "node-1"
+    assert [container.image for container in pod.spec.containers] == ["nginx:1.25"]
+    assert pod.model_dump(by_alias=True, exclude_none=True) == {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": POD["metadata"],
+        "spec": {"nodeName": "node-1", "containers": [{"image": "nginx:1.25"}]},
+        "status": {"phase": "Running"},
+    }
+    assert not hasattr(pod.status, "pod_ip")
+
+
+def test_metadata_can_be_trimmed() -> None:
+    pod = project(Pod, ["metadata.name"]).model_validate(POD)
+    assert pod.metadata.name == "web"
+    assert not hasattr(pod.metadata, "labels")
+
+
+def test_whole_field_selection_wins_over_sub_fields() -> None:
+    projected = project(Pod, ["status.phase", "status"])
+    assert projected.model_validate(POD).status == Pod.model_validate(POD).status
+
+
+def test_projections_are_cached() -> None:
+    first = project(Pod, ["status.phase", "spec.node_name"])
+    assert project(Pod, ("spec.node_name", "status.phase")) is first
+    assert project(Pod, ["status.phase"]) is not first
+
+
+def test_original_model_is_unchanged() -> None:
+    project(Pod, ["spec.node_name"])
+    assert Pod.model_validate(POD).spec is not None
+    assert set(Pod.model_fields) == {
+        "api_version",
+        "kind",
+        "metadata",
+        "spec",
+        "status",
+    }
+
+
+def test_projected_lists() -> None:
+    projected = project(Pod, ["status.phase"])
+    pods: Any = ListEntity[projected].model_validate(  # type: ignore[valid-type]
+        {"apiVersion": "v1", "kind": "PodList", "metadata": {}, "items": [POD]}
+    )
+    assert pods.items[0].status.phase == "Running"
+
+
+@pytest.mark.parametrize(
+    "fields,message",
+    [
+        (["nope"], "Pod has no field 'nope'"),
+        (["spec.nope"], "PodSpec has no field 'spec.nope'"),
+        (["status.phase.value"], "Field 'status.phase' has no sub-fields"),
+        (["status..phase"], "Invalid field path"),
+        ([], "At least one field"),
+    ],
+)
+def test_invalid_paths(fields: list[str], message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        project(Pod, fields)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+
+from kubex.api._protocol import decode_watch_event
+from kubex.core.exceptions import Gone
+from kubex.k8s.v1_35.core.v1.pod import Pod
+from kubex_core.models.watch_event import (
+    Bookmark,
+    ErrorEventEnvelope,
+    EventType,
+    watch_event_adapter,
+)
+
+
+def _line(event_type: str, obj: dict[str, Any]) -> bytes:
+    return json.dumps({"type": event_type, "object": obj}).encode()
+
+
+POD: dict[str, Any] = {
+    "apiVersion": "v1",
+    "kind": "Pod",
+    "metadata": {"name": "web", "namespace": "default", "resourceVersion": "7"},
+}
+
+
+@pytest.mark.parametrize("event_type", ["ADDED", "MODIFIED", "DELETED"])
+def test_decode_watch_event_validates_object_events(event_type: str) -> None:
+    event = decode_watch_event(Pod, _line(event_type, POD))
+    assert event.type == EventType(event_type)
+    assert isinstance(event.object, Pod)
+    assert event.object.metadata.name == "web"
+
+
+def test_decode_watch_event_validates_bookmarks() -> None:
+    line = _line(
+        "BOOKMARK",
+        {
+            "apiVersion": "v1",
+            "kind": "Pod",
+            "metadata": {
+                "resourceVersion": "12",
+                "annotations": {"k8s.io/initial-events-end": "true"},
+            },
+        },
+    )
+    event = decode_watch_event(Pod, line.decode())
+    assert event.type == EventType.BOOKMARK
+    assert isinstance(event.object, Bookmark)
+    assert event.object.metadata.resource_version == "12"
+    assert event.is_initial_events_end
+
+
+def test_decode_watch_event_rejects_error_events() -> None:
+    line = _line(
+        "ERROR",
+        {
+            "apiVersion": "v1",
+            "kind": "Status",
+            "metadata": {},
+            "status": "Failure",
+            "reason": "Expired",
+            "code": 410,
+        },
+    )
+    with pytest.raises(Gone):
+        decode_watch_event(Pod, line)
+    envelope = watch_event_adapter(Pod).validate_json(line)
+    assert isinstance(envelope, ErrorEventEnvelope)
+    assert envelope.object["code"] == 410
+
+
+def test_decode_watch_event_rejects_unknown_event_types() -> None:
+    with pytest.raises(ValueError):
+        decode_watch_event(Pod, _line("RENAMED", POD))
+
+
+def test_watch_event_adapter_is_cached_per_resource_type() -> None:
+    assert watch_event_adapter(Pod) is watch_event_adapter(Pod)
@@ -88,8 +88,8 @@ class _DynamicFakeClient(BaseClient):
     def _create_inner_client(self) -> Any:
         return object()
 
-    async def request(self, request: Request) -> Any:  # pragma: no cover
-        raise AssertionError("request should not be called")
+    async def _send(self, request: Request) -> Any:  # pragma: no cover
+        raise AssertionError("_send should not be called")
 
     def stream_lines(self, request: Request) -> Any:  # pragma: no cover
         raise AssertionError("stream_lines should not be called")
@@ -0,0 +1,491 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import anyio
+import pytest
+
+from kubex.api import (
+    Api,
+    Reflector,
+    Store,
+    index_by_label,
+    index_by_namespace,
+    index_by_owner_uid,
+    object_key,
+)
+from kubex.core.backoff import Backoff
+from kubex.core.exceptions import Gone, KubernetesError, NotFound
+from kubex.k8s.v1_35.core.v1.node import Node
+from kubex.k8s.v1_35.core.v1.pod import Pod
+from test.stub_client import ScriptedClient
+
+
+@pytest.fixture(params=["asyncio", "trio"])
+def anyio_backend(request: pytest.FixtureRequest) -> str:
+    return str(request.param)
+
+
+NO_BACKOFF = Backoff(0, 0)
+
+
+def _pod(
+    name: str, resource_version: str = "1", namespace: str = "default"
+) -> dict[str, Any]:
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+            "resourceVersion": resource_version,
+        },
+    }
+
+
+def _pod_list(*names: str, resource_version: str = "10") -> bytes:
+    return json.dumps(
+        {
+            "apiVersion": "v1",
+            "kind": "PodList",
+            "metadata": {"resourceVersion": resource_version},
+            "items": [_pod(name) for name in names],
+        }
+    ).encode()
+
+
+def _event(event_type: str, obj: dict[str, Any]) -> str:
+    return json.dumps({"type": event_type, "object": obj})
+
+
+def _bookmark(resource_version: str) -> str:
+    return _event(
+        "BOOKMARK",
+        {
+            "apiVersion": "v1",
+            "kind": "Pod",
+            "metadata": {"resourceVersion": resource_version},
+        },
+    )
+
+
+def _initial_events_end(resource_version: str) -> str:
+    return _event(
+        "BOOKMARK",
+        {
+            "apiVersion": "v1",
+            "kind": "Pod",
+            "metadata": {
+                "resourceVersion": resource_version,
+                "annotations": {"k8s.io/initial-events-end": "true"},
+            },
+        },
+    )
+
+
+def _gone_event() -> str:
+    return _event(
+        "ERROR",
+        {
+            "apiVersion": "v1",
+            "kind": "Status",
+            "metadata": {},
+            "status": "Failure",
+            "message": "too old resource version",
+            "reason": "Expired",
+            "code": 410,
+        },
+    )
+
+
+async def _run_until(
+    reflector: Reflector[Pod], client: ScriptedClient, watches: int
+) -> None:
+    """Run *reflector* until it has issued *watches* watch requests, then cancel it."""
+    with anyio.fail_after(5):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(reflector.run)
+            while (
+                sum(1 for r in client.requests if (r.query_params or {}).get("watch"))
+                < watches
+            ):
+                await anyio.sleep(0)
+            tg.cancel_scope.cancel()
+
+
+def test_object_key_namespaced_and_cluster_scoped() -> None:
+    pod = Pod.model_validate(_pod("web"))
+    node = Node.model_validate(
+        {"apiVersion": "v1", "kind": "Node", "metadata": {"name": "node-1"}}
+    )
+    assert object_key(pod) == "default/web"
+    assert object_key(node) == "node-1"
+
+
+def test_object_key_requires_name() -> None:
+    pod = Pod.model_validate({"apiVersion": "v1", "kind": "Pod", "metadata": {}})
+    with pytest.raises(ValueError, match="metadata.name"):
+        object_key(pod)
+
+
+def test_store_add_get_delete_replace() -> None:
+    store: Store[Pod] = Store()
+    store.add(Pod.model_validate(_pod("a")))
+    store.add(Pod.model_validate(_pod("b", namespace="other")))
+    assert len(store) == 2
+    assert "default/a" in store
+    assert store.get_by_name("b", "other") is not None
+    assert sorted(store.keys()) == ["default/a", "other/b"]
+
+    store.update(Pod.model_validate(_pod("a", resource_version="2")))
+    pod = store.get("default/a")
+    assert pod is not None
+    assert pod.metadata.resource_version == "2"
+
+    store.delete(Pod.model_validate(_pod("a")))
+    assert store.get("default/a") is None
+
+    store.replace([Pod.model_validate(_pod("c"))])
+    assert [p.metadata.name for p in store.list()] == ["c"]
+
+
+def _indexed_pod(
+    name: str,
+    *,
+    node: str | None = None,
+    owner: str | None = None,
+    app: str | None = None,
+    namespace: str = "default",
+) -> Pod:
+    data = _pod(name, namespace=namespace)
+    if app is not None:
+        data["metadata"]["labels"] = {"app": app}
+    if owner is not None:
+        data["metadata"]["ownerReferences"] = [
+            {"apiVersion": "apps/v1", "kind": "ReplicaSet", "name": owner, "uid": owner}
+        ]
+    if node is not None:
+        data["spec"] = {"nodeName": node, "containers": []}
+    return Pod.model_validate(data)
+
+
+def _index_by_node(pod: Pod) -> list[str]:
+    return [pod.spec.node_name] if pod.spec and pod.spec.node_name else []
+
+
+def test_store_indexes_are_maintained_incrementally() -> None:
+    store: Store[Pod] = Store(
+        indexers={
+            "node": _index_by_node,
+            "owner": index_by_owner_uid,
+            "app": index_by_label("app"),
+        }
+    )
+    store.add(_indexed_pod("a", node="n1", owner="rs-1", app="web"))
+    store.add(_indexed_pod("b", node="n1", owner="rs-2"))
+    store.add(_indexed_pod("c", node="n2", owner="rs-1", app="web"))
+
+    assert sorted(store.index_keys("node", "n1")) == ["default/a", "default/b"]
+    assert sorted(store.index_keys("owner", "rs-1")) == ["default/a", "default/c"]
+    assert sorted(store.index_values("app")) == ["web"]
+
+    # Moving a pod to another node updates both index values.
+    store.update(_indexed_pod("b", node="n2", owner="rs-2"))
+    assert [p.metadata.name for p in store.by_index("node", "n1")] == ["a"]
+    assert sorted(store.index_keys("node", "n2")) == ["default/b", "default/c"]
+
+    store.delete(_indexed_pod("a"))
+    assert store.by_index("node", "n1") == []
+    assert "n1" not in store.index_values("node")
+    assert store.index_keys("owner", "rs-1") == ["default/c"]
+
+    store.replace([_indexed_pod("d", node="n3", app="db")])
+    assert store.index_values("node") == ["n3"]
+    assert store.index_values("owner") == []
+    assert store.index_keys("app", "db") == ["default/d"]
+
+
+def test_store_add_indexers_indexes_existing_objects() -> None:
+    store: Store[Pod] = Store()
+    store.add(_indexed_pod("a"))
+    store.add(_indexed_pod("b", namespace="other"))
+    store.add_indexers({"namespace": index_by_namespace})
+    assert store.index_keys("namespace", "other") == ["other/b"]
+    with pytest.raises(ValueError, match="already exists"):
+        store.add_indexers({"namespace": index_by_namespace})
+    with pytest.raises(KeyError, match="missing"):
+        store.by_index("missing", "value")
+
+
+@pytest.mark.anyio
+async def test_reflector_lists_then_watches_from_list_resource_version() -> None:
+    client = ScriptedClient(
+        responses=[_pod_list("a", "b", resource_version="10")],
+        streams=[
+            [
+                _event("ADDED", _pod("c", "11")),
+                _event("MODIFIED", _pod("a", "12")),
+                _event("DELETED", _pod("b", "13")),
+            ]
+        ],
+    )
+    reflector = Reflector(
+        Api(Pod, client=client, namespace="default"), backoff=NO_BACKOFF
+    )
+    await _run_until(reflector, client, watches=2)
+
+    assert reflector.has_synced
+    assert sorted(reflector.store.keys()) == ["default/a", "default/c"]
+    modified = reflector.store.get("default/a")
+    assert modified is not None
+    assert modified.metadata.resource_version == "12"
+    assert reflector.resource_version == "13"
+
+    watch_request = client.requests[1]
+    assert watch_request.query_params is not None
+    assert watch_request.query_params["resourceVersion"] == "10"
+    assert watch_request.query_params["allowBookmarks"] == "true"
+
+
+@pytest.mark.anyio
+async def test_reflector_resumes_from_last_resource_version_without_relisting() -> None:
+    client = ScriptedClient(
+        responses=[_pod_list("a", resource_version="10")],
+        streams=[
+            [_event("ADDED", _pod("b", "11"))],
+            [_bookmark("20")],
+        ],
+    )
+    reflector = Reflector(
+        Api(Pod, client=client, namespace="default"), backoff=NO_BACKOFF
+    )
+    await _run_until(reflector, client, watches=3)
+
+    methods = [(r.query_params or {}).get("watch") for r in client.requests]
+    assert methods == [None, "true", "true", "true"]
+    assert client.requests[2].query_params is not None
+    assert client.requests[2].query_params["resourceVersion"] == "11"
+    assert client.requests[3].query_params is not None
+    assert client.requests[3].query_params["resourceVersion"] == "20"
+
+
+@pytest.mark.anyio
+async def test_reflector_relists_on_gone_event() -> None:
+    client = ScriptedClient(
+        responses=[
+            _pod_list("a", resource_version="10"),
+            _pod_list("b", resource_version="30"),
+        ],
+        streams=[[_gone_event()]],
+    )
+    reflector = Reflector(
+        Api(Pod, client=client, namespace="default"), backoff=NO_BACKOFF
+    )
+    await _run_until(reflector, client, watches=2)
+
+    assert reflector.store.keys() == ["default/b"]
+    assert client.requests[-1].query_params is not None
+    assert client.requests[-1].query_params["resourceVersion"] == "30"
+
+
+@pytest.mark.anyio
+async def test_reflector_relists_on_gone_response() -> None:
+    client = ScriptedClient(
+        responses=[
+            _pod_list("a", resource_version="10"),
+            _pod_list("a", "b", resource_version="30"),
+        ],
+        streams=[[Gone(content="expired")]],
+    )
+    reflector = Reflector(
+        Api(Pod, client=client, namespace="default"), backoff=NO_BACKOFF
+    )
+    await _run_until(reflector, client, watches=2)
+
+    assert sorted(reflector.store.keys()) == ["default/a", "default/b"]
+
+
+@pytest.mark.anyio
+async def test_reflector_propagates_other_errors() -> None:
+    client = ScriptedClient(responses=[NotFound(content="no such resource")])
+    reflector = Reflector(
+        Api(Pod, client=client, namespace="default"), backoff=NO_BACKOFF
+    )
+    with pytest.raises(NotFound):
+        await reflector.run()
+    assert not reflector.has_synced
+
+
+@pytest.mark.anyio
+async def test_reflector_wait_for_sync() -> None:
+    client = ScriptedClient(responses=[_pod_list("a")])
+    reflector = Reflector(
+        Api(Pod, client=client, namespace="default"), label_selector="app=web"
+    )
+    with anyio.fail_after(5):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(reflector.run)
+            await reflector.wait_for_sync()
+            assert reflector.store.keys() == ["default/a"]
+            tg.cancel_scope.cancel()
+    assert client.requests[0].query_params == {"labelSelector": "app=web"}
+
+
+@pytest.mark.anyio
+async def test_reflector_watch_list_syncs_from_initial_events() -> None:
+    client = ScriptedClient(
+        streams=[
+            [
+                _event("ADDED", _pod("a", "5")),
+                _bookmark("7"),
+                _event("ADDED", _pod("b", "6")),
+                _initial_events_end("8"),
+                _event("DELETED", _pod("a", "9")),
+            ],
+            [_gone_event()],
+            [_event("ADDED", _pod("c", "20")), _initial_events_end("21")],
+        ]
+    )
+    reflector = Reflector(
+        Api(Pod, client=client, namespace="default"),
+        watch_list=True,
+        backoff=NO_BACKOFF,
+    )
+    with anyio.fail_after(5):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(reflector.run)
+            await reflector.wait_for_sync()
+            while len(client.requests) < 4:
+                await anyio.sleep(0)
+            tg.cancel_scope.cancel()
+
+    # No list request was made; the Gone on the resumed watch restarted the
+    # watch list, whose initial events replaced the store.
+    assert all((r.query_params or {}).get("watch") for r in client.requests)
+    assert reflector.store.keys() == ["default/c"]
+    assert reflector.resource_version == "21"
+    params = [r.query_params or {} for r in client.requests]
+    assert params[0]["sendInitialEvents"] == "true"
+    assert params[1]["resourceVersion"] == "9"
+    assert "sendInitialEvents" not in params[1]
+    assert params[2]["sendInitialEvents"] == "true"
+
+
+class RecordingBackoff(Backoff):
+    """Records the attempts it is asked a delay for, and never waits."""
+
+    def __init__(self) -> None:
+        super().__init__(0, 0)
+        self.attempts: list[int] = []
+
+    def delay(self, attempt: int) -> float:
+        self.attempts.append(attempt)
+        return 0
+
+
+@pytest.mark.anyio
+async def test_reflector_retries_transient_errors_with_backoff() -> None:
+    client = ScriptedClient(
+        responses=[
+            KubernetesError(content="etcdserver: leader changed"),
+            OSError("connection refused"),
+            _pod_list("a", resource_version="10"),
+        ],
+        streams=[
+            [_event("ADDED", _pod("b", "11")), ConnectionResetError()],
+            [_event("ADDED", _pod("c", "12"))],
+        ],
+    )
+    backoff = RecordingBackoff()
+    reflector = Reflector(Api(Pod, client=client, namespace="default"), backoff=backoff)
+    await _run_until(reflector, client, watches=3)
+
+    assert sorted(reflector.store.keys()) == ["default/a", "default/b", "default/c"]
+    # Two failed lists, then a watch cut after an event and one ended cleanly.
+    assert backoff.attempts == [1, 2, 0, 0]
+    params = [r.query_params or {} for r in client.requests]
+    assert [p.get("resourceVersion") for p in params[3:]] == ["10", "11", "12"]
+
+
+@pytest.mark.anyio
+async def test_reflector_backs_off_while_watches_end_without_events() -> None:
+    client = ScriptedClient(
+        responses=[_pod_list("a", resource_version="10")],
+        streams=[[], [], [OSError("reset")], [OSError("reset")], []],
+    )
+    backoff = RecordingBackoff()
+    reflector = Reflector(Api(Pod, client=client, namespace="default"), backoff=backoff)
+    await _run_until(reflector, client, watches=6)
+
+    assert backoff.attempts == [0, 0, 1, 2, 2]
+
+
+@pytest.mark.anyio
+async def test_reflector_falls_back_to_list_without_initial_events_end() -> None:
+    client = ScriptedClient(
+        responses=[_pod_list("b", resource_version="10")],
+        # The stream ends without the end of the initial events, then the
+        # next watch list never sends anything.
+        streams=[[_event("ADDED", _pod("a", "5"))]],
+    )
+    reflector = Reflector(
+        Api(Pod, client=client, namespace="default"),
+        watch_list=True,
+        watch_list_timeout=0.05,
+        backoff=NO_BACKOFF,
+    )
+    with anyio.fail_after(5):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(reflector.run)
+            await reflector.wait_for_sync()
+            while len(client.requests) < 4:
+                await anyio.sleep(0)
+            tg.cancel_scope.cancel()
+
+    assert reflector.store.keys() == ["default/b"]
+    params = [r.query_params or {} for r in client.requests]
+    assert [p.get("sendInitialEvents") for p in params] == ["true", "true", None, None]
+    assert params[2].get("watch") is None
+    assert params[3]["resourceVersion"] == "10"
+
+
+@pytest.mark.anyio
+async def test_reflector_watch_list_timeout_does_not_cover_slow_handlers() -> None:
+    client = ScriptedClient(
+        streams=[
+            [
+                _event("ADDED", _pod("a", "5")),
+                _event("ADDED", _pod("b", "6")),
+                _initial_events_end("8"),
+                _event("DELETED", _pod("a", "9")),
+            ],
+        ]
+    )
+    seen: list[tuple[str, str]] = []
+
+    async def on_event(event: Any) -> None:
+        # Each event takes longer to handle than the watch list timeout.
+        await anyio.sleep(0.1)
+        seen.append((event.type.value, event.object.metadata.name))
+
+    reflector = Reflector(
+        Api(Pod, client=client, namespace="default"),
+        on_event=on_event,
+        watch_list=True,
+        watch_list_timeout=0.05,
+        backoff=NO_BACKOFF,
+    )
+    with anyio.fail_after(5):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(reflector.run)
+            await reflector.wait_for_sync()
+            while len(client.requests) < 2:
+                await anyio.sleep(0)
+            tg.cancel_scope.cancel()
+
+    assert seen == [("ADDED", "a"), ("ADDED", "b"), ("DELETED", "a")]
+    assert reflector.store.keys() == ["default/b"]
+    # The initial events were not dropped for a list: the watch resumed.
+    assert all((r.query_params or {}).get("watch") for r in client.requests)
+    assert (client.requests[1].query_params or {})["resourceVersion"] == "9"
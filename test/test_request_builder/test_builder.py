@@ -584,6 +584,14 @@ def test_watch_query_params_send_initial_events(ns_builder: RequestBuilder) -> N
     assert req.query_params["sendInitialEvents"] == "true"
 
 
+def test_watch_query_params_version_match(ns_builder: RequestBuilder) -> None:
+    req = ns_builder.watch(
+        "default", WatchOptions(version_match=VersionMatch.NOT_EXACT)
+    )
+    assert req.query_params is not None
+    assert req.query_params["resourceVersionMatch"] == "NotOlderThan"
+
+
 def test_watch_query_params_timeout_seconds(ns_builder: RequestBuilder) -> None:
     req = ns_builder.watch("default", WatchOptions(timeout_seconds=300))
     assert req.query_params is not None
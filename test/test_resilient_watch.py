@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import json
+from http import HTTPStatus
+from typing import Any
+
+import anyio
+import pytest
+
+from kubex.api import Api, ResilientWatch
+from kubex.core.backoff import Backoff
+from kubex.core.exceptions import Forbidden, KubernetesError
+from kubex.k8s.v1_35.core.v1.pod import Pod
+from kubex_core.models.watch_event import EventType, WatchEvent
+from test.stub_client import ScriptedClient
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+NO_DELAY = Backoff(initial=0, maximum=0)
+
+
+def _event(event_type: str, name: str, resource_version: str) -> str:
+    return json.dumps(
+        {
+            "type": event_type,
+            "object": {
+                "apiVersion": "v1",
+                "kind": "Pod",
+                "metadata": {
+                    "name": name,
+                    "namespace": "default",
+                    "resourceVersion": resource_version,
+                },
+            },
+        }
+    )
+
+
+def _bookmark(resource_version: str) -> str:
+    return json.dumps(
+        {
+            "type": "BOOKMARK",
+            "object": {
+                "apiVersion": "v1",
+                "kind": "Pod",
+                "metadata": {"resourceVersion": resource_version},
+            },
+        }
+    )
+
+
+def _gone() -> str:
+    return json.dumps(
+        {
+            "type": "ERROR",
+            "object": {
+                "apiVersion": "v1",
+                "kind": "Status",
+                "metadata": {},
+                "status": "Failure",
+                "code": 410,
+            },
+        }
+    )
+
+
+async def _take(watch: ResilientWatch[Pod], count: int) -> list[WatchEvent[Pod]]:
+    events: list[WatchEvent[Pod]] = []
+    with anyio.fail_after(5):
+        async for event in watch:
+            events.append(event)
+            if len(events) == count:
+                break
+    return events
+
+
+def _resource_versions(client: ScriptedClient) -> list[Any]:
+    return [(r.query_params or {}).get("resourceVersion") for r in client.requests]
+
+
+@pytest.mark.anyio
+async def test_reconnects_from_last_resource_version() -> None:
+    client = ScriptedClient(
+        streams=[
+            [_event("ADDED", "a", "5")],
+            [_bookmark("8"), ConnectionResetError("reset by peer")],
+            [_event("MODIFIED", "a", "9")],
+        ]
+    )
+    watch = ResilientWatch(
+        Api(Pod, client=client, namespace="default"),
+        resource_version="1",
+        backoff=NO_DELAY,
+    )
+    events = await _take(watch, 2)
+    assert [(e.type, e.object.metadata.resource_version) for e in events] == [
+        (EventType.ADDED, "5"),
+        (EventType.MODIFIED, "9"),
+    ]
+    assert _resource_versions(client) == ["1", "5", "8"]
+    assert watch.reconnects == 2
+    assert watch.relists == 0
+    assert watch.resource_version == "9"
+
+
+@pytest.mark.anyio
+async def test_gone_restarts_without_resource_version() -> None:
+    client = ScriptedClient(
+        streams=[[_gone()], [_event("ADDED", "a", "20")]],
+    )
+    watch = ResilientWatch(
+        Api(Pod, client=client, namespace="default"),
+        resource_version="1",
+        backoff=NO_DELAY,
+    )
+    events = await _take(watch, 1)
+    assert events[0].object.metadata.name == "a"
+    assert _resource_versions(client) == ["1", None]
+    assert watch.relists == 1
+
+
+@pytest.mark.anyio
+async def test_retries_server_errors_with_backoff() -> None:
+    client = ScriptedClient(
+        streams=[
+            [KubernetesError("unavailable", status=HTTPStatus.SERVICE_UNAVAILABLE)],
+            [KubernetesError("unavailable", status=HTTPStatus.SERVICE_UNAVAILABLE)],
+            [_event("ADDED", "a", "2")],
+        ]
+    )
+    delays: list[int] = []
+
+    class RecordingBackoff(Backoff):
+        def delay(self, attempt: int) -> float:
+            delays.append(attempt)
+            return 0
+
+    watch = ResilientWatch(
+        Api(Pod, client=client, namespace="default"), backoff=RecordingBackoff()
+    )
+    await _take(watch, 1)
+    assert delays == [1, 2]
+
+
+@pytest.mark.anyio
+async def test_gives_up_after_max_retries() -> None:
+    client = ScriptedClient(
+        streams=[[ConnectionResetError()], [ConnectionResetError()]],
+    )
+    watch = ResilientWatch(
+        Api(Pod, client=client, namespace="default"),
+        backoff=NO_DELAY,
+        max_retries=1,
+    )
+    with pytest.raises(ConnectionResetError):
+        await _take(watch, 1)
+    assert len(client.requests) == 2
+
+
+@pytest.mark.anyio
+async def test_propagates_non_retryable_errors() -> None:
+    client = ScriptedClient(streams=[[Forbidden("denied")]])
+    watch = ResilientWatch(
+        Api(Pod, client=client, namespace="default"), backoff=NO_DELAY
+    )
+    with pytest.raises(Forbidden):
+        await _take(watch, 1)
+    assert watch.reconnects == 0
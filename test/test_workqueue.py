@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import anyio
+import pytest
+
+from kubex.api import Api, WorkQueue
+from kubex.core.backoff import Backoff
+from kubex.k8s.v1_35.core.v1.pod import Pod
+from test.stub_client import StubClient
+
+
+@pytest.fixture(params=["asyncio", "trio"])
+def anyio_backend(request: pytest.FixtureRequest) -> str:
+    return str(request.param)
+
+
+def _queue(**kwargs: Any) -> WorkQueue[str]:
+    kwargs.setdefault("backoff", Backoff(0.01, 1.0, jitter=False))
+    return WorkQueue(**kwargs)
+
+
+@pytest.mark.anyio
+async def test_add_deduplicates_queued_keys() -> None:
+    queue = _queue()
+    for key in ("a", "b", "a", "a", "c", "b"):
+        queue.add(key)
+    assert len(queue) == 3
+    assert [await queue.get() for _ in range(3)] == ["a", "b", "c"]
+
+
+@pytest.mark.anyio
+async def test_key_added_while_processing_is_queued_on_done() -> None:
+    queue = _queue()
+    queue.add("a")
+    key = await queue.get()
+    queue.add("a")
+    queue.add("a")
+    assert len(queue) == 0
+    queue.done(key)
+    assert len(queue) == 1
+    assert await queue.get() == "a"
+    queue.done("a")
+    assert len(queue) == 0
+
+
+@pytest.mark.anyio
+async def test_add_after_keeps_the_earliest_delay() -> None:
+    queue = _queue()
+    queue.add_after("a", 10)
+    queue.add_after("a", 0.05)
+    queue.add_after("a", 5)
+    with anyio.fail_after(1):
+        assert await queue.get() == "a"
+    with anyio.move_on_after(0.1):
+        await queue.get()
+        pytest.fail("the superseded delays must not queue the key again")
+
+
+@pytest.mark.anyio
+async def test_get_wakes_up_for_new_keys() -> None:
+    queue = _queue()
+    received: list[str] = []
+
+    async def consume() -> None:
+        received.append(await queue.get())
+
+    with anyio.fail_after(1):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(consume)
+            await anyio.sleep(0.01)
+            queue.add_after("a", 60)
+            await anyio.sleep(0.01)
+            queue.add("b")
+    assert received == ["b"]
+
+
+@pytest.mark.anyio
+async def test_add_rate_limited_backs_off_per_key() -> None:
+    queue = _queue(backoff=Backoff(0.02, 0.08, jitter=False), qps=None)
+    delays = []
+    for _ in range(4):
+        started = anyio.current_time()
+        queue.add_rate_limited("a")
+        key = await queue.get()
+        delays.append(anyio.current_time() - started)
+        queue.done(key)
+    assert queue.num_requeues("a") == 4
+    assert delays[0] >= 0.02 and delays[1] >= 0.04 and delays[3] >= 0.08
+    assert delays[3] < 0.5
+    queue.forget("a")
+    assert queue.num_requeues("a") == 0
+
+
+@pytest.mark.anyio
+async def test_add_rate_limited_applies_the_overall_limit() -> None:
+    queue = _queue(backoff=Backoff(0, 0), qps=20, burst=2)
+    started = anyio.current_time()
+    for key in ("a", "b", "c", "d"):
+        queue.add_rate_limited(key)
+    assert len(queue) == 2
+    received = [await queue.get() for _ in range(4)]
+    assert sorted(received) == ["a", "b", "c", "d"]
+    assert anyio.current_time() - started >= 0.1
+
+
+@pytest.mark.anyio
+async def test_shut_down_drains_queued_keys() -> None:
+    queue = _queue()
+    queue.add("a")
+    queue.add_after("b", 0.01)
+    queue.shut_down()
+    queue.add("c")
+    assert [key async for key in queue] == ["a"]
+    with pytest.raises(anyio.EndOfStream):
+        await queue.get()
+
+
+@pytest.mark.anyio
+async def test_run_processes_each_key_once_at_a_time() -> None:
+    queue = _queue()
+    active: set[str] = set()
+    calls: list[str] = []
+    failed: set[str] = set()
+
+    async def handler(key: str) -> float | None:
+        assert key not in active
+        active.add(key)
+        calls.append(key)
+        await anyio.sleep(0.01)
+        active.discard(key)
+        if key == "flaky" and key not in failed:
+            failed.add(key)
+            raise RuntimeError("try again")
+        if key == "periodic" and calls.count(key) == 1:
+            return 0.01
+        return None
+
+    async def feed() -> None:
+        for _ in range(2):
+            for key in ("a", "b", "flaky", "periodic") * 3:
+                queue.add(key)
+            await anyio.sleep(0.005)
+        await anyio.sleep(0.2)
+        queue.shut_down()
+
+    with anyio.fail_after(2):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(feed)
+            await queue.run(handler, workers=3)
+    assert calls.count("flaky") >= 2
+    assert calls.count("periodic") >= 2
+    assert calls.count("a") == 2
+    assert queue.num_requeues("flaky") == 0
+
+
+def test_run_requires_a_worker() -> None:
+    async def handler(key: str) -> None: ...
+
+    with pytest.raises(ValueError):
+        anyio.run(lambda: _queue().run(handler, workers=0))
+
+
+@pytest.mark.anyio
+async def test_add_events_queues_object_keys() -> None:
+    def event(event_type: str, name: str) -> str:
+        obj = {
+            "apiVersion": "v1",
+            "kind": "Pod",
+            "metadata": {"name": name, "namespace": "default"},
+        }
+        return json.dumps({"type": event_type, "object": obj})
+
+    bookmark = json.dumps(
+        {"type": "BOOKMARK", "object": {"metadata": {"resourceVersion": "9"}}}
+    )
+    client = StubClient(
+        stream_lines=[
+            event("ADDED", "a"),
+            event("MODIFIED", "a"),
+            event("ADDED", "b"),
+            event("MODIFIED", "a"),
+            bookmark,
+            event("DELETED", "b"),
+        ]
+    )
+    queue = _queue()
+    await queue.add_events(Api(Pod, client=client, namespace="default").watch())
+    assert [await queue.get() for _ in range(len(queue))] == [
+        "default/a",
+        "default/b",
+    ]